@@ -0,0 +1,596 @@
+# -- coding: utf-8 --
+"""
+ch: 模拟相机 | en: Simulated GigE/U3V camera
+
+设置环境变量 MVS_SIM 后，MvCameraControl_class 不再加载SDK动态库，MvCamera 换成本文件中的模拟实现，
+用于在没有海康相机的机器上（例如 CI）运行、压测采集流程。
+
+    MVS_SIM=1                                     使用默认配置
+    MVS_SIM="cameras=3,source=test_data,trigger_hz=5,burst=4,jitter_ms=2,drop=0.01"
+
+配置项（也可在代码中调用 configure() 修改）：
+    cameras     模拟相机个数
+    source      图像来源：目录（读取其中的 bmp/png/jpg）或 pattern（合成图案）
+    width/height/pixel   输出分辨率与像素格式（Mono8/BayerRG8/BayerGB8/BayerGR8/BayerBG8/RGB8/BGR8/YUV422/YUYV）
+    fps         连拍或连续采集时的帧率（相机设置了 AcquisitionFrameRate 时以相机参数为准）
+    trigger_hz  硬件触发频率，所有模拟相机共用同一触发时钟；0 表示只响应软触发
+    burst       每次触发的帧数，0 表示使用相机的 AcquisitionBurstFrameCount
+    jitter_ms   每帧出图时间的随机抖动上限（毫秒）
+    drop        丢帧概率（丢帧时帧号照常递增）
+    seed        随机种子
+
+掉线测试：unplug(dev_idx) 模拟拔掉网线（停止出图、触发异常回调、IsDeviceConnected 返回 False、
+枚举不到且无法打开），plug(dev_idx) 重新接上。
+"""
+import glob
+import os
+import random
+import threading
+import time
+from collections import deque
+from ctypes import *
+
+from CameraParams_const import *
+from CameraParams_header import *
+from MvErrorDefine_const import *
+from PixelType_header import *
+
+SIM_DEFAULTS = {
+    "cameras": 3,
+    "source": "pattern",
+    "width": 1280,
+    "height": 1024,
+    "pixel": "BayerGB8",
+    "fps": 20.0,
+    "trigger_hz": 5.0,
+    "burst": 0,
+    "jitter_ms": 0.0,
+    "drop": 0.0,
+    "seed": 0,
+}
+SIM_CONFIG = dict(SIM_DEFAULTS)
+
+# 像素格式名 -> (像素格式常量, 每像素字节数)
+SIM_PIXEL_FORMATS = {
+    "Mono8": (PixelType_Gvsp_Mono8, 1),
+    "BayerRG8": (PixelType_Gvsp_BayerRG8, 1),
+    "BayerGB8": (PixelType_Gvsp_BayerGB8, 1),
+    "BayerGR8": (PixelType_Gvsp_BayerGR8, 1),
+    "BayerBG8": (PixelType_Gvsp_BayerBG8, 1),
+    "RGB8": (PixelType_Gvsp_RGB8_Packed, 3),
+    "BGR8": (PixelType_Gvsp_BGR8_Packed, 3),
+    "YUV422": (PixelType_Gvsp_YUV422_Packed, 2),
+    "YUYV": (PixelType_Gvsp_YUV422_YUYV_Packed, 2),
+}
+_PIXEL_NAMES = {v[0]: k for k, v in SIM_PIXEL_FORMATS.items()}
+_SOFTWARE_TRIGGER_SOURCE = 7
+
+
+def configure(**kwargs):
+    """修改模拟配置，对之后枚举/开始采集的相机生效"""
+    for key, value in kwargs.items():
+        if key not in SIM_DEFAULTS:
+            raise KeyError(f"未知的模拟配置项: {key}")
+        SIM_CONFIG[key] = type(SIM_DEFAULTS[key])(value)
+    _SIM_DEVICES.clear()
+
+
+def unplug(dev_idx):
+    """模拟相机掉线：停止出图，向已打开该相机的句柄发送 MV_EXCEPTION_DEV_DISCONNECT"""
+    with _PLUG_LOCK:
+        _UNPLUGGED.add(dev_idx)
+        cameras = [cam for cam in _OPENED if cam._dev_idx == dev_idx]
+    for cam in cameras:
+        cam._disconnect()
+
+
+def plug(dev_idx):
+    """重新接上掉线的模拟相机，之后可以重新枚举、打开"""
+    with _PLUG_LOCK:
+        _UNPLUGGED.discard(dev_idx)
+
+
+def _parse_env(value):
+    if value in ("", "0"):
+        return
+    if value in ("1", "true", "True"):
+        return
+    for item in value.split(","):
+        if "=" in item:
+            k, v = item.split("=", 1)
+            configure(**{k.strip(): v.strip()})
+
+
+# 所有模拟相机共享的触发时钟起点
+_TRIGGER_EPOCH = time.monotonic()
+_SIM_DEVICES = []  # MV_CC_DEVICE_INFO 实例需要保持引用
+_UNPLUGGED = set()  # 已掉线的相机序号
+_OPENED = set()  # 已打开的模拟相机，掉线时通知
+_PLUG_LOCK = threading.Lock()
+
+
+def _encode_frame(bgr, pixel_name):
+    """把 BGR 图像编码成相机原始像素格式的字节"""
+    import cv2
+    import numpy as np
+    h, w = bgr.shape[:2]
+    if pixel_name == "BGR8":
+        out = bgr
+    elif pixel_name == "RGB8":
+        out = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+    elif pixel_name == "Mono8":
+        out = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    elif pixel_name.startswith("Bayer"):
+        pattern = pixel_name[5:7]  # RG / GB / GR / BG，对应左上角 2x2 的第一行
+        full = {"RG": "RGGB", "GB": "GBRG", "GR": "GRBG", "BG": "BGGR"}[pattern]
+        channel = {"B": 0, "G": 1, "R": 2}
+        out = np.empty((h, w), dtype=np.uint8)
+        for i, c in enumerate(full):
+            out[i // 2::2, i % 2::2] = bgr[i // 2::2, i % 2::2, channel[c]]
+    else:
+        yuv = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV)
+        out = np.empty((h, w, 2), dtype=np.uint8)
+        u = ((yuv[:, 0::2, 1].astype(np.uint16) + yuv[:, 1::2, 1]) // 2).astype(np.uint8)
+        v = ((yuv[:, 0::2, 2].astype(np.uint16) + yuv[:, 1::2, 2]) // 2).astype(np.uint8)
+        y_idx, c_idx = (1, 0) if pixel_name == "YUV422" else (0, 1)  # UYVY / YUYV
+        out[:, :, y_idx] = yuv[:, :, 0]
+        out[:, 0::2, c_idx] = u
+        out[:, 1::2, c_idx] = v
+    return np.ascontiguousarray(out).tobytes()
+
+
+def _load_frames(source, width, height, pixel_name, cam_idx, max_frames=16):
+    """从目录读取或合成若干帧，预先编码好，采集时只做指针传递"""
+    import cv2
+    import numpy as np
+    images = []
+    if source != "pattern" and os.path.isdir(source):
+        files = sorted(f for ext in ("*.bmp", "*.png", "*.jpg")
+                       for f in glob.glob(os.path.join(source, ext)))
+        for f in files[:max_frames]:
+            img = cv2.imread(f)
+            if img is not None:
+                images.append(cv2.resize(img, (width, height)))
+    if not images:
+        # 合成图案：渐变背景 + 随帧移动的亮条，左上角标出相机与帧序号
+        grad = np.tile(np.linspace(0, 255, width, dtype=np.uint8), (height, 1))
+        for i in range(8):
+            img = cv2.merge([grad, np.roll(grad, i * width // 8, axis=1), np.full_like(grad, 40 * cam_idx)])
+            x = i * width // 8
+            img[:, x:x + width // 16] = 255
+            cv2.putText(img, f"SIM cam{cam_idx} #{i}", (20, 60), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 255), 3)
+            images.append(img)
+    frames = []
+    for img in images:
+        data = _encode_frame(img, pixel_name)
+        frames.append((c_ubyte * len(data)).from_buffer_copy(data))
+    return frames
+
+
+class MvCamera():
+
+    def __init__(self):
+        self._handle = c_void_p()
+        self.handle = pointer(self._handle)
+        self._dev_idx = None
+        self._opened = False
+        self._grabbing = False
+        self._callback = None
+        self._user = None
+        self._exception_callback = None
+        self._exception_user = None
+        self._connected = False
+        self._thread = None
+        self._stop = threading.Event()
+        self._soft_trigger = threading.Event()
+        self._frames = []
+        self._nodes = deque(maxlen=1)
+        self._grab_strategy = MV_GrabStrategy_OneByOne
+        self._output_queue_size = 1
+        self._node_cond = threading.Condition()
+        self._frame_info = MV_FRAME_OUT_INFO_EX()
+        self.frames_emitted = 0
+        self.frames_dropped = 0
+        self._params = {
+            "Width": SIM_CONFIG["width"],
+            "Height": SIM_CONFIG["height"],
+            "PixelFormat": SIM_PIXEL_FORMATS[SIM_CONFIG["pixel"]][0],
+            "ExposureTime": 10000.0,
+            "Gain": 0.0,
+            "AcquisitionFrameRate": SIM_CONFIG["fps"],
+            "AcquisitionFrameRateEnable": False,
+            "AcquisitionBurstFrameCount": 1,
+            "AcquisitionMode": 2,
+            "TriggerMode": MV_TRIGGER_MODE_OFF,
+            "TriggerSource": 0,
+            "TriggerActivation": 0,
+            "DeviceSerialNumber": "",
+            "DeviceModelName": "MV-SIM",
+        }
+
+    '''
+    Part1 ch: 相机的控制和取流接口 | en: Camera control and streaming
+    '''
+
+    @staticmethod
+    def MV_CC_Initialize():
+        return MV_OK
+
+    @staticmethod
+    def MV_CC_Finalize():
+        return MV_OK
+
+    @staticmethod
+    def MV_CC_GetSDKVersion():
+        return 0x04050000
+
+    @staticmethod
+    def MV_CC_EnumDevices(nTLayerType, stDevList):
+        if not _SIM_DEVICES:
+            for i in range(SIM_CONFIG["cameras"]):
+                info = MV_CC_DEVICE_INFO()
+                info.nTLayerType = MV_GIGE_DEVICE
+                gige = info.SpecialInfo.stGigEInfo
+                for field, text in (("chModelName", "MV-SIM"), ("chManufacturerName", "Simulator"),
+                                    ("chSerialNumber", f"SIM{i:05d}")):
+                    raw = text.encode("ascii")
+                    getattr(gige, field)[:len(raw)] = raw
+                gige.nCurrentIp = (192 << 24) | (168 << 16) | (1 << 8) | (100 + i)
+                _SIM_DEVICES.append(info)
+        with _PLUG_LOCK:
+            devices = [info for i, info in enumerate(_SIM_DEVICES) if i not in _UNPLUGGED]
+        devices = devices if nTLayerType & MV_GIGE_DEVICE else []
+        stDevList.nDeviceNum = len(devices)
+        for i, info in enumerate(devices):
+            stDevList.pDeviceInfo[i] = pointer(info)
+        return MV_OK
+
+    @staticmethod
+    def MV_CC_IsDeviceAccessible(stDevInfo, nAccessMode):
+        return True
+
+    def MV_CC_SetSDKLogPath(self, SDKLogPath):
+        return MV_OK
+
+    def MV_CC_CreateHandle(self, stDevInfo):
+        serial = bytes(stDevInfo.SpecialInfo.stGigEInfo.chSerialNumber).rstrip(b"\x00").decode("ascii")
+        if not serial.startswith("SIM"):
+            return MV_E_PARAMETER
+        self._dev_idx = int(serial[3:])
+        self._params["DeviceSerialNumber"] = serial
+        self._handle.value = 0x5100 + self._dev_idx
+        return MV_OK
+
+    def MV_CC_CreateHandleWithoutLog(self, stDevInfo):
+        return self.MV_CC_CreateHandle(stDevInfo)
+
+    def MV_CC_DestroyHandle(self):
+        self._dev_idx = None
+        return MV_OK
+
+    def MV_CC_OpenDevice(self, nAccessMode=MV_ACCESS_Exclusive, nSwitchoverKey=0):
+        if self._dev_idx is None:
+            return MV_E_HANDLE
+        with _PLUG_LOCK:
+            if self._dev_idx in _UNPLUGGED:
+                return MV_E_NETER
+            self._opened = True
+            self._connected = True
+            _OPENED.add(self)
+        return MV_OK
+
+    def MV_CC_CloseDevice(self):
+        if self._grabbing:
+            self.MV_CC_StopGrabbing()
+        with _PLUG_LOCK:
+            _OPENED.discard(self)
+        self._opened = False
+        self._connected = False
+        return MV_OK
+
+    def MV_CC_IsDeviceConnected(self):
+        return self._opened and self._connected
+
+    def MV_CC_RegisterExceptionCallBack(self, ExceptionCallBackFun, pUser):
+        if not self._opened:
+            return MV_E_CALLORDER
+        self._exception_callback = ExceptionCallBackFun
+        self._exception_user = pUser
+        return MV_OK
+
+    def _disconnect(self):
+        """掉线：出图线程退出（句柄仍需调用方关闭），异常回调在独立线程中发出，与SDK一致"""
+        self._connected = False
+        self._stop.set()
+        self._soft_trigger.set()
+        with self._node_cond:
+            self._node_cond.notify_all()
+        callback = self._exception_callback
+        if callback is not None:
+            threading.Thread(target=callback, args=(MV_EXCEPTION_DEV_DISCONNECT, self._exception_user),
+                             name=f"SimException-{self._dev_idx}", daemon=True).start()
+
+    def MV_CC_RegisterImageCallBackEx(self, CallBackFun, pUser):
+        if not self._opened:
+            return MV_E_CALLORDER
+        self._callback = CallBackFun
+        self._user = pUser
+        # 调用方可能以 MvImport.xxx 包路径导入了另一份结构体定义，按回调声明的参数类型转换指针
+        argtypes = getattr(CallBackFun, "_argtypes_", None) or (POINTER(c_ubyte), POINTER(MV_FRAME_OUT_INFO_EX))
+        self._cb_types = argtypes[:2]
+        self._cb_info = cast(pointer(self._frame_info), argtypes[1])
+        return MV_OK
+
+    def MV_CC_SetImageNodeNum(self, nNum):
+        if nNum < 1:
+            return MV_E_PARAMETER
+        with self._node_cond:
+            self._nodes = deque(self._nodes, maxlen=nNum)
+        return MV_OK
+
+    def MV_CC_SetGrabStrategy(self, enGrabStrategy):
+        if enGrabStrategy not in (MV_GrabStrategy_OneByOne, MV_GrabStrategy_LatestImagesOnly,
+                                  MV_GrabStrategy_LatestImages, MV_GrabStrategy_UpcomingImage):
+            return MV_E_PARAMETER
+        self._grab_strategy = enGrabStrategy
+        return MV_OK
+
+    def MV_CC_SetOutputQueueSize(self, nOutputQueueSize):
+        if not 1 <= nOutputQueueSize <= (self._nodes.maxlen or 1):
+            return MV_E_PARAMETER
+        self._output_queue_size = nOutputQueueSize
+        return MV_OK
+
+    def MV_CC_StartGrabbing(self):
+        if not self._opened:
+            return MV_E_CALLORDER
+        if not self._connected:
+            return MV_E_NETER
+        if self._grabbing:
+            return MV_OK
+        name = _PIXEL_NAMES.get(self._params["PixelFormat"])
+        if name is None:
+            return MV_E_SUPPORT
+        self._frames = _load_frames(SIM_CONFIG["source"], self._params["Width"], self._params["Height"],
+                                    name, self._dev_idx)
+        self._stop.clear()
+        self._grabbing = True
+        self._thread = threading.Thread(target=self._run, name=f"SimCamera-{self._dev_idx}", daemon=True)
+        self._thread.start()
+        return MV_OK
+
+    def MV_CC_StopGrabbing(self):
+        if not self._grabbing:
+            return MV_OK
+        self._stop.set()
+        self._soft_trigger.set()
+        self._thread.join()
+        with self._node_cond:
+            self._grabbing = False
+            self._nodes.clear()
+            self._node_cond.notify_all()
+        return MV_OK
+
+    def MV_CC_GetImageBuffer(self, stFrame, nMsec):
+        if self._callback is not None:
+            return MV_E_CALLORDER
+        if not self._grabbing:
+            return MV_E_CALLORDER
+        with self._node_cond:
+            strategy = self._grab_strategy
+            if strategy == MV_GrabStrategy_UpcomingImage:
+                self._nodes.clear()
+            if not self._node_cond.wait_for(lambda: self._nodes or not self._grabbing or not self._connected,
+                                            timeout=nMsec / 1000.0):
+                return MV_E_NODATA
+            if not self._connected:
+                return MV_E_NETER
+            if not self._nodes:
+                return MV_E_CALLORDER  # 取流已停止
+            if strategy == MV_GrabStrategy_LatestImagesOnly:
+                buf, info = self._nodes.pop()
+                self._nodes.clear()
+            else:
+                if strategy == MV_GrabStrategy_LatestImages:
+                    while len(self._nodes) > self._output_queue_size:
+                        self._nodes.popleft()
+                buf, info = self._nodes.popleft()
+        stFrame.pBufAddr = cast(buf, POINTER(c_ubyte))
+        memmove(addressof(stFrame) + type(stFrame).stFrameInfo.offset, addressof(info), sizeof(info))
+        return MV_OK
+
+    def MV_CC_FreeImageBuffer(self, stFrame):
+        stFrame.pBufAddr = None
+        return MV_OK
+
+    def MV_CC_GetOneFrameTimeout(self, pData, nDataSize, stFrameInfo, nMsec=1000):
+        stFrame = MV_FRAME_OUT()
+        ret = self.MV_CC_GetImageBuffer(stFrame, nMsec)
+        if ret != MV_OK:
+            return ret
+        if stFrame.stFrameInfo.nFrameLen > nDataSize:
+            return MV_E_NOENOUGH_BUF
+        memmove(pData, stFrame.pBufAddr, stFrame.stFrameInfo.nFrameLen)
+        memmove(addressof(stFrameInfo), addressof(stFrame.stFrameInfo), sizeof(stFrameInfo))
+        return MV_OK
+
+    def MV_CC_ClearImageBuffer(self):
+        with self._node_cond:
+            self._nodes.clear()
+        return MV_OK
+
+    '''
+    Part2 ch: 相机属性万能配置接口 | en: Camera attribute nodes universal interface
+    '''
+
+    def _payload_size(self):
+        bpp = SIM_PIXEL_FORMATS.get(_PIXEL_NAMES.get(self._params["PixelFormat"]), (0, 1))[1]
+        return self._params["Width"] * self._params["Height"] * bpp
+
+    def _get(self, strKey):
+        if strKey == "PayloadSize":
+            return self._payload_size()
+        return self._params.get(strKey)
+
+    def _set(self, strKey, value):
+        if not self._opened:
+            return MV_E_CALLORDER
+        if not self._connected:
+            return MV_E_NETER
+        if self._grabbing and strKey in ("Width", "Height", "PixelFormat"):
+            return MV_E_GC_ACCESS
+        self._params[strKey] = value
+        return MV_OK
+
+    def MV_CC_GetIntValueEx(self, strKey, stIntValue):
+        value = self._get(strKey)
+        if value is None:
+            return MV_E_GC_PROPERTY
+        stIntValue.nCurValue = int(value)
+        return MV_OK
+
+    def MV_CC_GetIntValue(self, strKey, stIntValue):
+        return self.MV_CC_GetIntValueEx(strKey, stIntValue)
+
+    def MV_CC_SetIntValueEx(self, strKey, nValue):
+        return self._set(strKey, int(nValue))
+
+    def MV_CC_SetIntValue(self, strKey, nValue):
+        return self._set(strKey, int(nValue))
+
+    def MV_CC_GetEnumValue(self, strKey, stEnumValue):
+        value = self._get(strKey)
+        if value is None:
+            return MV_E_GC_PROPERTY
+        stEnumValue.nCurValue = int(value)
+        return MV_OK
+
+    def MV_CC_SetEnumValue(self, strKey, nValue):
+        return self._set(strKey, int(nValue))
+
+    def MV_CC_SetEnumValueByString(self, strKey, sValue):
+        if strKey == "PixelFormat":
+            if sValue not in SIM_PIXEL_FORMATS:
+                return MV_E_GC_RANGE
+            return self._set(strKey, SIM_PIXEL_FORMATS[sValue][0])
+        return self._set(strKey, sValue)
+
+    def MV_CC_GetFloatValue(self, strKey, stFloatValue):
+        value = self._get(strKey)
+        if value is None:
+            return MV_E_GC_PROPERTY
+        stFloatValue.fCurValue = float(value)
+        return MV_OK
+
+    def MV_CC_SetFloatValue(self, strKey, fValue):
+        return self._set(strKey, float(fValue))
+
+    def MV_CC_GetBoolValue(self, strKey, BoolValue):
+        value = self._get(strKey)
+        if value is None:
+            return MV_E_GC_PROPERTY
+        BoolValue.value = bool(value)
+        return MV_OK
+
+    def MV_CC_SetBoolValue(self, strKey, bValue):
+        return self._set(strKey, bool(bValue))
+
+    def MV_CC_GetStringValue(self, strKey, StringValue):
+        value = self._get(strKey)
+        if value is None:
+            return MV_E_GC_PROPERTY
+        StringValue.chCurValue = str(value).encode("ascii")
+        return MV_OK
+
+    def MV_CC_SetStringValue(self, strKey, sValue):
+        return self._set(strKey, str(sValue))
+
+    def MV_CC_SetCommandValue(self, strKey):
+        if strKey == "TriggerSoftware":
+            self._soft_trigger.set()
+            return MV_OK
+        return MV_E_GC_PROPERTY
+
+    def __getattr__(self, name):
+        # 模拟器未实现的SDK接口一律返回"不支持"，保证脚本不会因缺少方法而崩溃
+        if name.startswith("MV_"):
+            return lambda *args, **kwargs: MV_E_SUPPORT
+        raise AttributeError(name)
+
+    '''
+    ch: 模拟出图线程 | en: Frame producer
+    '''
+
+    def _frame_interval(self):
+        if self._params["AcquisitionFrameRateEnable"] and self._params["AcquisitionFrameRate"] > 0:
+            return 1.0 / self._params["AcquisitionFrameRate"]
+        return 1.0 / SIM_CONFIG["fps"]
+
+    def _wait_until(self, t):
+        delay = t - time.monotonic()
+        if delay > 0:
+            self._stop.wait(delay)
+        return not self._stop.is_set()
+
+    def _run(self):
+        rng = random.Random(SIM_CONFIG["seed"] * 1000 + self._dev_idx)
+        jitter = SIM_CONFIG["jitter_ms"] / 1000.0
+        frame_num = 0
+        trigger_index = 0
+        next_t = time.monotonic()
+        while not self._stop.is_set():
+            triggered = self._params["TriggerMode"] == MV_TRIGGER_MODE_ON
+            if triggered:
+                if self._params["TriggerSource"] == _SOFTWARE_TRIGGER_SOURCE or SIM_CONFIG["trigger_hz"] <= 0:
+                    self._soft_trigger.wait()
+                    self._soft_trigger.clear()
+                    if self._stop.is_set():
+                        break
+                    start = time.monotonic()
+                else:
+                    # 所有模拟相机对齐到同一个触发时钟，相当于共用一路硬件触发线
+                    period = 1.0 / SIM_CONFIG["trigger_hz"]
+                    k = int((time.monotonic() - _TRIGGER_EPOCH) / period) + 1
+                    start = _TRIGGER_EPOCH + k * period
+                burst = SIM_CONFIG["burst"] or self._params["AcquisitionBurstFrameCount"]
+                times = [start + i * self._frame_interval() for i in range(max(1, burst))]
+                trigger_index += 1
+            else:
+                next_t += self._frame_interval()
+                times = [next_t]
+            for t in times:
+                t += rng.uniform(0, jitter)
+                if not self._wait_until(t):
+                    break
+                frame_num += 1
+                if rng.random() < SIM_CONFIG["drop"]:
+                    self.frames_dropped += 1
+                    continue
+                self._emit(frame_num, trigger_index, t)
+
+    def _emit(self, frame_num, trigger_index, t):
+        buf = self._frames[(frame_num - 1) % len(self._frames)]
+        info = self._frame_info
+        info.nWidth = self._params["Width"]
+        info.nHeight = self._params["Height"]
+        info.enPixelType = self._params["PixelFormat"]
+        info.nFrameNum = frame_num
+        ticks = int((t - _TRIGGER_EPOCH) * 1e9)  # 设备时间戳，单位 ns
+        info.nDevTimeStampHigh = (ticks >> 32) & 0xFFFFFFFF
+        info.nDevTimeStampLow = ticks & 0xFFFFFFFF
+        info.nHostTimeStamp = int(time.time() * 1000)
+        info.nFrameLen = len(buf)
+        info.nTriggerIndex = trigger_index
+        info.nFrameCounter = frame_num
+        self.frames_emitted += 1
+        if self._callback is not None:
+            self._callback(cast(buf, self._cb_types[0]), self._cb_info, self._user)
+        else:
+            copy = MV_FRAME_OUT_INFO_EX()
+            pointer(copy)[0] = info
+            with self._node_cond:
+                self._nodes.append((buf, copy))  # 节点满时自动丢弃最旧的一帧
+                self._node_cond.notify_all()
+
+
+_parse_env(os.environ.get("MVS_SIM", ""))
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+推理微批调度
+
+检测器按批推理的吞吐远高于逐张调用。调度器收集各相机（或同一次触发的连拍帧）提交的图像，
+凑满 max_batch 张或最早一张等待超过 max_wait_ms 后调用一次 predict(images) -> [框数组, ...]，
+再把结果分发回每张图像各自的 Future。
+predict 可以是进程内的检测器（如 SimDetector().predict），也可以是 InferenceService.predict。
+"""
+import threading
+import time
+from collections import deque, Counter
+from concurrent.futures import Future
+
+import numpy as np
+
+
+class BatchScheduler:
+    def __init__(self, predict, max_batch=8, max_wait_ms=10.0, num_threads=1, metrics_window=500):
+        """
+        :param predict:         predict(images) -> 与 images 一一对应的结果列表
+        :param max_batch:       单批最大图像数
+        :param max_wait_ms:     批中最早一张的最长等待时间，超时后不满也立即推理
+        :param num_threads:     同时在途的批数（predict 为推理服务时可设为工作进程数）
+        :param metrics_window:  统计指标的最近样本数
+        """
+        self.predict = predict
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = deque()  # (图像, Future, 入队时间)
+        self._cond = threading.Condition()
+        self._running = True
+        self._flush = False
+
+        self.batches = 0
+        self.images = 0
+        self.errors = 0
+        self._sizes = deque(maxlen=metrics_window)
+        self._delays = deque(maxlen=metrics_window)  # 入队到开始推理的等待时间
+        self._predict_times = deque(maxlen=metrics_window)
+
+        self._threads = []
+        for i in range(num_threads):
+            t = threading.Thread(target=self._run, name=f"BatchScheduler-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, image):
+        """提交一张图像，返回 Future，结果为该图像的框数组"""
+        return self.submit_many([image])[0]
+
+    def submit_many(self, images):
+        """
+        一次提交多张图像（如一个同步组的各相机帧、一次触发的连拍帧），保证它们连续入队，
+        队列中已凑满一批时立即唤醒调度线程
+        """
+        futures = [Future() for _ in images]
+        now = time.perf_counter()
+        with self._cond:
+            if not self._running:
+                raise RuntimeError("批调度器已关闭")
+            self._queue.extend((image, f, now) for image, f in zip(images, futures))
+            self._cond.notify_all()
+        return futures
+
+    def flush(self):
+        """不再等待，立即推理队列中已有的图像（例如触发组已全部提交）"""
+        with self._cond:
+            self._flush = True
+            self._cond.notify_all()
+
+    def _next_batch(self):
+        """取出下一批：队列满一批、最早一张超时、flush 或关闭时返回"""
+        with self._cond:
+            while True:
+                if self._queue:
+                    deadline = self._queue[0][2] + self.max_wait
+                    remaining = deadline - time.perf_counter()
+                    if len(self._queue) >= self.max_batch or remaining <= 0 or self._flush or not self._running:
+                        batch = [self._queue.popleft() for _ in range(min(self.max_batch, len(self._queue)))]
+                        if not self._queue:
+                            self._flush = False
+                        return batch
+                    self._cond.wait(remaining)
+                elif not self._running:
+                    return None
+                else:
+                    self._flush = False
+                    self._cond.wait()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            start = time.perf_counter()
+            images = [item[0] for item in batch]
+            try:
+                results = self.predict(images)
+                if len(results) != len(batch):
+                    raise RuntimeError(f"predict 返回 {len(results)} 个结果，应为 {len(batch)}")
+            except Exception as e:
+                results = None
+                error = e
+            elapsed = time.perf_counter() - start
+
+            with self._cond:
+                self.batches += 1
+                self.images += len(batch)
+                self._sizes.append(len(batch))
+                self._predict_times.append(elapsed)
+                self._delays.extend(start - item[2] for item in batch)
+                if results is None:
+                    self.errors += 1
+            for i, (_, future, _) in enumerate(batch):
+                if results is None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(results[i])
+
+    def stats(self):
+        """批大小、填充率、排队等待与推理耗时"""
+        with self._cond:
+            sizes = np.array(self._sizes) if self._sizes else np.zeros(1)
+            delays = np.array(self._delays) * 1000 if self._delays else np.zeros(1)
+            predict_ms = np.array(self._predict_times) * 1000 if self._predict_times else np.zeros(1)
+            histogram = dict(sorted(Counter(self._sizes).items()))
+            return {
+                "batches": self.batches,
+                "images": self.images,
+                "errors": self.errors,
+                "queue_depth": len(self._queue),
+                "batch_size_mean": float(sizes.mean()),
+                "batch_size_histogram": histogram,
+                "fill_ratio": float(sizes.mean() / self.max_batch),
+                "queue_delay_ms_p50": float(np.percentile(delays, 50)),
+                "queue_delay_ms_p99": float(np.percentile(delays, 99)),
+                "predict_ms_mean": float(predict_ms.mean()),
+            }
+
+    def close(self, wait=True):
+        """停止调度，wait=True 时先把队列中的图像推理完"""
+        with self._cond:
+            if not wait:
+                for _, future, _ in self._queue:
+                    future.cancel()
+                self._queue.clear()
+            self._running = False
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join()
+
+
+if __name__ == "__main__":
+    # 对比不同批大小：模拟检测器每次调用固定 20ms，每张另加 2ms；3 相机 x 4 连拍 共12张一组
+    from infer_service import SimDetector
+
+    detector = SimDetector(latency_ms=2, call_overhead_ms=20)
+    frame = np.zeros((1024, 1280, 3), dtype=np.uint8)
+    for max_batch in (1, 4, 12):
+        scheduler = BatchScheduler(detector.predict, max_batch=max_batch, max_wait_ms=10)
+        start = time.perf_counter()
+        futures = []
+        for _ in range(10):
+            futures += scheduler.submit_many([frame] * 12)
+            scheduler.flush()
+        for f in futures:
+            f.result()
+        elapsed = time.perf_counter() - start
+        s = scheduler.stats()
+        scheduler.close()
+        print(f"max_batch {max_batch:2d}: {len(futures) / elapsed:.1f} 张/秒, 平均批 {s['batch_size_mean']:.1f}, "
+              f"填充率 {s['fill_ratio']:.2f}, 排队 p50 {s['queue_delay_ms_p50']:.1f} ms / p99 {s['queue_delay_ms_p99']:.1f} ms")
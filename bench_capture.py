@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+采集链路端到端压测
+
+用模拟相机（MVS_SIM）驱动 qt_multicam_shoot.CameraController，覆盖 回调 -> 像素转换 -> Qt信号 -> 写盘 整条链路，
+按相机数 x 触发频率逐级加压，统计每一档的持续帧率、回调耗时 p50/p99、丢帧、每帧CPU时间与内存增长，
+结果写成 JSON，便于不同提交之间对比：
+
+    python bench_capture.py [输出文件.json]
+"""
+import datetime
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("MVS_SIM", "1")
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append("./MvImport")
+
+import numpy as np
+from PyQt5.QtCore import QCoreApplication
+
+import MvCameraSim_class
+import qt_multicam_shoot
+from camera_profile import DEFAULT_PROFILES
+from frame_aggregator import FrameAggregator
+from frame_writer import FrameWriter
+from qt_multicam_shoot import CameraController, deliver_group, MvCamera, MV_CC_DEVICE_INFO_LIST, MV_CC_DEVICE_INFO, \
+    MV_GIGE_DEVICE, cast, POINTER
+
+CAMERA_COUNTS = [1, 2, 3]
+TRIGGER_RATES = [5, 10, 20, 40, 80]  # 每台相机每秒帧数（每次触发1帧）
+GRAB_MODES = ["callback", "pull"]  # 分别测试SDK回调与主动取流
+DURATION = 5.0  # 每一档持续秒数
+WARMUP = 1.0  # 预热秒数，不计入统计
+SIM_OPTIONS = dict(width=1280, height=1024, pixel="BayerGB8", source="pattern", jitter_ms=0.5)
+DROP_THRESHOLD = 0.99  # 实际帧数低于期望的 99% 视为开始丢帧
+
+
+class BenchController(CameraController):
+    """在帧处理外记录耗时（回调与主动取流两种方式共用 process_frame）"""
+
+    def __init__(self, *args, **kwargs):
+        self.latencies = []
+        self.measuring = False
+        super().__init__(*args, **kwargs)
+
+    def process_frame(self, frame_info, image_data):
+        t0 = time.perf_counter()
+        super().process_frame(frame_info, image_data)
+        if self.measuring:
+            self.latencies.append(time.perf_counter() - t0)
+
+
+def rss_bytes():
+    """当前进程常驻内存"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def open_controllers(num_cameras, writer, aggregator, grab_mode):
+    device_list = MV_CC_DEVICE_INFO_LIST()
+    MvCamera.MV_CC_Initialize()
+    if MvCamera.MV_CC_EnumDevices(MV_GIGE_DEVICE, device_list) != 0:
+        raise RuntimeError("未找到相机设备")
+    controllers = []
+    for i in range(min(num_cameras, device_list.nDeviceNum)):
+        dev_info = cast(device_list.pDeviceInfo[i], POINTER(MV_CC_DEVICE_INFO)).contents
+        c = BenchController(i, dev_info, writer, aggregator, grab_mode=grab_mode)
+        c.signals.update_image.connect(lambda cam_idx, pos, slot: slot.release())  # 代替界面显示
+        controllers.append(c)
+        c.open()
+        c.setup(DEFAULT_PROFILES)  # 不读本地 camera_profiles.json，各次压测的相机配置一致
+    return controllers
+
+
+def pump(app, aggregator, seconds):
+    """运行Qt事件循环一段时间，让信号槽正常消费"""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        app.processEvents()
+        aggregator.poll()
+        time.sleep(0.002)
+
+
+def run_step(app, grab_mode, num_cameras, rate):
+    """跑一档负载，返回该档的统计结果"""
+    MvCameraSim_class.configure(cameras=num_cameras, trigger_hz=rate, burst=1, **SIM_OPTIONS)
+    save_dir = tempfile.mkdtemp(prefix="bench_capture_")
+    qt_multicam_shoot.SAVE_PATH = save_dir
+    writer = FrameWriter(max_queue=qt_multicam_shoot.WRITER_QUEUE_SIZE, num_workers=qt_multicam_shoot.WRITER_WORKERS,
+                         policy=qt_multicam_shoot.WRITER_POLICY, block_timeout=qt_multicam_shoot.WRITER_BLOCK_TIMEOUT,
+                         codec=qt_multicam_shoot.SAVE_CODEC, codec_level=qt_multicam_shoot.SAVE_CODEC_LEVEL)
+    controllers = []
+    aggregator = FrameAggregator(num_cameras, lambda group: deliver_group(controllers, group),
+                                 skew_ms=qt_multicam_shoot.GROUP_SKEW_MS, timeout_ms=qt_multicam_shoot.GROUP_TIMEOUT_MS)
+    controllers.extend(open_controllers(num_cameras, writer, aggregator, grab_mode))
+    try:
+        for c in controllers:
+            c.start_grabbing()
+        pump(app, aggregator, WARMUP)
+
+        for c in controllers:
+            c.measuring = True
+        emitted0 = sum(c.cam.frames_emitted for c in controllers)
+        exhausted0 = sum(c.pool.exhausted for c in controllers)
+        written0 = writer.stats()["frames_written"]
+        dropped0 = writer.stats()["dropped"]
+        groups0 = aggregator.stats()
+        rss0, cpu0, t0 = rss_bytes(), cpu_seconds(), time.monotonic()
+
+        pump(app, aggregator, DURATION)
+
+        elapsed = time.monotonic() - t0
+        for c in controllers:
+            c.measuring = False
+        cpu = cpu_seconds() - cpu0
+        rss1 = rss_bytes()
+        stats = writer.stats()
+        groups = aggregator.stats()
+        emitted = sum(c.cam.frames_emitted for c in controllers) - emitted0
+        written = stats["frames_written"] - written0
+        latencies = np.array([x for c in controllers for x in c.latencies]) * 1000
+    finally:
+        for c in controllers:
+            c.release()
+        aggregator.flush()
+        writer.close()
+        MvCamera.MV_CC_Finalize()
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+    expected = num_cameras * rate * elapsed
+    return {
+        "grab_mode": grab_mode,
+        "cameras": num_cameras,
+        "rate_per_camera": rate,
+        "duration": round(elapsed, 3),
+        "frames_expected": int(expected),
+        "frames_emitted": emitted,
+        "frames_processed": int(latencies.size),
+        "frames_written": written,
+        "fps_written": round(written / elapsed, 2),
+        "callback_ms_p50": round(float(np.percentile(latencies, 50)), 3) if latencies.size else None,
+        "callback_ms_p99": round(float(np.percentile(latencies, 99)), 3) if latencies.size else None,
+        "pool_exhausted": sum(c.pool.exhausted for c in controllers) - exhausted0,
+        "writer_dropped": stats["dropped"] - dropped0,
+        "writer_max_queue_depth": stats["max_queue_depth"],
+        "groups_complete": groups["groups_complete"] - groups0["groups_complete"],
+        "groups_incomplete": groups["groups_incomplete"] - groups0["groups_incomplete"],
+        "frames_late": groups["frames_late"] - groups0["frames_late"],
+        "cpu_ms_per_frame": round(cpu * 1000 / max(emitted, 1), 3),
+        "rss_growth_mb": round((rss1 - rss0) / 1024 / 1024, 2),
+        # 写盘滞后于处理，按处理帧数与各环节丢帧判断是否跟得上
+        "sustained": bool(latencies.size >= expected * DROP_THRESHOLD and stats["dropped"] == dropped0
+                          and sum(c.pool.exhausted for c in controllers) == exhausted0),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    app = QCoreApplication(sys.argv)
+    commit = git_commit()
+    output = sys.argv[1] if len(sys.argv) > 1 else f"bench_capture_{commit or 'local'}.json"
+
+    results = []
+    drop_point = {mode: {} for mode in GRAB_MODES}
+    for grab_mode in GRAB_MODES:
+        for num_cameras in CAMERA_COUNTS:
+            for rate in TRIGGER_RATES:
+                r = run_step(app, grab_mode, num_cameras, rate)
+                results.append(r)
+                print(f"[{grab_mode}] {num_cameras} 相机 x {rate} fps: 写盘 {r['fps_written']} fps, "
+                      f"回调 p50 {r['callback_ms_p50']} ms / p99 {r['callback_ms_p99']} ms, "
+                      f"CPU {r['cpu_ms_per_frame']} ms/帧, 内存 +{r['rss_growth_mb']} MB")
+                if not r["sustained"]:
+                    drop_point[grab_mode][num_cameras] = rate  # 该相机数下开始丢帧的频率，更高档不再测试
+                    break
+
+    report = {
+        "commit": commit,
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "config": {"grab_modes": GRAB_MODES, "camera_counts": CAMERA_COUNTS, "trigger_rates": TRIGGER_RATES,
+                   "duration": DURATION, "warmup": WARMUP, "sim": SIM_OPTIONS,
+                   "codec": qt_multicam_shoot.SAVE_CODEC, "codec_level": qt_multicam_shoot.SAVE_CODEC_LEVEL},
+        "results": results,
+        "drop_point": drop_point,  # 未出现丢帧的相机数不在其中
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"结果已保存: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+存储编码对比
+
+对同一组图像分别用各无损编码编码，统计单帧编码耗时、多线程吞吐、压缩后大小，并校验解码结果与原图一致，
+用于在 CPU 开销与磁盘占用之间选择 SAVE_CODEC：
+
+    python bench_codecs.py [图像目录] [输出文件.json]
+
+默认使用 test_data 中的 BMP；目录中没有图像时用模拟相机的测试图案。
+"""
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+import cv2
+import numpy as np
+
+from frame_writer import CODECS, CODEC_PNG, codec_available, encode_image
+
+# 待测编码及级别：(编码, 级别)
+CANDIDATES = [("bmp", None), (CODEC_PNG, 0), (CODEC_PNG, 1), (CODEC_PNG, 3), (CODEC_PNG, 6), (CODEC_PNG, 9),
+              ("webp", None), ("tiff_lzw", None), ("tiff_deflate", None), ("tiff_zstd", None)]
+WORKERS = 2  # 与写盘线程数一致
+REPEAT = 3
+FRAME_RATE = 12  # 每秒需要写盘的帧数（3相机 x 4连拍 x 1次触发/秒），用于估算所需的编码线程
+
+
+def load_frames(directory):
+    frames = []
+    if os.path.isdir(directory):
+        for name in sorted(os.listdir(directory)):
+            if name.lower().endswith((".bmp", ".png", ".tiff", ".tif")):
+                img = cv2.imread(os.path.join(directory, name), cv2.IMREAD_COLOR)
+                if img is not None:
+                    frames.append(img)
+    if not frames:
+        sys.path.append("./MvImport")
+        from MvCameraSim_class import _load_frames  # 模拟相机的测试图案
+
+        frames = [np.frombuffer(data, dtype=np.uint8).reshape(1024, 1280, 3).copy()
+                  for data in _load_frames("pattern", 1280, 1024, "BGR8", 0)[:4]]
+    return frames
+
+
+def bench_codec(codec, level, frames):
+    """返回该编码的统计结果，当前 OpenCV 不支持时返回 None"""
+    if not codec_available(codec):
+        return None
+    ext = CODECS[codec][0]
+    raw = sum(frame.nbytes for frame in frames)
+
+    # 单线程编码耗时，同时校验无损
+    encoded = 0
+    lossless = True
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for frame in frames:
+            buf = encode_image(frame, codec, level)
+            encoded += buf.nbytes
+    encode_s = (time.perf_counter() - start) / (REPEAT * len(frames))
+    for frame in frames:
+        decoded = cv2.imdecode(encode_image(frame, codec, level), cv2.IMREAD_COLOR)
+        lossless = lossless and decoded is not None and np.array_equal(decoded, frame)
+    encoded /= REPEAT
+    saved_mb = (raw - encoded) / len(frames) / 1024 / 1024
+
+    # 写盘线程数下的吞吐（cv2 编码时释放 GIL）
+    jobs = frames * REPEAT
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda frame: encode_image(frame, codec, level), jobs))
+        throughput = len(jobs) / (time.perf_counter() - start)
+
+    return {
+        "codec": codec,
+        "level": level,
+        "ext": ext,
+        "encode_ms": round(encode_s * 1000, 2),
+        "throughput_fps": round(throughput, 1),
+        "ratio": round(encoded / raw, 3),
+        "mb_per_frame": round(encoded / len(frames) / 1024 / 1024, 3),
+        "mb_saved_per_frame": round(saved_mb, 3),
+        "ms_per_mb_saved": round(encode_s * 1000 / saved_mb, 2) if saved_mb > 0.01 else None,  # 每节省1MB的编码耗时
+        "threads_for_rate": int(np.ceil(FRAME_RATE * encode_s)),
+        "lossless": lossless,
+    }
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else "test_data"
+    output = sys.argv[2] if len(sys.argv) > 2 else None
+    frames = load_frames(directory)
+    h, w = frames[0].shape[:2]
+    print(f"{len(frames)} 帧 {w}x{h}，写盘线程 {WORKERS}，目标 {FRAME_RATE} 帧/秒")
+    print(f"{'编码':<14}{'耗时ms':>8}{'吞吐fps':>9}{'大小比':>8}{'MB/帧':>8}{'节省MB':>8}{'ms/节省MB':>11}{'所需线程':>9}  无损")
+    results = []
+    for codec, level in CANDIDATES:
+        r = bench_codec(codec, level, frames)
+        name = codec if level is None else f"{codec}-{level}"
+        if r is None:
+            print(f"{name:<14}当前 OpenCV 不支持")
+            continue
+        results.append(r)
+        print(f"{name:<14}{r['encode_ms']:>8}{r['throughput_fps']:>9}{r['ratio']:>8}{r['mb_per_frame']:>8}"
+              f"{r['mb_saved_per_frame']:>8}{r['ms_per_mb_saved'] or '-':>11}{r['threads_for_rate']:>9}  {r['lossless']}")
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"frames": len(frames), "width": w, "height": h, "workers": WORKERS, "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"结果已保存: {output}")
+
+
+if __name__ == "__main__":
+    main()
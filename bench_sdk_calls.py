@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+SDK 接口调用开销对比
+
+对每帧都会调用的接口（取图、释放、属性读写）分别测量：
+    - 原写法：每次调用前设置 argtype/restype，参数用 c_uint/c_float 等包装后调用
+    - 现写法：MvCamera 的方法（加载SDK时一次性声明原型，热点接口按句柄绑定）
+
+相机句柄为空，SDK 直接返回 MV_E_HANDLE，测得的是 Python/ctypes 一侧的单次调用开销：
+
+    python bench_sdk_calls.py [SDK动态库路径]
+"""
+import os
+import sys
+import timeit
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append("./MvImport")
+os.environ.pop("MVS_SIM", None)  # 对比的是真实SDK的调用路径
+
+from ctypes import *
+
+import MvCameraControl_class
+from MvCameraControl_class import MV_FRAME_OUT, MVCC_INTVALUE_EX, MvCamera
+
+NUMBER = 200000
+REPEAT = 5
+
+
+def legacy_calls(dll, handle, frame, int_value):
+    """原写法：每次调用都重新设置 argtype/restype 并包装参数"""
+    def get_image_buffer():
+        dll.MV_CC_GetImageBuffer.argtype = (c_void_p, c_void_p, c_uint)
+        dll.MV_CC_GetImageBuffer.restype = c_uint
+        return dll.MV_CC_GetImageBuffer(handle, byref(frame), c_uint(1000))
+
+    def free_image_buffer():
+        dll.MV_CC_FreeImageBuffer.argtype = (c_void_p, c_void_p)
+        dll.MV_CC_FreeImageBuffer.restype = c_uint
+        return dll.MV_CC_FreeImageBuffer(handle, byref(frame))
+
+    def get_int_value_ex():
+        dll.MV_CC_GetIntValueEx.argtype = (c_void_p, c_void_p, c_void_p)
+        dll.MV_CC_GetIntValueEx.restype = c_uint
+        return dll.MV_CC_GetIntValueEx(handle, "Width".encode('ascii'), byref(int_value))
+
+    def set_float_value():
+        dll.MV_CC_SetFloatValue.argtype = (c_void_p, c_void_p, c_float)
+        dll.MV_CC_SetFloatValue.restype = c_uint
+        return dll.MV_CC_SetFloatValue(handle, "ExposureTime".encode('ascii'), c_float(1000.0))
+
+    def set_command_value():
+        dll.MV_CC_SetCommandValue.argtype = (c_void_p, c_void_p)
+        dll.MV_CC_SetCommandValue.restype = c_uint
+        return dll.MV_CC_SetCommandValue(handle, "TriggerSoftware".encode('ascii'))
+
+    return [get_image_buffer, free_image_buffer, get_int_value_ex, set_float_value, set_command_value]
+
+
+def current_calls(cam, frame, int_value):
+    return [
+        lambda: cam.MV_CC_GetImageBuffer(frame, 1000),
+        lambda: cam.MV_CC_FreeImageBuffer(frame),
+        lambda: cam.MV_CC_GetIntValueEx("Width", int_value),
+        lambda: cam.MV_CC_SetFloatValue("ExposureTime", 1000.0),
+        lambda: cam.MV_CC_SetCommandValue("TriggerSoftware"),
+    ]
+
+
+def per_call_ns(func):
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+
+def main():
+    if len(sys.argv) > 1:
+        MvCameraControl_class.MvCamCtrldll._path = sys.argv[1]
+    library = MvCameraControl_class.MvCamCtrldll._path
+    try:
+        MvCamera.MV_CC_Initialize()
+    except OSError as e:
+        print(e)
+        print("用法: python bench_sdk_calls.py [SDK动态库路径]")
+        sys.exit(1)
+
+    cam = MvCamera()
+    frame = MV_FRAME_OUT()
+    int_value = MVCC_INTVALUE_EX()
+    legacy = legacy_calls(CDLL(library), cam.handle, frame, int_value)  # 独立的函数对象，不受已声明原型的影响
+    current = current_calls(cam, frame, int_value)
+    names = ["GetImageBuffer", "FreeImageBuffer", "GetIntValueEx", "SetFloatValue", "SetCommandValue"]
+
+    print(f"SDK: {library}")
+    print(f"{'接口':<18}{'原写法 ns':>12}{'现写法 ns':>12}{'加速':>8}")
+    for name, before, after in zip(names, legacy, current):
+        t_before = per_call_ns(before)
+        t_after = per_call_ns(after)
+        print(f"{name:<18}{t_before:>12.0f}{t_after:>12.0f}{t_before / t_after:>7.2f}x")
+    MvCamera.MV_CC_Finalize()
+
+
+if __name__ == "__main__":
+    main()
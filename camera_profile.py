@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+相机参数配置
+
+原来 CameraController 在四个 _setup_* 方法里写死曝光、增益、帧率、连拍帧数和触发参数，每项一次 GenICam 往返，
+第一项失败就抛异常，多台 GigE 相机只能一台接一台地配置。这里改为：
+    - 参数写在 JSON / YAML 配置文件中，"default" 适用于所有相机，按序列号的条目覆盖其中的值
+    - 条目中指定 feature_file（MVS 客户端或 MV_CC_FeatureSave 导出的 .mfs 文件）时，先用 MV_CC_FeatureLoad
+      一次导入整套参数，再写入该条目中单独列出的参数；导入失败时退回逐项写入 default 与条目中的参数
+    - 写入后逐项读回与配置比较，写入失败和读回不一致的参数全部列出，不在第一项失败时中止
+    - 多台相机在线程池中并发配置（SDK 调用期间释放 GIL，各相机的网络往返互相重叠），记录每台相机各阶段耗时
+
+    {
+        "default":   {"ExposureTime": 20000.0, "Gain": 5.0, "TriggerMode": 1, ...},
+        "DA1234567": {"feature_file": "profiles/DA1234567.mfs", "ExposureTime": 15000.0}
+    }
+
+参数按文件中的顺序写入（例如 AcquisitionFrameRateEnable 要写在 AcquisitionFrameRate 之前）；
+枚举参数可写数值或符号名（如 "On"）。
+
+    python camera_profile.py [配置文件]     按配置文件配置所有相机，打印读回差异和耗时
+    python camera_profile.py save <目录>    把每台相机的当前参数导出为 <目录>/<序列号>.mfs
+"""
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import c_bool, c_int
+
+sys.path.append("./MvImport")
+from CameraParams_header import (MVCC_ENUMENTRY, MVCC_ENUMVALUE, MVCC_FLOATVALUE, MVCC_INTVALUE_EX,
+                                 MVCC_STRINGVALUE, IFT_IBoolean, IFT_IEnumeration, IFT_IFloat, IFT_IInteger,
+                                 IFT_IString)
+
+PROFILE_FILE = "./camera_profiles.json"
+DEFAULT_KEY = "default"
+FEATURE_FILE_KEY = "feature_file"
+FLOAT_TOLERANCE = 1e-3  # 浮点参数读回的相对误差（相机按步长取整）
+
+# 没有配置文件时使用的参数，与原来 CameraController 中写死的值一致
+DEFAULT_PROFILES = {
+    DEFAULT_KEY: {
+        "ExposureTime": 20000.0,
+        "Gain": 5.0,
+        "AcquisitionFrameRateEnable": True,
+        "AcquisitionFrameRate": 5.0,
+        "AcquisitionBurstFrameCount": 4,
+        "TriggerMode": 1,  # MV_TRIGGER_MODE_ON
+        "TriggerSource": 0,  # Line0
+        "TriggerActivation": 0,  # 上升沿
+        "AcquisitionMode": 2,  # 0: SingleFrame 1: MultiFrame 2: Continuous
+    },
+}
+
+# 已知参数的节点类型；其余参数先向相机查询节点类型，查询不到时按值的类型推断
+PARAM_TYPES = {
+    "ExposureTime": "float",
+    "Gain": "float",
+    "AcquisitionFrameRate": "float",
+    "AcquisitionBurstFrameCount": "int",
+    "AcquisitionFrameRateEnable": "bool",
+    "TriggerMode": "enum",
+    "TriggerSource": "enum",
+    "TriggerActivation": "enum",
+    "AcquisitionMode": "enum",
+}
+PARAM_TYPE_NAMES = ("float", "int", "enum", "bool", "string")
+NODE_INTERFACE_TYPES = {IFT_IFloat: "float", IFT_IInteger: "int", IFT_IEnumeration: "enum",
+                        IFT_IBoolean: "bool", IFT_IString: "string"}
+
+
+def param_type(name, value):
+    """参数的节点类型：已知参数查表，否则按值的类型推断"""
+    if name in PARAM_TYPES:
+        return PARAM_TYPES[name]
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    return "string"
+
+
+def node_type(cam, name, value):
+    """参数的节点类型：已知参数查表，否则向相机查询（MV_XML_GetNodeInterfaceType），查询失败时按值的类型推断"""
+    if name not in PARAM_TYPES:
+        interface_type = c_int()
+        if cam.MV_XML_GetNodeInterfaceType(name, interface_type) == 0 and \
+                interface_type.value in NODE_INTERFACE_TYPES:
+            return NODE_INTERFACE_TYPES[interface_type.value]
+    return param_type(name, value)
+
+
+def set_camera_param(cam, name, value, kind):
+    """按节点类型设置一个相机参数，返回 SDK 错误码"""
+    if kind == "float":
+        return cam.MV_CC_SetFloatValue(name, float(value))
+    if kind == "int":
+        return cam.MV_CC_SetIntValueEx(name, int(value))
+    if kind == "enum":
+        if isinstance(value, str):
+            return cam.MV_CC_SetEnumValueByString(name, value)
+        return cam.MV_CC_SetEnumValue(name, int(value))
+    if kind == "bool":
+        return cam.MV_CC_SetBoolValue(name, bool(value))
+    if kind == "string":
+        return cam.MV_CC_SetStringValue(name, str(value))
+    raise ValueError(f"不支持的参数类型: {kind}")
+
+
+def get_camera_param(cam, name, kind, symbolic=False):
+    """
+    按节点类型读取一个相机参数
+    :param symbolic:  枚举参数是否返回符号名（配置中写的是符号名时），读取符号名失败时返回数值
+    :return:          (SDK 错误码, 值)
+    """
+    if kind == "float":
+        st = MVCC_FLOATVALUE()
+        return cam.MV_CC_GetFloatValue(name, st), st.fCurValue
+    if kind == "int":
+        st = MVCC_INTVALUE_EX()
+        return cam.MV_CC_GetIntValueEx(name, st), st.nCurValue
+    if kind == "enum":
+        st = MVCC_ENUMVALUE()
+        ret = cam.MV_CC_GetEnumValue(name, st)
+        if ret != 0 or not symbolic:
+            return ret, st.nCurValue
+        entry = MVCC_ENUMENTRY()
+        entry.nValue = st.nCurValue
+        if cam.MV_CC_GetEnumEntrySymbolic(name, entry) != 0:
+            return ret, st.nCurValue
+        return ret, entry.chSymbolic.decode("ascii", "replace")
+    if kind == "bool":
+        st = c_bool()
+        return cam.MV_CC_GetBoolValue(name, st), st.value
+    if kind == "string":
+        st = MVCC_STRINGVALUE()
+        return cam.MV_CC_GetStringValue(name, st), st.chCurValue.decode("utf-8", "replace")
+    raise ValueError(f"不支持的参数类型: {kind}")
+
+
+def values_equal(kind, wanted, actual):
+    """读回值与配置值是否一致"""
+    if kind == "float":
+        return abs(float(actual) - float(wanted)) <= max(abs(float(wanted)) * FLOAT_TOLERANCE, 1e-6)
+    if kind == "bool":
+        return bool(actual) == bool(wanted)
+    if kind == "enum" and isinstance(wanted, str) and not isinstance(actual, str):
+        return True  # 读不到符号名，无法比较
+    return actual == wanted
+
+
+def load_profiles(path):
+    """
+    读取配置文件（.json / .yaml / .yml），feature_file 的相对路径按配置文件所在目录解析
+    :return:  {"default" 或序列号: {参数: 值}}
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise RuntimeError("读取 YAML 配置文件需要安装 PyYAML，或改用 JSON 格式")
+            profiles = yaml.safe_load(f)
+        else:
+            profiles = json.load(f)
+    if not isinstance(profiles, dict):
+        raise ValueError(f"配置文件 {path} 应为以序列号为键的字典")
+    base = os.path.dirname(os.path.abspath(path))
+    for key, entry in profiles.items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"配置文件 {path} 中 {key} 的内容应为参数字典")
+        feature_file = entry.get(FEATURE_FILE_KEY)
+        if feature_file:
+            entry[FEATURE_FILE_KEY] = os.path.join(base, feature_file)
+    return profiles
+
+
+def profile_for(profiles, serial):
+    """
+    取某台相机的配置：default 与该序列号条目合并
+    :return:  {"feature_file": .mfs 文件或 None, "params": {参数: 值}, "overrides": 条目中单独列出的参数}
+    """
+    default = profiles.get(DEFAULT_KEY, {})
+    entry = profiles.get(serial, {})
+    params = {k: v for k, v in default.items() if k != FEATURE_FILE_KEY}
+    params.update((k, v) for k, v in entry.items() if k != FEATURE_FILE_KEY)
+    return {
+        "feature_file": entry.get(FEATURE_FILE_KEY, default.get(FEATURE_FILE_KEY)),
+        "params": params,
+        "overrides": [k for k in entry if k != FEATURE_FILE_KEY],
+    }
+
+
+class ProfileResult:
+    """一台相机的配置结果"""
+
+    def __init__(self, cam_idx, serial, feature_file=None):
+        self.cam_idx = cam_idx
+        self.serial = serial
+        self.feature_file = feature_file
+        self.feature_loaded = False
+        self.written = 0
+        self.failed = {}  # 参数 -> SDK 错误码（写入或读回失败）
+        self.diffs = {}  # 参数 -> (配置值, 读回值)
+        self.timings = {}  # 阶段 -> 耗时 ms
+
+    @property
+    def ok(self):
+        return not self.failed and not self.diffs
+
+    def summary(self):
+        text = f"相机{self.cam_idx} ({self.serial}): "
+        if self.feature_file:
+            text += f"导入{'成功' if self.feature_loaded else '失败'} {self.timings.get('feature_load', 0):.1f}ms, "
+        text += (f"写入 {self.written} 项 {self.timings.get('params', 0):.1f}ms, "
+                 f"读回 {self.timings.get('readback', 0):.1f}ms, 共 {self.timings.get('total', 0):.1f}ms")
+        if self.failed:
+            text += "; 失败: " + ", ".join(f"{name}[0x{ret:x}]" for name, ret in self.failed.items())
+        if self.diffs:
+            text += "; 不一致: " + ", ".join(f"{name} {wanted} -> {actual}"
+                                            for name, (wanted, actual) in self.diffs.items())
+        return text
+
+
+def apply_profile(cam, profile, cam_idx=0, serial=""):
+    """
+    配置一台已打开的相机：导入参数文件（如有），写入参数，再逐项读回比较
+    :param profile:  profile_for 的结果；导入成功时只写入 overrides 中的参数，导入失败或没有参数文件时写入全部参数
+    :return:         ProfileResult
+    """
+    feature_file = profile["feature_file"]
+    params = profile["params"]
+    result = ProfileResult(cam_idx, serial, feature_file)
+    start = time.perf_counter()
+    to_write = params
+    if feature_file:
+        t = time.perf_counter()
+        ret = cam.MV_CC_FeatureLoad(feature_file) if os.path.isfile(feature_file) else None
+        result.feature_loaded = ret == 0
+        result.timings["feature_load"] = (time.perf_counter() - t) * 1000
+        if result.feature_loaded:
+            to_write = {k: params[k] for k in profile["overrides"]}
+        else:
+            print(f"相机{cam_idx} 导入参数文件 {feature_file} 失败"
+                  + (f" [0x{ret:x}]" if ret is not None else "，文件不存在") + "，改为逐项写入")
+
+    t = time.perf_counter()
+    kinds = {name: node_type(cam, name, value) for name, value in params.items()}
+    for name, value in to_write.items():
+        ret = set_camera_param(cam, name, value, kinds[name])
+        if ret == 0:
+            result.written += 1
+        else:
+            result.failed[name] = ret
+    result.timings["params"] = (time.perf_counter() - t) * 1000
+
+    # 导入参数文件时 default 中的参数没有逐项写入，同样读回比较，检查参数文件与配置是否一致
+    t = time.perf_counter()
+    for name, value in params.items():
+        if name in result.failed:
+            continue
+        ret, actual = get_camera_param(cam, name, kinds[name], symbolic=isinstance(value, str))
+        if ret != 0:
+            result.failed[name] = ret
+        elif not values_equal(kinds[name], value, actual):
+            result.diffs[name] = (value, actual)
+    result.timings["readback"] = (time.perf_counter() - t) * 1000
+    result.timings["total"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def read_serial(cam):
+    """读取已打开相机的序列号"""
+    ret, serial = get_camera_param(cam, "DeviceSerialNumber", "string")
+    return serial if ret == 0 else ""
+
+
+def apply_profiles(cameras, profiles, workers=None):
+    """
+    并发配置多台相机
+    :param cameras:   [(cam_idx, cam, serial)]
+    :param profiles:  load_profiles 的结果
+    :return:          与 cameras 顺序一致的 ProfileResult 列表
+    """
+    def apply_one(item):
+        cam_idx, cam, serial = item
+        return apply_profile(cam, profile_for(profiles, serial), cam_idx=cam_idx, serial=serial)
+
+    if not cameras:
+        return []
+    with ThreadPoolExecutor(max_workers=workers or len(cameras), thread_name_prefix="CameraProfile") as executor:
+        return list(executor.map(apply_one, cameras))
+
+
+def _open_cameras():
+    """打开所有相机，返回 [(cam_idx, cam, serial)]"""
+    from ctypes import POINTER, cast
+    from MvCameraControl_class import MvCamera, MV_ACCESS_Exclusive, MV_GIGE_DEVICE, MV_USB_DEVICE, \
+        MV_CC_DEVICE_INFO, MV_CC_DEVICE_INFO_LIST
+
+    MvCamera.MV_CC_Initialize()
+    device_list = MV_CC_DEVICE_INFO_LIST()
+    if MvCamera.MV_CC_EnumDevices(MV_GIGE_DEVICE | MV_USB_DEVICE, device_list) != 0 or device_list.nDeviceNum == 0:
+        raise RuntimeError("未找到相机设备")
+    cameras = []
+    for i in range(device_list.nDeviceNum):
+        dev_info = cast(device_list.pDeviceInfo[i], POINTER(MV_CC_DEVICE_INFO)).contents
+        cam = MvCamera()
+        if cam.MV_CC_CreateHandle(dev_info) != 0 or cam.MV_CC_OpenDevice(MV_ACCESS_Exclusive, 0) != 0:
+            print(f"相机{i} 打开失败")
+            continue
+        cameras.append((i, cam, read_serial(cam)))
+    return cameras
+
+
+def _close_cameras(cameras):
+    from MvCameraControl_class import MvCamera
+    for _, cam, _ in cameras:
+        cam.MV_CC_CloseDevice()
+        cam.MV_CC_DestroyHandle()
+    MvCamera.MV_CC_Finalize()
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "save":
+        os.makedirs(sys.argv[2], exist_ok=True)
+        cameras = _open_cameras()
+        try:
+            for cam_idx, cam, serial in cameras:
+                path = os.path.join(sys.argv[2], f"{serial or cam_idx}.mfs")
+                ret = cam.MV_CC_FeatureSave(path)
+                print(f"相机{cam_idx} ({serial}): " + ("已导出 " + path if ret == 0 else f"导出失败 [0x{ret:x}]"))
+        finally:
+            _close_cameras(cameras)
+        return
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help", "save"):
+        print("用法: python camera_profile.py [配置文件] | save <目录>")
+        sys.exit(1)
+
+    path = sys.argv[1] if len(sys.argv) > 1 else PROFILE_FILE
+    profiles = load_profiles(path) if os.path.exists(path) else DEFAULT_PROFILES
+    cameras = _open_cameras()
+    try:
+        start = time.perf_counter()
+        results = apply_profiles(cameras, profiles)
+        elapsed = (time.perf_counter() - start) * 1000
+        for result in results:
+            print(result.summary())
+        print(f"并发配置 {len(results)} 台相机用时 {elapsed:.1f}ms，"
+              f"逐台配置合计约 {sum(r.timings['total'] for r in results):.1f}ms")
+    finally:
+        _close_cameras(cameras)
+
+
+if __name__ == "__main__":
+    main()
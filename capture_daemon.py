@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+"""
+无界面多相机采集服务
+
+在没有窗口的进程中运行与 qt_multicam_shoot.py 相同的采集流程（CameraController、同步分组、异步写盘），
+通过本地控制套接字接收命令，界面可以单独启动、随时关闭，界面渲染不会拖慢采集。
+
+    python capture_daemon.py                                  # 启动服务（Ctrl+C 或 quit 命令退出）
+    python capture_daemon.py status|start|stop|trigger|quit   # 发送命令
+    python capture_daemon.py set <相机号|all> <参数> <值> [float|int|enum|bool|string]
+    python capture_daemon.py gui                              # 独立的预览界面
+
+协议：每行一个 JSON 请求 {"cmd": "...", ...}，服务回复一行 JSON，{"ok": true, ...} 或 {"ok": false, "error": "..."}。
+Linux 下使用 Unix 套接字 CONTROL_SOCKET，不支持 Unix 套接字的系统使用本机 TCP 端口 CONTROL_PORT。
+"""
+import base64
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from collections import deque
+
+import cv2
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer, Qt, pyqtSignal
+
+sys.path.append("./MvImport")
+from MvImport.MvCameraControl_class import *
+from qt_multicam_shoot import (CameraController, deliver_group, device_name, load_camera_profiles,
+                               SAVE_PATH, SAVE_CODEC, SAVE_CODEC_LEVEL, SAVE_MODE, WRITER_QUEUE_SIZE, WRITER_WORKERS,
+                               WRITER_POLICY, WRITER_BLOCK_TIMEOUT, BURST_FRAMES, GROUP_TIME_SOURCE, GROUP_SKEW_MS,
+                               GROUP_TIMEOUT_MS, GROUP_FRAME_INTERVAL_MS, GROUP_TRIGGER_GAP_MS, PREVIEW_SIZE)
+from frame_writer import FrameWriter
+from frame_container import FrameContainerWriter
+from frame_aggregator import FrameAggregator
+from preview_renderer import fit_size
+from camera_profile import PARAM_TYPES, PARAM_TYPE_NAMES, param_type, set_camera_param
+from device_manager import DeviceManager
+
+CONTROL_SOCKET = "/tmp/idet_capture.sock"
+CONTROL_PORT = 47800
+CLIENT_TIMEOUT = 5.0
+PREVIEW_QUALITY = 80  # 预览 JPEG 质量
+VIEWER_INTERVAL_MS = 500  # 界面轮询间隔
+LOG_LINES = 50
+
+
+def control_address():
+    """控制套接字地址：(地址族, 地址)"""
+    if hasattr(socket, "AF_UNIX"):
+        return socket.AF_UNIX, CONTROL_SOCKET
+    return socket.AF_INET, ("127.0.0.1", CONTROL_PORT)
+
+
+def parse_value(text, kind):
+    """把命令行中的参数值转换为对应类型"""
+    if kind == "float":
+        return float(text)
+    if kind == "int":
+        return int(text, 0)
+    if kind == "enum":
+        return int(text, 0) if text.lstrip("-").isdigit() or text.startswith("0x") else text
+    if kind == "bool":
+        return text.lower() in ("1", "true", "on", "yes")
+    return text
+
+
+class CaptureService(QObject):
+    quit_requested = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.RLock()  # 控制命令来自各连接线程，串行执行
+        self.log = deque(maxlen=LOG_LINES)
+        self.started_at = time.time()
+        self.grabbing = False
+        self.container = None
+        if SAVE_MODE == "container":
+            session = time.strftime("%Y%m%d_%H%M%S")
+            codec = None if SAVE_CODEC == "bmp" else SAVE_CODEC  # bmp 即原始像素
+            self.container = FrameContainerWriter(os.path.join(SAVE_PATH, f"session_{session}.idfc"),
+                                                  codec=codec, codec_level=SAVE_CODEC_LEVEL)
+        self.writer = FrameWriter(max_queue=WRITER_QUEUE_SIZE, num_workers=WRITER_WORKERS,
+                                  policy=WRITER_POLICY, block_timeout=WRITER_BLOCK_TIMEOUT,
+                                  codec=SAVE_CODEC, codec_level=SAVE_CODEC_LEVEL, container=self.container)
+        self.init_cameras()
+
+        # 定时处理超时未集齐的同步组
+        self.group_timer = QTimer(self)
+        self.group_timer.timeout.connect(self.aggregator.poll)
+        self.group_timer.start(100)
+
+    def init_cameras(self):
+        MvCamera.MV_CC_Initialize()
+        # 并发打开、按序列号配置各相机（见 camera_profile.py），掉线后自动重连并恢复配置
+        self.device_manager = DeviceManager(load_camera_profiles(), on_event=self.on_device_event)
+        dev_infos = self.device_manager.enumerate()
+        if not dev_infos:
+            raise RuntimeError("未找到相机设备")
+
+        self.aggregator = FrameAggregator(len(dev_infos), self.dispatch_group, skew_ms=GROUP_SKEW_MS,
+                                          timeout_ms=GROUP_TIMEOUT_MS, trigger_gap_ms=GROUP_TRIGGER_GAP_MS,
+                                          frame_interval_ms=GROUP_FRAME_INTERVAL_MS, burst_size=BURST_FRAMES,
+                                          time_source=GROUP_TIME_SOURCE)
+        self.devices = []
+        self.controllers = self.device_manager.open_all(self.create_controller, dev_infos)
+
+        online = [c for c in self.controllers if c.converter is not None]
+        if online:
+            first = online[0]
+            first.converter.calibrate(first.pool.width, first.pool.height)
+            for c in online[1:]:
+                c.converter.backends = dict(first.converter.backends)
+
+    def create_controller(self, cam_idx, dev_info):
+        controller = CameraController(cam_idx, dev_info, self.writer, self.aggregator)
+        # 没有界面，显示用的引用立即归还；最近的帧仍保存在 recent_images 中供预览
+        controller.signals.update_image.connect(lambda cam_idx, pos, slot: slot.release(), Qt.DirectConnection)
+        controller.signals.update_system_info.connect(self.log.append, Qt.DirectConnection)
+        model_name, serial_number = device_name(dev_info)
+        self.devices.append({"model": model_name, "serial": serial_number})
+        self.log.append(f"相机{cam_idx}: 型号 - {model_name}, 序列号 - {serial_number}")
+        return controller
+
+    def on_device_event(self, info):
+        """设备管理的打开、掉线、重连事件（可能在工作线程中调用）"""
+        print(info)
+        self.log.append(info)
+
+    def dispatch_group(self, group):
+        """同步组回调（相机线程或分组定时器中调用）"""
+        deliver_group(self.controllers, group)
+
+    def start(self):
+        with self.lock:
+            if not self.grabbing:
+                self.device_manager.start_all()  # 离线的相机重连后自动开始采集
+                self.grabbing = True
+            return {"grabbing": self.grabbing}
+
+    def stop(self):
+        with self.lock:
+            if self.grabbing:
+                self.device_manager.stop_all()
+                self.aggregator.flush()
+                self.grabbing = False
+            return {"grabbing": self.grabbing}
+
+    def trigger(self):
+        """向所有相机发送软触发"""
+        with self.lock:
+            return {"ret": [c.cam.MV_CC_SetCommandValue("TriggerSoftware") for c in self.controllers]}
+
+    def set_params(self, cam, params, kind=None):
+        """
+        设置相机参数
+        :param cam:     相机序号，"all" 表示全部相机
+        :param params:  {参数名: 值}
+        :param kind:    节点类型，None 时按 PARAM_TYPES 或值的类型确定
+        """
+        with self.lock:
+            controllers = self.controllers if cam == "all" else [self.controllers[int(cam)]]
+            results = {}
+            for c in controllers:
+                for name, value in params.items():
+                    ret = set_camera_param(c.cam, name, value, kind or param_type(name, value))
+                    results[f"{c.cam_idx}.{name}"] = ret
+                    if ret != 0:
+                        self.log.append(f"相机 {c.cam_idx} 设置{name}失败 [0x{ret:x}]")
+            failed = [key for key, ret in results.items() if ret != 0]
+            if failed:
+                raise RuntimeError("设置失败: " + ", ".join(failed))
+            return {"ret": results}
+
+    def status(self):
+        cameras = []
+        for c, device, connection in zip(self.controllers, self.devices, self.device_manager.stats()):
+            with c.lock:
+                recent = [None if slot is None else slot.frame_num for slot in c.recent_images]
+            cameras.append(dict(device, index=c.cam_idx, grabbing=c.is_grabbing, grab_mode=c.grab_mode,
+                                pool=None if c.pool is None else c.pool.stats(), recent=recent,
+                                connection=connection))
+        return {
+            "grabbing": self.grabbing,
+            "uptime": time.time() - self.started_at,
+            "save_path": os.path.abspath(SAVE_PATH),
+            "save_mode": SAVE_MODE,
+            "cameras": cameras,
+            "writer": self.writer.stats(),
+            "groups": self.aggregator.stats(),
+            "log": list(self.log),
+        }
+
+    def preview(self, known=None):
+        """
+        各相机最近帧的 JPEG 缩略图（base64），known 中 "相机_位置" 对应的帧号未变化的不再发送
+        编码只在有客户端请求时进行，界面不连接时采集进程没有任何显示开销
+        """
+        known = known or {}
+        frames = []
+        for c in self.controllers:
+            for pos in range(BURST_FRAMES):
+                with c.lock:
+                    slot = c.recent_images[pos]
+                    if slot is None or known.get(f"{c.cam_idx}_{pos}") == slot.frame_num:
+                        continue
+                    slot.retain()
+                try:
+                    img = slot.image
+                    h, w = img.shape[:2]
+                    small = cv2.resize(img, fit_size(w, h, PREVIEW_SIZE), interpolation=cv2.INTER_AREA)
+                    frame_num = slot.frame_num
+                finally:
+                    slot.release()
+                ok, buf = cv2.imencode(".jpg", small, [cv2.IMWRITE_JPEG_QUALITY, PREVIEW_QUALITY])
+                if ok:
+                    frames.append({"cam": c.cam_idx, "pos": pos, "frame_num": frame_num,
+                                   "jpeg": base64.b64encode(buf.tobytes()).decode("ascii")})
+        return {"frames": frames}
+
+    def handle(self, request):
+        """执行一个控制命令，返回回复字典"""
+        cmd = request.get("cmd")
+        try:
+            if cmd == "status":
+                result = self.status()
+            elif cmd == "start":
+                result = self.start()
+            elif cmd == "stop":
+                result = self.stop()
+            elif cmd == "trigger":
+                result = self.trigger()
+            elif cmd == "set":
+                result = self.set_params(request.get("cam", "all"), request["params"], request.get("type"))
+            elif cmd == "preview":
+                result = self.preview(request.get("known"))
+            elif cmd == "quit":
+                result = {}  # 回复发出后由 ControlServer 请求退出
+            else:
+                raise ValueError(f"未知命令: {cmd}")
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+        result["ok"] = True
+        return result
+
+    def close(self):
+        self.stop()
+        self.device_manager.close()
+        MvCamera.MV_CC_Finalize()
+        self.aggregator.flush()
+        self.writer.close()
+        if self.container is not None:
+            self.container.close()
+
+
+class ControlServer:
+    """控制套接字：每个连接一个线程，逐行读取 JSON 请求"""
+
+    def __init__(self, service=None):
+        self.service = service  # 可在 start 之前再设置：先占用控制地址，确认没有服务在运行后再打开相机
+        self.family, self.address = control_address()
+        if self.family == socket.AF_UNIX and os.path.exists(self.address):
+            if _probe(self.family, self.address):
+                raise RuntimeError(f"采集服务已在运行: {self.address}")
+            os.remove(self.address)  # 上次异常退出留下的套接字文件
+        self.sock = socket.socket(self.family, socket.SOCK_STREAM)
+        if self.family == socket.AF_INET:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(self.address)
+        if self.family == socket.AF_UNIX:
+            os.chmod(self.address, 0o600)  # 只允许本用户控制相机
+        self.sock.listen(4)
+        self.thread = threading.Thread(target=self._accept_loop, daemon=True, name="ControlServer")
+
+    def start(self):
+        self.thread.start()
+
+    def _accept_loop(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return  # 套接字已关闭
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        with conn, conn.makefile("rwb") as f:
+            for line in f:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    reply = {"ok": False, "error": "请求不是有效的 JSON"}
+                else:
+                    if not isinstance(request, dict):
+                        reply = {"ok": False, "error": "请求必须是 JSON 对象"}
+                    else:
+                        reply = self.service.handle(request)
+                try:
+                    f.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+                    f.flush()
+                except OSError:
+                    return
+                if reply["ok"] and request.get("cmd") == "quit":
+                    self.service.quit_requested.emit()  # 排队到主线程退出事件循环
+                    return
+
+    def close(self):
+        self.sock.close()
+        if self.family == socket.AF_UNIX and os.path.exists(self.address):
+            os.remove(self.address)
+
+
+def _probe(family, address):
+    """地址上是否有服务在监听"""
+    with socket.socket(family, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(address)
+            return True
+        except OSError:
+            return False
+
+
+class CaptureClient:
+    """采集服务的客户端，一个连接上可以连续发送多个命令"""
+
+    def __init__(self, timeout=CLIENT_TIMEOUT):
+        family, address = control_address()
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(address)
+        self.file = self.sock.makefile("rwb")
+
+    def request(self, cmd, **kwargs):
+        """发送命令并返回回复，服务返回失败时抛出 RuntimeError"""
+        kwargs["cmd"] = cmd
+        self.file.write(json.dumps(kwargs, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise RuntimeError("采集服务已断开")
+        reply = json.loads(line)
+        if not reply.pop("ok", False):
+            raise RuntimeError(reply.get("error", "未知错误"))
+        return reply
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_service():
+    app = QCoreApplication(sys.argv)
+    server = ControlServer()  # 服务已在运行时在此失败，不会再打开相机、创建会话容器
+    try:
+        service = CaptureService()
+    except BaseException:
+        server.close()
+        raise
+    server.service = service
+    service.quit_requested.connect(app.quit)
+    # Ctrl+C / kill 时退出事件循环（分组定时器会周期性回到 Python，信号处理函数得以执行）
+    signal.signal(signal.SIGINT, lambda *args: app.quit())
+    signal.signal(signal.SIGTERM, lambda *args: app.quit())
+    server.start()
+    print(f"采集服务已启动，控制地址: {server.address}")
+    try:
+        app.exec_()
+    finally:
+        server.close()
+        service.close()
+        print("采集服务已退出")
+
+
+def run_viewer():
+    """独立的预览界面：轮询服务状态与缩略图，关闭界面不影响采集"""
+    from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit
+    from PyQt5.QtGui import QImage, QPixmap
+
+    class CaptureViewer(QWidget):
+        def __init__(self):
+            super().__init__()
+            self.client = None
+            self.known = {}
+            self.setWindowTitle('采集服务预览')
+            self.setStyleSheet("background-color: #333333; color: white;")
+            layout = QHBoxLayout(self)
+            grid = QVBoxLayout()
+            self.labels = []
+            for cam_idx in range(3):
+                row = QHBoxLayout()
+                labels = []
+                for pos in range(BURST_FRAMES):
+                    label = QLabel()
+                    label.setFixedSize(*PREVIEW_SIZE)
+                    label.setAlignment(Qt.AlignCenter)
+                    row.addWidget(label)
+                    labels.append(label)
+                self.labels.append(labels)
+                grid.addLayout(row)
+            layout.addLayout(grid, 70)
+            right = QVBoxLayout()
+            self.status_text = QTextEdit()
+            self.status_text.setReadOnly(True)
+            self.status_text.setStyleSheet("background-color: #F0F0F0; color: black;")
+            start_btn = QPushButton('开始采集')
+            stop_btn = QPushButton('停止采集')
+            start_btn.setStyleSheet("background-color: white; color: black;")
+            stop_btn.setStyleSheet("background-color: white; color: black;")
+            start_btn.clicked.connect(lambda: self.send("start"))
+            stop_btn.clicked.connect(lambda: self.send("stop"))
+            right.addWidget(self.status_text)
+            right.addWidget(start_btn)
+            right.addWidget(stop_btn)
+            layout.addLayout(right, 30)
+            self.timer = QTimer(self)
+            self.timer.timeout.connect(self.refresh)
+            self.timer.start(VIEWER_INTERVAL_MS)
+
+        def send(self, cmd, **kwargs):
+            try:
+                if self.client is None:
+                    self.client = CaptureClient()
+                return self.client.request(cmd, **kwargs)
+            except (OSError, RuntimeError) as e:
+                if self.client is not None:
+                    self.client.close()
+                    self.client = None
+                self.status_text.setPlainText(f"采集服务未连接: {e}")
+                return None
+
+        def refresh(self):
+            status = self.send("status")
+            if status is None:
+                return
+            lines = [f"采集中: {status['grabbing']}  运行 {status['uptime']:.0f} 秒"]
+            for cam in status["cameras"]:
+                connection = cam["connection"]
+                free = "-" if cam["pool"] is None else cam["pool"]["free"]
+                lines.append(f"相机{cam['index']} {cam['model']} {cam['serial']} {connection['state']} 空闲槽位 {free} "
+                             f"掉线 {connection['drops']} 重连 {connection['reconnects']}")
+            writer = status["writer"]
+            groups = status["groups"]
+            lines.append(f"写盘 {writer['frames_written']} 帧, 队列 {writer['queue_depth']}, 丢帧 {writer['dropped']}")
+            lines.append(f"同步组 完整 {groups['groups_complete']} | 不完整 {groups['groups_incomplete']} | "
+                         f"触发序号 {groups['trigger_no']}")
+            lines.extend(status["log"][-10:])
+            self.status_text.setPlainText("\n".join(lines))
+
+            preview = self.send("preview", known=self.known)
+            if preview is None:
+                return
+            for frame in preview["frames"]:
+                cam_idx, pos = frame["cam"], frame["pos"]
+                self.known[f"{cam_idx}_{pos}"] = frame["frame_num"]
+                if cam_idx >= len(self.labels):
+                    continue
+                q_img = QImage.fromData(base64.b64decode(frame["jpeg"]), "JPG")
+                self.labels[cam_idx][pos].setPixmap(QPixmap.fromImage(q_img))
+
+        def closeEvent(self, event):
+            if self.client is not None:
+                self.client.close()
+            event.accept()
+
+    app = QApplication(sys.argv)
+    viewer = CaptureViewer()
+    viewer.show()
+    sys.exit(app.exec_())
+
+
+def main():
+    if len(sys.argv) < 2:
+        run_service()
+        return
+    cmd = sys.argv[1]
+    if cmd == "gui":
+        run_viewer()
+        return
+    request = {}
+    if cmd == "set":
+        if len(sys.argv) < 5:
+            print("用法: python capture_daemon.py set <相机号|all> <参数> <值> [float|int|enum|bool|string]")
+            return
+        cam, name, text = sys.argv[2:5]
+        kind = sys.argv[5] if len(sys.argv) > 5 else PARAM_TYPES.get(name)
+        if kind is None:
+            print(f"未知参数 {name}，请指明类型: " + " / ".join(PARAM_TYPE_NAMES))
+            return
+        request = {"cam": cam, "params": {name: parse_value(text, kind)}, "type": kind}
+    try:
+        with CaptureClient() as client:
+            reply = client.request(cmd, **request)
+    except OSError as e:
+        print(f"无法连接采集服务: {e}")
+        return
+    except RuntimeError as e:
+        print(f"命令失败: {e}")
+        return
+    print(json.dumps(reply, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+导入耗时检查
+
+在全新的解释器中用 -X importtime 导入各模块，累计耗时超出预算、或导入时就加载了不该加载的模块
+（结构体定义、SDK动态库）时返回非零退出码，可放在提交前或 CI 中运行：
+
+    python check_import_time.py [重复次数]
+
+每个模块取多次导入中的最小值，减少磁盘缓存与系统负载的干扰。
+"""
+import os
+import re
+import subprocess
+import sys
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+# 模块 -> (累计导入耗时预算 ms, 导入后不应出现在 sys.modules 中的模块)
+IMPORT_BUDGETS = {
+    "MvImport.MvCameraControl_class": (25, ("CameraParams_header", "MvCameraSim_class")),
+}
+REPEAT = 5
+
+# 导入后检查：延迟加载的模块没有被导入，SDK动态库没有被加载
+PROBE = """
+import sys
+sys.path.append("./MvImport")
+import {module}
+loaded = [name for name in {forbidden!r} if name in sys.modules]
+dll = getattr(sys.modules[{module!r}], "MvCamCtrldll", None)
+if getattr(dll, "_dll", None) is not None:
+    loaded.append("SDK动态库")
+print("LOADED:" + ",".join(loaded))
+"""
+
+
+def measure(module, forbidden):
+    """返回 (累计导入耗时 ms, 被提前加载的模块列表)"""
+    env = dict(os.environ)
+    env.pop("MVS_SIM", None)  # 按真实SDK的导入路径检查
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE.format(module=module, forbidden=forbidden)],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败:\n{result.stderr}")
+    cumulative = None
+    for line in result.stderr.splitlines():
+        m = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)$", line)
+        if m and m.group(2) == module:
+            cumulative = int(m.group(1)) / 1000
+    loaded = result.stdout.strip().split("LOADED:")[-1]
+    return cumulative, [name for name in loaded.split(",") if name]
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    failed = False
+    for module, (budget_ms, forbidden) in IMPORT_BUDGETS.items():
+        runs = [measure(module, forbidden) for _ in range(repeat)]
+        best = min(ms for ms, _ in runs)
+        loaded = runs[0][1]
+        ok = best <= budget_ms and not loaded
+        failed = failed or not ok
+        print(f"{'通过' if ok else '超标'}  {module}: {best:.1f} ms (预算 {budget_ms} ms)"
+              + (f", 提前加载了: {', '.join(loaded)}" if loaded else ""))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+相机设备管理：并发打开、掉线检测与自动重连
+
+原来枚举后在主线程中逐台创建句柄、打开、配置相机，一台相机没接好或响应慢，整条线都要等它，
+相机掉线后只能重启程序。DeviceManager：
+    - 枚举后在线程池中并发打开、配置各相机，打开失败的相机记为离线，不影响其他相机启动
+    - 每台相机注册 MV_CC_RegisterExceptionCallBack，看门狗线程再定期检查 MV_CC_IsDeviceConnected
+    - 掉线或离线的相机按序列号重新枚举、打开并恢复参数配置（camera_profile.py），
+      采集中掉线的相机重连后自动重新开始采集，其他相机照常采集
+    - 统计每台相机的打开/配置耗时、首帧时间（开始采集到第一帧）与重连耗时
+
+控制器需提供：cam、serial、dev_info、open()、setup(profiles)、close()、release()、
+start_grabbing()、stop_grabbing()、is_grabbing、first_frame_at（本次开始采集后第一帧的 time.monotonic()）。
+"""
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import POINTER, c_uint, c_void_p, cast
+
+sys.path.append("./MvImport")
+from MvImport.MvCameraControl_class import (MV_CALLBACK_FUNCTYPE, MV_CC_DEVICE_INFO, MV_CC_DEVICE_INFO_LIST,
+                                            MV_EXCEPTION_DEV_DISCONNECT, MV_GIGE_DEVICE, MV_USB_DEVICE, MvCamera)
+
+WATCH_INTERVAL = 1.0  # 看门狗检查间隔（秒），异常回调会立即唤醒
+RECONNECT_INTERVAL = 2.0  # 重连失败后的重试间隔（秒）
+TLAYER_TYPE = MV_GIGE_DEVICE | MV_USB_DEVICE
+
+STATE_ONLINE = "online"
+STATE_OFFLINE = "offline"  # 启动时没能打开，等待重试
+STATE_RECONNECTING = "reconnecting"  # 掉线，等待重连
+
+ExceptionCallBack = MV_CALLBACK_FUNCTYPE(None, c_uint, c_void_p)
+
+
+def device_serial(dev_info):
+    """设备信息中的序列号"""
+    if dev_info.nTLayerType == MV_GIGE_DEVICE:
+        raw = dev_info.SpecialInfo.stGigEInfo.chSerialNumber
+    elif dev_info.nTLayerType == MV_USB_DEVICE:
+        raw = dev_info.SpecialInfo.stUsb3VInfo.chSerialNumber
+    else:
+        return ""
+    return bytes(raw).decode('utf-8').rstrip('\x00')
+
+
+def enum_devices(tlayer_type=TLAYER_TYPE):
+    """枚举设备，返回 MV_CC_DEVICE_INFO 副本的列表（SDK 的设备列表在下次枚举时失效）"""
+    device_list = MV_CC_DEVICE_INFO_LIST()
+    ret = MvCamera.MV_CC_EnumDevices(tlayer_type, device_list)
+    if ret != 0:
+        raise RuntimeError(f"枚举设备失败 ret[0x{ret:x}]")
+    return [MV_CC_DEVICE_INFO.from_buffer_copy(cast(device_list.pDeviceInfo[i], POINTER(MV_CC_DEVICE_INFO)).contents)
+            for i in range(device_list.nDeviceNum)]
+
+
+class CameraDevice:
+    """一台相机的连接状态与计时，时间单位 ms"""
+
+    def __init__(self, cam_idx, controller):
+        self.cam_idx = cam_idx
+        self.controller = controller
+        self.serial = controller.serial
+        self.state = STATE_OFFLINE
+        self.lock = threading.RLock()  # 打开、重连与开始/停止采集互斥
+        self.pending = False  # 已提交重连任务
+        self.disconnected = False  # 异常回调置位，看门狗处理
+        self.exception_callback = None  # 保持引用，避免被回收
+        self.next_attempt = 0.0
+        self.error = ""
+        self.profile_result = None
+
+        self.open_ms = None
+        self.setup_ms = None
+        self.grab_started_at = None
+        self.ttff_ms = None  # 最近一次开始采集到第一帧
+        self.dropped_at = None
+        self.drops = 0
+        self.reconnects = 0
+        self.reconnect_ms = None  # 最近一次重连：检测到掉线到重新开始采集
+        self.reconnect_ttff_ms = None  # 最近一次重连：检测到掉线到第一帧
+
+
+class DeviceManager:
+    def __init__(self, profiles, on_event=print, watch_interval=WATCH_INTERVAL,
+                 reconnect_interval=RECONNECT_INTERVAL, tlayer_type=TLAYER_TYPE):
+        """
+        :param profiles:            load_profiles 的结果，打开与重连后都按它配置相机
+        :param on_event:            on_event(文字)，打开、掉线、重连等事件，可能在工作线程中调用
+        :param watch_interval:      看门狗检查间隔（秒）
+        :param reconnect_interval:  重连失败后的重试间隔（秒）
+        :param tlayer_type:         枚举的设备类型
+        """
+        self.profiles = profiles
+        self.on_event = on_event
+        self.watch_interval = watch_interval
+        self.reconnect_interval = reconnect_interval
+        self.tlayer_type = tlayer_type
+        self.devices = []
+        self.grabbing = False  # 期望状态：重连后的相机是否重新开始采集
+        self._enum_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._executor = None
+        self._thread = None
+
+    def enumerate(self):
+        with self._enum_lock:
+            return enum_devices(self.tlayer_type)
+
+    def open_all(self, factory, dev_infos=None):
+        """
+        为每台设备创建控制器并发打开、配置，然后启动看门狗
+        :param factory:    factory(cam_idx, dev_info) -> 控制器，在调用线程中执行（Qt 对象留在界面线程）
+        :param dev_infos:  enumerate() 的结果，None 时重新枚举
+        :return:           控制器列表，与设备顺序一致，含打开失败、等待重连的相机
+        """
+        if dev_infos is None:
+            dev_infos = self.enumerate()
+        if not dev_infos:
+            raise RuntimeError("未找到相机设备")
+        self.devices = [CameraDevice(i, factory(i, dev_info)) for i, dev_info in enumerate(dev_infos)]
+        self._executor = ThreadPoolExecutor(max_workers=len(self.devices), thread_name_prefix="DeviceManager")
+
+        start = time.monotonic()
+        online = sum(self._executor.map(self._connect, self.devices))
+        self.on_event(f"{len(self.devices)} 台相机并发打开用时 {(time.monotonic() - start) * 1000:.0f}ms，"
+                      f"在线 {online} 台")
+
+        self._thread = threading.Thread(target=self._watch, name="DeviceWatchdog", daemon=True)
+        self._thread.start()
+        return [device.controller for device in self.devices]
+
+    @property
+    def controllers(self):
+        return [device.controller for device in self.devices]
+
+    def start_all(self):
+        """开始采集；离线的相机上线后自动开始，启动失败的相机关闭后等待重连，不影响其他相机"""
+        self.grabbing = True
+        for device in self.devices:
+            with device.lock:
+                if device.state == STATE_ONLINE and not device.controller.is_grabbing:
+                    try:
+                        self._start(device)
+                    except Exception as e:
+                        self._fail(device, f"相机{device.cam_idx} ({device.serial}) 启动采集失败: {e}")
+
+    def stop_all(self):
+        self.grabbing = False
+        for device in self.devices:
+            with device.lock:
+                if device.controller.is_grabbing:
+                    device.controller.stop_grabbing()
+
+    def close(self):
+        """停止看门狗，等待进行中的重连结束后释放所有相机（之后由调用方 MV_CC_Finalize）"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        for device in self.devices:
+            with device.lock:
+                device.controller.release()
+                device.state = STATE_OFFLINE
+
+    def _start(self, device):
+        """开始采集，失败时抛出 RuntimeError（控制器的 start_grabbing 失败时可能只打印、不抛出）"""
+        device.ttff_ms = None
+        device.grab_started_at = time.monotonic()
+        device.controller.start_grabbing()
+        if not device.controller.is_grabbing:
+            raise RuntimeError(f"Camera {device.cam_idx} 启动采集失败")
+
+    def _fail(self, device, message):
+        """关闭相机，记为离线（掉线重连中的保持 reconnecting），重试间隔后由看门狗重连"""
+        device.controller.close()
+        device.error = message
+        device.next_attempt = time.monotonic() + self.reconnect_interval
+        if device.state == STATE_ONLINE:
+            device.state = STATE_OFFLINE
+        self.on_event(message)
+
+    def _connect(self, device):
+        """
+        打开并配置一台相机，成功后注册异常回调，按期望状态开始采集；
+        任一步失败（含开始采集）时关闭句柄，等待重试，不向调用方抛出
+        """
+        c = device.controller
+        with device.lock:
+            t0 = time.monotonic()
+            try:
+                c.open()
+                t1 = time.monotonic()
+                device.profile_result = c.setup(self.profiles)
+                t2 = time.monotonic()
+                self._register_exception_callback(device)
+                if not device.profile_result.ok:
+                    self.on_event(device.profile_result.summary())
+                device.disconnected = False
+                if self.grabbing:
+                    self._start(device)
+            except Exception as e:
+                self._fail(device, f"相机{device.cam_idx} ({device.serial}) 打开失败: {e}")
+                return False
+            device.open_ms = (t1 - t0) * 1000
+            device.setup_ms = (t2 - t1) * 1000
+            device.error = ""
+            device.state = STATE_ONLINE
+            return True
+
+    def _register_exception_callback(self, device):
+        if device.exception_callback is None:
+            def on_exception(msg_type, user):
+                # SDK 线程中调用，只做标记，由看门狗处理
+                if msg_type == MV_EXCEPTION_DEV_DISCONNECT:
+                    device.disconnected = True
+                    self._wake.set()
+            device.exception_callback = ExceptionCallBack(on_exception)
+        ret = device.controller.cam.MV_CC_RegisterExceptionCallBack(device.exception_callback, None)
+        if ret != 0:
+            # 注册失败时仍靠 IsDeviceConnected 轮询发现掉线
+            self.on_event(f"相机{device.cam_idx} 注册异常回调失败 ret[0x{ret:x}]")
+
+    def _watch(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.watch_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            for device in self.devices:
+                self._check(device)
+
+    def _check(self, device):
+        c = device.controller
+        now = time.monotonic()
+        if device.state == STATE_ONLINE:
+            self._record_first_frame(device)
+            if device.disconnected or not c.cam.MV_CC_IsDeviceConnected():
+                device.state = STATE_RECONNECTING
+                device.dropped_at = now
+                device.drops += 1
+                device.next_attempt = now
+                self.on_event(f"相机{device.cam_idx} ({device.serial}) 掉线，开始重连")
+        if device.state != STATE_ONLINE and not device.pending and now >= device.next_attempt:
+            device.pending = True
+            self._executor.submit(self._reconnect, device)
+
+    def _record_first_frame(self, device):
+        first_frame_at = device.controller.first_frame_at
+        if device.ttff_ms is not None or device.grab_started_at is None or first_frame_at is None:
+            return
+        device.ttff_ms = (first_frame_at - device.grab_started_at) * 1000
+        if device.dropped_at is not None:
+            device.reconnect_ttff_ms = (first_frame_at - device.dropped_at) * 1000
+            device.dropped_at = None
+            self.on_event(f"相机{device.cam_idx} 重连后首帧，距掉线 {device.reconnect_ttff_ms:.0f}ms")
+        else:
+            self.on_event(f"相机{device.cam_idx} 首帧时间 {device.ttff_ms:.0f}ms")
+
+    def _find(self, serial):
+        """按序列号重新枚举，返回设备信息；枚举不到（仍未接上）时返回 None"""
+        try:
+            dev_infos = self.enumerate()
+        except RuntimeError:
+            return None
+        for dev_info in dev_infos:
+            if device_serial(dev_info) == serial:
+                return dev_info
+        return None
+
+    def _reconnect(self, device):
+        """线程池中执行：关闭旧句柄，按序列号找到设备后重新打开、恢复配置"""
+        try:
+            with device.lock:
+                if self._stop.is_set():
+                    return
+                device.controller.close()
+                dev_info = self._find(device.serial)
+                if dev_info is None:
+                    device.next_attempt = time.monotonic() + self.reconnect_interval
+                    return
+                device.controller.dev_info = dev_info
+                if not self._connect(device):
+                    return
+                if device.dropped_at is not None:
+                    device.reconnects += 1
+                    device.reconnect_ms = (time.monotonic() - device.dropped_at) * 1000
+                    self.on_event(f"相机{device.cam_idx} ({device.serial}) 重连成功，用时 {device.reconnect_ms:.0f}ms")
+                else:
+                    self.on_event(f"相机{device.cam_idx} ({device.serial}) 已上线")
+        except Exception as e:
+            device.next_attempt = time.monotonic() + self.reconnect_interval
+            self.on_event(f"相机{device.cam_idx} 重连出错: {e}")
+        finally:
+            device.pending = False
+
+    def stats(self):
+        return [{
+            "cam_idx": d.cam_idx,
+            "serial": d.serial,
+            "state": d.state,
+            "error": d.error,
+            "open_ms": d.open_ms,
+            "setup_ms": d.setup_ms,
+            "ttff_ms": d.ttff_ms,
+            "drops": d.drops,
+            "reconnects": d.reconnects,
+            "reconnect_ms": d.reconnect_ms,
+            "reconnect_ttff_ms": d.reconnect_ttff_ms,
+        } for d in self.devices]
+
+
+def _ms(value):
+    return "-" if value is None else f"{value:.0f}ms"
+
+
+def format_stats(stats):
+    """把 stats() 的结果格式化成每台相机一行的文字"""
+    return "\n".join(f"相机{s['cam_idx']} {s['state']} | 打开 {_ms(s['open_ms'])} 配置 {_ms(s['setup_ms'])} | "
+                     f"首帧 {_ms(s['ttff_ms'])} | 掉线 {s['drops']} 重连 {s['reconnects']} "
+                     f"({_ms(s['reconnect_ms'])}, 首帧 {_ms(s['reconnect_ttff_ms'])})" for s in stats)
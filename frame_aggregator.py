@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+多相机帧同步分组
+
+按帧信息中的时间戳（设备时间戳 nDevTimeStampHigh/Low，或主机时间戳 nHostTimeStamp）把各相机
+同一次曝光的帧归为一组：时间差在 skew 窗口内且来自不同相机的帧属于同一组，组内集齐所有相机后
+立即交给下游；超时未集齐的组按"不完整"处理，组关闭后才到达的帧计为"迟到"。
+
+组与组之间时间间隔超过 trigger_gap 视为新的一次硬件触发，触发内按帧间隔推算连拍序号，
+中间丢帧（nFrameNum 不连续）不会让后续触发序号错位。
+"""
+import threading
+import time
+from collections import deque
+
+TIME_SOURCE_DEVICE = "device"
+TIME_SOURCE_HOST = "host"
+
+
+class FrameGroup:
+    """同一次曝光的多相机帧，frames 为 {cam_idx: 帧}，下游用完后调用 release"""
+    __slots__ = ("trigger_no", "frame_no", "timestamp", "frames", "complete", "_created")
+
+    def __init__(self, timestamp):
+        self.trigger_no = 0
+        self.frame_no = 0  # 触发内的连拍序号，从1开始
+        self.timestamp = timestamp  # 组内第一帧的时间戳（ns）
+        self.frames = {}
+        self.complete = False
+        self._created = time.monotonic()
+
+    def release(self):
+        for frame in self.frames.values():
+            frame.release()
+        self.frames = {}
+
+
+class FrameAggregator:
+    def __init__(self, num_cameras, on_group, skew_ms=5.0, timeout_ms=500.0, trigger_gap_ms=300.0,
+                 frame_interval_ms=None, burst_size=None, time_source=TIME_SOURCE_DEVICE, device_tick_ns=1,
+                 emit_incomplete=True):
+        """
+        :param num_cameras:        参与同步的相机数
+        :param on_group:           on_group(group)，在相机线程或 poll 所在线程中按组的时间顺序逐个调用，
+                                   同一时刻只有一个线程在调用；组的所有权交给下游
+        :param skew_ms:            同组各相机时间戳的最大差值
+        :param timeout_ms:         一组从第一帧到达起的最长等待时间，超时按不完整处理
+        :param trigger_gap_ms:     相邻两组间隔超过该值视为新的触发
+        :param frame_interval_ms:  连拍帧间隔，用于按时间推算连拍序号；None 时按到达顺序递增
+        :param burst_size:         每次触发的帧数，序号超出时也视为新的触发
+        :param time_source:        device 使用设备时间戳（各相机需时钟同步，如开启PTP）；host 使用主机时间戳
+        :param device_tick_ns:     设备时间戳一个计数对应的纳秒数
+        :param emit_incomplete:    不完整的组是否仍交给下游（否则直接释放）
+        """
+        self.num_cameras = num_cameras
+        self.on_group = on_group
+        self.skew = int(skew_ms * 1e6)
+        self.timeout = timeout_ms / 1000.0
+        self.trigger_gap = int(trigger_gap_ms * 1e6)
+        self.frame_interval = int(frame_interval_ms * 1e6) if frame_interval_ms else None
+        self.burst_size = burst_size
+        self.time_source = time_source
+        self.device_tick_ns = device_tick_ns
+        self.emit_incomplete = emit_incomplete
+
+        self._lock = threading.Lock()
+        self._dispatch_lock = threading.Lock()  # 交付队列同一时刻只由一个线程处理，保证输出有序
+        self._ready = deque()  # 已关闭、待交给下游的组，按关闭顺序排列
+        self._open = []  # 按时间排序的未关闭组
+        self._closed = deque(maxlen=64)  # 最近关闭组的时间戳，用于识别迟到帧
+        self._last_frame_num = {}
+        self._trigger_no = -1
+        self._trigger_start = None
+        self._last_group_ts = None
+        self._last_frame_no = 0
+
+        self.groups_complete = 0
+        self.groups_incomplete = 0
+        self.frames_late = 0
+        self.frames_missing = 0  # 由 nFrameNum 不连续推算出的相机端丢帧
+        self.frames_duplicate = 0
+
+    def frame_timestamp(self, frame_info):
+        """从帧信息取时间戳并换算为纳秒"""
+        if self.time_source == TIME_SOURCE_HOST:
+            return frame_info.nHostTimeStamp * 1000000
+        return ((frame_info.nDevTimeStampHigh << 32) | frame_info.nDevTimeStampLow) * self.device_tick_ns
+
+    def add(self, cam_idx, frame, frame_info):
+        """
+        加入一帧，frame 需提供 release()（如缓存池槽位），其引用交给聚合器
+        :return:  该帧被接收返回 True，迟到或重复被丢弃返回 False
+        """
+        ts = self.frame_timestamp(frame_info)
+        accepted = True
+        with self._lock:
+            last = self._last_frame_num.get(cam_idx)
+            if last is not None and frame_info.nFrameNum > last + 1:
+                self.frames_missing += frame_info.nFrameNum - last - 1
+            self._last_frame_num[cam_idx] = frame_info.nFrameNum
+
+            group = self._match(cam_idx, ts)
+            if group is None:
+                if any(abs(ts - t) <= self.skew for t in self._closed):
+                    self.frames_late += 1
+                    accepted = False
+                else:
+                    group = FrameGroup(ts)
+                    self._open.append(group)
+                    self._open.sort(key=lambda g: g.timestamp)
+            if group is not None:
+                if cam_idx in group.frames:
+                    self.frames_duplicate += 1
+                    accepted = False
+                else:
+                    group.frames[cam_idx] = frame
+                    if len(group.frames) == self.num_cameras:
+                        group.complete = True
+            self._collect(time.monotonic())
+
+        if not accepted:
+            frame.release()
+        self._dispatch()
+        return accepted
+
+    def poll(self):
+        """处理超时的组，没有新帧到达时需定期调用"""
+        with self._lock:
+            self._collect(time.monotonic())
+        self._dispatch()
+
+    def flush(self):
+        """停止采集时调用，把所有未关闭的组按当前状态交出，返回时已全部交给下游"""
+        with self._lock:
+            self._collect(float("inf"))
+        self._dispatch(wait=True)
+
+    def _match(self, cam_idx, ts):
+        best = None
+        for group in self._open:
+            diff = abs(ts - group.timestamp)
+            if diff <= self.skew and cam_idx not in group.frames and (best is None or diff < best[0]):
+                best = (diff, group)
+        return best[1] if best else None
+
+    def _collect(self, now):
+        """按时间顺序关闭已集齐或已超时的组，放入交付队列；较早的组未关闭前，较晚的组先等待，保证输出有序"""
+        while self._open:
+            group = self._open[0]
+            if not group.complete and now - group._created < self.timeout:
+                break
+            self._open.pop(0)
+            self._closed.append(group.timestamp)
+            self._number(group)
+            if group.complete:
+                self.groups_complete += 1
+            else:
+                self.groups_incomplete += 1
+            self._ready.append(group)
+
+    def _number(self, group):
+        """推算触发序号与连拍序号"""
+        ts = group.timestamp
+        new_trigger = self._last_group_ts is None or ts - self._last_group_ts > self.trigger_gap
+        if not new_trigger:
+            if self.frame_interval:
+                frame_no = round((ts - self._trigger_start) / self.frame_interval) + 1
+            else:
+                frame_no = self._last_frame_no + 1
+            if self.burst_size and frame_no > self.burst_size:
+                new_trigger = True
+        if new_trigger:
+            self._trigger_no += 1
+            self._trigger_start = ts
+            frame_no = 1
+        group.trigger_no = self._trigger_no
+        group.frame_no = frame_no
+        self._last_group_ts = ts
+        self._last_frame_no = frame_no
+
+    def _dispatch(self, wait=False):
+        """
+        按顺序交出交付队列中的组；其他线程正在交付时，wait=False 直接返回，由该线程接着交出新入队的组
+        """
+        while True:
+            if not self._dispatch_lock.acquire(blocking=wait):
+                return
+            try:
+                while True:
+                    with self._lock:
+                        if not self._ready:
+                            break
+                        group = self._ready.popleft()
+                    if group.complete or self.emit_incomplete:
+                        self.on_group(group)
+                    else:
+                        group.release()
+            finally:
+                self._dispatch_lock.release()
+            # 释放锁之前入队、而入队线程没拿到锁的组，由本线程补交
+            with self._lock:
+                if not self._ready:
+                    return
+
+    def stats(self):
+        with self._lock:
+            return {
+                "groups_complete": self.groups_complete,
+                "groups_incomplete": self.groups_incomplete,
+                "groups_open": len(self._open),
+                "frames_late": self.frames_late,
+                "frames_missing": self.frames_missing,
+                "frames_duplicate": self.frames_duplicate,
+                "trigger_no": self._trigger_no,
+            }
+
+
+def format_stats(stats):
+    """把 stats() 的结果格式化成一行便于界面显示的文字"""
+    return (f"同步组 完整 {stats['groups_complete']} | 不完整 {stats['groups_incomplete']} | "
+            f"迟到 {stats['frames_late']} | 相机丢帧 {stats['frames_missing']}")
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+采集会话容器
+
+每帧单独一个文件时，高频采集会在目录中产生海量小文件，之后遍历、列目录都很慢。
+容器把一个会话（一班次或一台相机）的所有帧顺序追加到同一个文件：
+
+    文件头 | 帧记录 | 帧记录 | ... | 索引 | 文件尾
+
+帧记录 = 固定帧头（相机号、触发序号、连拍序号、设备时间戳、像素格式、宽高等）+ 文件名 + 图像数据（按64字节对齐）。
+图像数据默认不压缩，读取时直接在 mmap 上构造数组视图，不拷贝；也可以按 frame_writer 的存储编码压缩后存放。
+关闭时写入索引与文件尾，读取时一次载入索引即可随机访问；程序异常退出没有索引时，按帧头顺序扫描重建。
+
+    with FrameContainerWriter("session.idfc") as w:
+        w.append(img, cam_idx=0, trigger_no=1, frame_no=1, device_ts=ts)
+    with FrameContainer("session.idfc") as c:
+        img = c.frame(0)
+
+用法：
+    python frame_container.py info <容器文件>
+    python frame_container.py export <容器文件> <输出目录> [bmp|png]
+"""
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+from frame_writer import CODECS, encode_image, write_image
+
+FILE_MAGIC = b"IDETFC01"
+RECORD_MAGIC = b"FRM1"
+TRAILER_MAGIC = b"IDETIDX1"
+FILE_HEADER = struct.Struct("<8sII")  # 魔数, 版本, 保留
+# 魔数, 相机号, 编码, 触发序号, 连拍序号, 相机帧号, 设备时间戳(ns), 主机时间戳(ns), 像素格式, 宽, 高, 通道数, 文件名长度, 数据长度
+RECORD_HEADER = struct.Struct("<4sHHIIIQQIIIHHQ")
+TRAILER = struct.Struct("<8sQQ")  # 魔数, 索引偏移, 帧数
+VERSION = 1
+DATA_ALIGN = 64
+
+# 编码号：0 为原始像素，其余按 frame_writer.CODECS 的顺序
+CODEC_NAMES = (None,) + tuple(CODECS)
+
+INDEX_DTYPE = np.dtype([
+    ("record_offset", "<u8"),
+    ("data_offset", "<u8"),
+    ("data_len", "<u8"),
+    ("device_ts", "<u8"),
+    ("host_ts", "<u8"),
+    ("trigger_no", "<u4"),
+    ("frame_no", "<u4"),
+    ("frame_num", "<u4"),
+    ("pixel_type", "<u4"),
+    ("width", "<u4"),
+    ("height", "<u4"),
+    ("cam_idx", "<u2"),
+    ("codec", "<u2"),
+    ("channels", "<u2"),
+])
+
+
+def _data_offset(record_offset, name_len):
+    start = record_offset + RECORD_HEADER.size + name_len
+    return start + (-start) % DATA_ALIGN
+
+
+def _index_entry(record_offset, fields):
+    (_, cam_idx, codec, trigger_no, frame_no, frame_num, device_ts, host_ts,
+     pixel_type, width, height, channels, name_len, data_len) = fields
+    return (record_offset, _data_offset(record_offset, name_len), data_len, device_ts, host_ts, trigger_no,
+            frame_no, frame_num, pixel_type, width, height, cam_idx, codec, channels)
+
+
+def scan_records(buf, start, end):
+    """
+    从 start 开始按帧头顺序扫描，用于没有索引（异常退出）的容器
+    :return:  (索引条目列表, 最后一条完整记录的结束位置)
+    """
+    entries = []
+    pos = start
+    while pos + RECORD_HEADER.size <= end:
+        fields = RECORD_HEADER.unpack_from(buf, pos)
+        if fields[0] != RECORD_MAGIC:
+            break
+        entry = _index_entry(pos, fields)
+        record_end = entry[1] + entry[2]
+        if record_end > end:
+            break  # 最后一帧没有写完
+        entries.append(entry)
+        pos = record_end
+    return entries, pos
+
+
+class FrameContainerWriter:
+    def __init__(self, path, codec=None, codec_level=None):
+        """
+        打开容器用于追加，文件已存在时在原有帧之后继续写入
+        :param codec:        None 存放原始像素（读取最快），或 frame_writer 的存储编码（如 png）
+        :param codec_level:  编码级别
+        """
+        if codec is not None and codec not in CODECS:
+            raise ValueError(f"不支持的存储编码: {codec}")
+        self.path = path
+        self.codec = codec
+        self.codec_level = codec_level
+        self._lock = threading.Lock()
+        self._entries = []
+
+        exists = os.path.exists(path) and os.path.getsize(path) >= FILE_HEADER.size
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            self._end = self._load_existing()
+        else:
+            self._file.write(FILE_HEADER.pack(FILE_MAGIC, VERSION, 0))
+            self._file.flush()
+            self._end = FILE_HEADER.size
+        self.frames_written = 0
+        self.bytes_written = 0
+
+    def _load_existing(self):
+        """读取已有索引（或扫描重建），截掉旧索引后返回追加位置"""
+        with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            if FILE_HEADER.unpack_from(buf, 0)[0] != FILE_MAGIC:
+                raise RuntimeError(f"不是帧容器文件: {self.path}")
+            index, end = _read_index(buf)
+            if index is None:
+                entries, end = scan_records(buf, FILE_HEADER.size, len(buf))
+                index = np.array(entries, dtype=INDEX_DTYPE)
+        self._entries = [tuple(row) for row in index.tolist()]
+        self._file.truncate(end)
+        self._file.seek(end)
+        return end
+
+    def append(self, image, cam_idx=0, trigger_no=0, frame_no=0, frame_num=0, device_ts=0, pixel_type=0,
+               name="", host_ts=None):
+        """
+        追加一帧（可在多个写盘线程中并发调用），返回写入的字节数
+        :param image:       uint8 图像，形状 (h, w) 或 (h, w, c)
+        :param pixel_type:  相机原始像素格式 enPixelType（存放的是转换后的图像）
+        :param name:        原始文件名（不含扩展名），导出时使用
+        """
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        channels = image.shape[2] if image.ndim == 3 else 1
+        if self.codec is None:
+            data = memoryview(image).cast("B")
+        else:
+            data = encode_image(image, self.codec, self.codec_level)
+        name_bytes = name.encode("utf-8")
+        codec_id = CODEC_NAMES.index(self.codec)
+        host_ts = time.time_ns() if host_ts is None else host_ts
+
+        with self._lock:
+            offset = self._end
+            fields = (RECORD_MAGIC, cam_idx, codec_id, trigger_no, frame_no, frame_num, int(device_ts), host_ts,
+                      pixel_type, width, height, channels, len(name_bytes), len(data))
+            header = RECORD_HEADER.pack(*fields) + name_bytes
+            entry = _index_entry(offset, fields)
+            padding = entry[1] - offset - len(header)
+            self._file.write(header + b"\0" * padding)
+            self._file.write(data)
+            self._end = entry[1] + entry[2]
+            self._entries.append(entry)
+            self.frames_written += 1
+            self.bytes_written += self._end - offset
+        return self._end - offset
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """写入索引与文件尾"""
+        with self._lock:
+            if self._file.closed:
+                return
+            index = np.array(self._entries, dtype=INDEX_DTYPE)
+            self._file.write(index.tobytes())
+            self._file.write(TRAILER.pack(TRAILER_MAGIC, self._end, len(index)))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_index(buf):
+    """读取文件尾的索引，返回 (索引数组, 索引起始位置)；没有有效索引时返回 (None, None)"""
+    if len(buf) < FILE_HEADER.size + TRAILER.size:
+        return None, None
+    magic, index_offset, count = TRAILER.unpack_from(buf, len(buf) - TRAILER.size)
+    if magic != TRAILER_MAGIC or index_offset + count * INDEX_DTYPE.itemsize != len(buf) - TRAILER.size:
+        return None, None
+    index = np.frombuffer(buf, dtype=INDEX_DTYPE, count=count, offset=index_offset).copy()
+    return index, index_offset
+
+
+class FrameContainer:
+    """只读打开容器，mmap 随机访问各帧"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size < FILE_HEADER.size:
+            self._file.close()
+            raise RuntimeError(f"不是帧容器文件: {path}")
+        self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if FILE_HEADER.unpack_from(self._buf, 0)[0] != FILE_MAGIC:
+            self.close()
+            raise RuntimeError(f"不是帧容器文件: {path}")
+        self.index, _ = _read_index(self._buf)
+        self.recovered = self.index is None  # 没有索引（写入时异常退出），已扫描重建
+        if self.recovered:
+            entries, _ = scan_records(self._buf, FILE_HEADER.size, len(self._buf))
+            self.index = np.array(entries, dtype=INDEX_DTYPE)
+
+    def __len__(self):
+        return len(self.index)
+
+    def frame(self, i):
+        """第 i 帧图像；原始像素为 mmap 上的只读视图（容器关闭后失效，需要保留时请 copy）"""
+        entry = self.index[i]
+        start, length = int(entry["data_offset"]), int(entry["data_len"])
+        codec = CODEC_NAMES[entry["codec"]]
+        if codec is None:
+            shape = (int(entry["height"]), int(entry["width"]))
+            if entry["channels"] > 1:
+                shape += (int(entry["channels"]),)
+            return np.frombuffer(self._buf, dtype=np.uint8, count=length, offset=start).reshape(shape)
+        import cv2
+        data = np.frombuffer(self._buf, dtype=np.uint8, count=length, offset=start)
+        return cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
+
+    def name(self, i):
+        """第 i 帧写入时的文件名，没有时按相机号、时间与序号生成"""
+        offset = int(self.index[i]["record_offset"])
+        name_len = RECORD_HEADER.unpack_from(self._buf, offset)[12]
+        name = bytes(self._buf[offset + RECORD_HEADER.size:offset + RECORD_HEADER.size + name_len]).decode("utf-8")
+        if name:
+            return name
+        entry = self.index[i]
+        stamp = time.strftime("%m%d_%H%M%S", time.localtime(int(entry["host_ts"]) / 1e9))
+        return f"type_cam{entry['cam_idx']}_{stamp}_fn{entry['frame_no']}_tn{entry['trigger_no']}"
+
+    def meta(self, i):
+        entry = self.index[i]
+        meta = {key: int(entry[key]) for key in INDEX_DTYPE.names}
+        meta["codec"] = CODEC_NAMES[meta["codec"]]
+        meta["name"] = self.name(i)
+        return meta
+
+    def select(self, cam_idx=None, trigger_no=None, frame_no=None):
+        """按条件筛选，返回帧序号数组"""
+        mask = np.ones(len(self.index), dtype=bool)
+        for key, value in (("cam_idx", cam_idx), ("trigger_no", trigger_no), ("frame_no", frame_no)):
+            if value is not None:
+                mask &= self.index[key] == value
+        return np.flatnonzero(mask)
+
+    def __iter__(self):
+        for i in range(len(self.index)):
+            yield self.meta(i), self.frame(i)
+
+    def close(self):
+        if not self._buf.closed:
+            self._buf.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def export_frames(path, out_dir, codec="bmp", indices=None):
+    """
+    导出为单独的图像文件（供 labelme 标注），文件名使用写入时的原始文件名
+    :return:  导出的文件数
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    with FrameContainer(path) as container:
+        indices = range(len(container)) if indices is None else indices
+        for i in indices:
+            write_image(os.path.join(out_dir, container.name(i)), container.frame(i), codec=codec)
+    return len(indices)
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ("info", "export") or (sys.argv[1] == "export" and len(sys.argv) < 4):
+        print("用法: python frame_container.py info <容器文件>\n"
+              "      python frame_container.py export <容器文件> <输出目录> [bmp|png]")
+        return
+    path = sys.argv[2]
+    if sys.argv[1] == "info":
+        with FrameContainer(path) as container:
+            index = container.index
+            print(f"{path}: {len(container)} 帧, {os.path.getsize(path) / 1024 / 1024:.1f} MB"
+                  f"{'（无索引，已扫描重建）' if container.recovered else ''}")
+            for cam_idx in np.unique(index["cam_idx"]):
+                rows = index[index["cam_idx"] == cam_idx]
+                print(f"  相机 {cam_idx}: {len(rows)} 帧, 触发 {rows['trigger_no'].min()}~{rows['trigger_no'].max()}")
+    else:
+        codec = sys.argv[4] if len(sys.argv) > 4 else "bmp"
+        start = time.perf_counter()
+        count = export_frames(path, sys.argv[3], codec=codec)
+        print(f"已导出 {count} 帧到 {sys.argv[3]}, 耗时 {time.perf_counter() - start:.1f} 秒")
+
+
+if __name__ == "__main__":
+    main()
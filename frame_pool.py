@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+零拷贝帧缓存池
+
+每个相机预先分配一组按页对齐的 NumPy 缓冲区（大小由 PayloadSize 与 BGR 输出尺寸决定），
+回调中把SDK数据拷贝/转换一次写入池中的槽位，之后以引用方式交给下游（界面、写盘），
+各下游用完后显式 release，引用计数归零时槽位自动回到空闲列表。
+稳态采集时不再为每帧分配新的图像数组。
+"""
+import mmap
+import threading
+from collections import deque
+from ctypes import memmove
+
+import numpy as np
+
+PAGE_SIZE = mmap.PAGESIZE
+
+
+def aligned_empty(nbytes, align=PAGE_SIZE):
+    """分配按 align 字节对齐的 uint8 缓冲区"""
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % align
+    return raw[offset:offset + nbytes]
+
+
+class FrameSlot:
+    """缓存池中的一个槽位，持有一块预分配缓冲区及当前帧的信息"""
+    __slots__ = ("pool", "index", "buffer", "address", "size", "refs",
+                 "image", "_shape", "cam_idx", "frame_num", "pixel_type", "timestamp")
+
+    def __init__(self, pool, index, size):
+        self.pool = pool
+        self.index = index
+        self.buffer = aligned_empty(size)
+        self.address = self.buffer.ctypes.data
+        self.size = size
+        self.refs = 0
+        self.image = None  # 当前帧的图像视图
+        self._shape = None
+        self.cam_idx = pool.cam_idx
+        self.frame_num = 0
+        self.pixel_type = 0
+        self.timestamp = 0
+
+    def view(self, shape):
+        """返回指定形状的图像视图，形状不变时复用上一次的视图对象"""
+        if shape != self._shape:
+            nbytes = int(np.prod(shape))
+            if nbytes > self.size:
+                raise ValueError(f"帧大小 {nbytes} 超出缓存槽位 {self.size}")
+            self.image = self.buffer[:nbytes].reshape(shape)
+            self._shape = shape
+        return self.image
+
+    def copy_from(self, src_ptr, nbytes):
+        """从SDK缓冲区地址拷贝 nbytes 到槽位，返回一维视图"""
+        if nbytes > self.size:
+            raise ValueError(f"帧大小 {nbytes} 超出缓存槽位 {self.size}")
+        memmove(self.address, src_ptr, nbytes)  # 调用期间释放GIL，多相机同时拷贝互不阻塞
+        return self.buffer[:nbytes]
+
+    def retain(self):
+        """增加一个引用（交给新的下游前调用）"""
+        self.pool._retain(self)
+        return self
+
+    def release(self):
+        """释放一个引用，引用归零后槽位回到池中"""
+        self.pool._release(self)
+
+
+class FramePool:
+    def __init__(self, slot_bytes, num_slots=16, cam_idx=0):
+        """
+        :param slot_bytes:  每个槽位的字节数
+        :param num_slots:   槽位个数
+        :param cam_idx:     所属相机序号
+        """
+        self.cam_idx = cam_idx
+        self.slot_bytes = slot_bytes
+        self.width = self.height = 0  # for_camera 创建时记录相机当前分辨率
+        self.slots = [FrameSlot(self, i, slot_bytes) for i in range(num_slots)]
+        self._free = deque(self.slots)
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.exhausted = 0  # 无空闲槽位导致的丢帧数
+
+    @classmethod
+    def for_camera(cls, cam, num_slots=16, cam_idx=0, channels=3):
+        """按相机当前的 PayloadSize 与 Width x Height x channels 中较大者分配槽位"""
+        from CameraParams_header import MVCC_INTVALUE_EX  # 调用方已把 ./MvImport 加入 sys.path
+        values = {}
+        for key in ("PayloadSize", "Width", "Height"):
+            st = MVCC_INTVALUE_EX()
+            ret = cam.MV_CC_GetIntValueEx(key, st)
+            if ret != 0:
+                raise RuntimeError(f"Camera {cam_idx} 获取{key}失败 ret[0x{ret:x}]")
+            values[key] = st.nCurValue
+        slot_bytes = max(values["PayloadSize"], values["Width"] * values["Height"] * channels)
+        pool = cls(slot_bytes, num_slots=num_slots, cam_idx=cam_idx)
+        pool.width, pool.height = values["Width"], values["Height"]
+        return pool
+
+    def acquire(self):
+        """取出一个空闲槽位（引用计数为1），池耗尽时返回 None"""
+        with self._lock:
+            if not self._free:
+                self.exhausted += 1
+                return None
+            slot = self._free.popleft()
+            slot.refs = 1
+            self.acquired += 1
+            return slot
+
+    def _retain(self, slot):
+        with self._lock:
+            if slot.refs <= 0:
+                raise RuntimeError(f"槽位 {slot.index} 已被释放，不能再引用")
+            slot.refs += 1
+
+    def _release(self, slot):
+        with self._lock:
+            if slot.refs <= 0:
+                raise RuntimeError(f"槽位 {slot.index} 重复释放")
+            slot.refs -= 1
+            if slot.refs == 0:
+                self._free.append(slot)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "slots": len(self.slots),
+                "free": len(self._free),
+                "slot_bytes": self.slot_bytes,
+                "acquired": self.acquired,
+                "exhausted": self.exhausted,
+            }
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+异步落盘写入器
+
+采集回调只负责把帧放进有界队列，编码与文件 I/O 由后台线程池完成，
+慢盘不会再阻塞 SDK 的取流线程。队列满时的处理策略可选：
+    block        阻塞等待（可设置超时，超时后丢弃当前帧）
+    drop_oldest  丢弃队列中最旧的一帧
+    drop_newest  丢弃当前新到的一帧
+
+存储编码可选（均为无损），设置后文件扩展名按编码替换：
+    bmp           不压缩（默认，保持文件名中的扩展名）
+    png           level 为压缩级别 0~9，越大越小越慢
+    webp          无损 WebP，压缩率高但编码最慢
+    tiff_lzw / tiff_deflate / tiff_zstd   TIFF 压缩，tiff_zstd 需 OpenCV 的 libtiff 支持 ZSTD
+
+设置 container（frame_container.FrameContainerWriter）后不再逐帧建文件，而是追加到会话容器中。
+"""
+import os
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+POLICY_BLOCK = "block"
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_DROP_NEWEST = "drop_newest"
+POLICIES = (POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_DROP_NEWEST)
+
+CODEC_BMP = "bmp"
+CODEC_PNG = "png"
+CODEC_WEBP = "webp"
+CODEC_TIFF_LZW = "tiff_lzw"
+CODEC_TIFF_DEFLATE = "tiff_deflate"
+CODEC_TIFF_ZSTD = "tiff_zstd"
+# 编码名 -> (扩展名, 默认级别)
+CODECS = {
+    CODEC_BMP: (".bmp", None),
+    CODEC_PNG: (".png", 1),
+    CODEC_WEBP: (".webp", None),
+    CODEC_TIFF_LZW: (".tiff", None),
+    CODEC_TIFF_DEFLATE: (".tiff", None),
+    CODEC_TIFF_ZSTD: (".tiff", None),
+}
+_TIFF_COMPRESSION = {CODEC_TIFF_LZW: 5, CODEC_TIFF_DEFLATE: 8, CODEC_TIFF_ZSTD: 50000}
+_codec_support = {}
+
+
+def encode_params(codec, level=None):
+    """返回 (扩展名, cv2.imencode 参数)"""
+    if codec not in CODECS:
+        raise ValueError(f"不支持的存储编码: {codec}")
+    ext, default_level = CODECS[codec]
+    level = default_level if level is None else level
+    if codec == CODEC_PNG:
+        return ext, [cv2.IMWRITE_PNG_COMPRESSION, int(level)]
+    if codec == CODEC_WEBP:
+        return ext, [cv2.IMWRITE_WEBP_QUALITY, 101]  # 质量大于100为无损
+    if codec in _TIFF_COMPRESSION:
+        return ext, [cv2.IMWRITE_TIFF_COMPRESSION, _TIFF_COMPRESSION[codec]]
+    return ext, []
+
+
+def codec_available(codec):
+    """当前 OpenCV 能否使用该编码（例如 libtiff 未编译 ZSTD 时 tiff_zstd 不可用）"""
+    if codec not in _codec_support:
+        ext, params = encode_params(codec)
+        try:
+            ok, _ = cv2.imencode(ext, np.zeros((8, 8, 3), dtype=np.uint8), params)
+        except cv2.error:
+            ok = False
+        _codec_support[codec] = bool(ok)
+    return _codec_support[codec]
+
+
+def codec_filename(filename, codec):
+    """按编码替换文件扩展名"""
+    if codec is None:
+        return filename
+    return os.path.splitext(filename)[0] + CODECS[codec][0]
+
+
+def encode_image(img, codec=None, level=None, ext=".bmp"):
+    """编码图像，codec 为 None 时按扩展名编码，返回编码后的数组"""
+    params = []
+    if codec is not None:
+        ext, params = encode_params(codec, level)
+    ok, buf = cv2.imencode(ext, img, params)
+    if not ok:
+        raise RuntimeError(f"图像编码失败 ({codec or ext})")
+    return buf
+
+
+def write_image(filename, img, codec=None, level=None):
+    """同步编码并写盘（不经过写盘线程的脚本使用），返回 (实际文件名, 字节数)"""
+    filename = codec_filename(filename, codec)
+    buf = encode_image(img, codec, level, os.path.splitext(filename)[1] or ".bmp")
+    with open(filename, "wb") as f:
+        f.write(buf)
+    return filename, buf.nbytes
+
+
+class FrameWriter:
+    def __init__(self, max_queue=48, num_workers=2, policy=POLICY_BLOCK, block_timeout=None, rate_window=2.0,
+                 codec=None, codec_level=None, container=None):
+        """
+        :param max_queue:      队列最大帧数
+        :param num_workers:    写盘线程数
+        :param policy:         队列满时的策略，见 POLICIES
+        :param block_timeout:  block 策略下的最长等待秒数，None 表示一直等待
+        :param rate_window:    统计写盘速率的滑动窗口（秒）
+        :param codec:          存储编码，见 CODECS；None 时按文件名扩展名编码
+        :param codec_level:    编码级别（png 的压缩级别），None 使用默认值
+        :param container:      会话容器，设置后帧追加到容器（容器自身的编码设置生效），filename 只作为帧名记录
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"不支持的背压策略: {policy}")
+        if codec is not None and not codec_available(codec):
+            raise RuntimeError(f"当前 OpenCV 不支持存储编码: {codec}")
+        self.codec = codec
+        self.codec_level = codec_level
+        self.container = container
+        self.max_queue = max_queue
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.rate_window = rate_window
+
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._running = True
+        self._busy = 0
+
+        # 统计计数
+        self.frames_submitted = 0
+        self.frames_written = 0
+        self.bytes_written = 0
+        self.bytes_raw = 0  # 编码前的图像字节数，用于统计压缩率
+        self.encode_time = 0.0
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+        self.write_errors = 0
+        self.max_depth = 0
+        self._recent = deque()  # (完成时间, 字节数)，用于计算滑动窗口速率
+
+        self._workers = []
+        for i in range(num_workers):
+            t = threading.Thread(target=self._worker, name=f"FrameWriter-{i}", daemon=True)
+            t.start()
+            self._workers.append(t)
+
+    def submit(self, filename, img, on_done=None, meta=None):
+        """
+        提交一帧待写入的图像，返回 False 表示该帧被丢弃
+        :param on_done:  写完或被丢弃后调用的回调（例如释放缓存池槽位）
+        :param meta:     写入容器时的帧头信息（cam_idx、trigger_no、frame_no、device_ts 等）
+        """
+        evicted = None  # drop_oldest 策略下被挤出的旧帧回调
+        with self._cond:
+            accepted = self._running
+            if accepted:
+                self.frames_submitted += 1
+            if accepted and len(self._queue) >= self.max_queue:
+                if self.policy == POLICY_DROP_NEWEST:
+                    self.dropped_newest += 1
+                    accepted = False
+                elif self.policy == POLICY_DROP_OLDEST:
+                    evicted = self._queue.popleft()[3]
+                    self.dropped_oldest += 1
+                else:
+                    ok = self._cond.wait_for(lambda: len(self._queue) < self.max_queue or not self._running,
+                                             timeout=self.block_timeout)
+                    if not ok or not self._running:
+                        self.dropped_newest += 1
+                        accepted = False
+            if accepted:
+                self._queue.append((filename, img, meta, on_done))
+                self.max_depth = max(self.max_depth, len(self._queue))
+                self._cond.notify_all()
+
+        if evicted is not None:
+            evicted()
+        if not accepted and on_done is not None:
+            on_done()
+        return accepted
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or not self._running)
+                if not self._queue:
+                    return
+                filename, img, meta, on_done = self._queue.popleft()
+                self._busy += 1
+                self._cond.notify_all()
+
+            nbytes = 0
+            raw = img.nbytes
+            try:
+                nbytes, encode_time = self._write(filename, img, meta)
+            except Exception as e:
+                print(f"写入失败: {filename} 错误: {e}")
+            if on_done is not None:
+                on_done()
+
+            with self._cond:
+                self._busy -= 1
+                if nbytes:
+                    now = time.monotonic()
+                    self.frames_written += 1
+                    self.bytes_written += nbytes
+                    self.bytes_raw += raw
+                    self.encode_time += encode_time
+                    self._recent.append((now, nbytes))
+                else:
+                    self.write_errors += 1
+                self._cond.notify_all()
+
+    def _write(self, filename, img, meta=None):
+        """编码并写盘，返回 (写入的字节数, 编码耗时)"""
+        if self.container is not None:
+            start = time.perf_counter()
+            name = os.path.splitext(os.path.basename(filename))[0]
+            nbytes = self.container.append(img, name=name, **(meta or {}))
+            return nbytes, time.perf_counter() - start
+        filename = codec_filename(filename, self.codec)
+        start = time.perf_counter()
+        buf = encode_image(img, self.codec, self.codec_level, os.path.splitext(filename)[1] or ".bmp")
+        encode_time = time.perf_counter() - start
+        with open(filename, "wb") as f:
+            f.write(buf)
+        return buf.nbytes, encode_time
+
+    def stats(self):
+        """返回队列深度、写盘速率与丢帧计数"""
+        with self._cond:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0][0] > self.rate_window:
+                self._recent.popleft()
+            recent_bytes = sum(n for _, n in self._recent)
+            return {
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self.max_depth,
+                "in_flight": self._busy,
+                "frames_submitted": self.frames_submitted,
+                "frames_written": self.frames_written,
+                "bytes_written": self.bytes_written,
+                "bytes_per_sec": recent_bytes / self.rate_window,
+                "compression_ratio": self.bytes_written / self.bytes_raw if self.bytes_raw else 1.0,
+                "encode_ms_mean": self.encode_time * 1000 / self.frames_written if self.frames_written else 0.0,
+                "dropped_oldest": self.dropped_oldest,
+                "dropped_newest": self.dropped_newest,
+                "dropped": self.dropped_oldest + self.dropped_newest,
+                "write_errors": self.write_errors,
+            }
+
+    def flush(self, timeout=None):
+        """等待队列中的帧全部写完"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and self._busy == 0, timeout=timeout)
+
+    def close(self, wait=True):
+        """停止写盘线程，wait=True 时先把剩余帧写完"""
+        if wait:
+            self.flush()
+        with self._cond:
+            self._running = False
+            pending = [item[3] for item in self._queue if item[3] is not None]
+            self._queue.clear()
+            self._cond.notify_all()
+        for on_done in pending:
+            on_done()
+        for t in self._workers:
+            t.join()
+
+
+def format_stats(stats):
+    """把 stats() 的结果格式化成一行便于界面显示的文字"""
+    return (f"写盘队列 {stats['queue_depth']}/{stats['max_queue_depth']} | "
+            f"{stats['bytes_per_sec'] / 1024 / 1024:.1f} MB/s | "
+            f"已写 {stats['frames_written']} 帧 | "
+            f"丢帧 {stats['dropped']} (旧{stats['dropped_oldest']}/新{stats['dropped_newest']})")
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+主动取流线程
+
+不注册回调，而是由每个相机一个专用线程循环调用 MV_CC_GetImageBuffer（带超时）取帧，
+取到后立即拷贝到缓存池并 MV_CC_FreeImageBuffer 归还SDK缓冲区，再在本线程中交给下游处理。
+SDK的取流线程不再执行任何 Python 代码（不持有GIL），缓存节点数与取流策略可按需调整：
+    MV_GrabStrategy_OneByOne          从旧到新逐帧获取（默认，不丢帧）
+    MV_GrabStrategy_LatestImagesOnly  只取最新一帧，其余清除
+    MV_GrabStrategy_LatestImages      取最新的 output_queue_size 帧
+    MV_GrabStrategy_UpcomingImage     等待下一帧
+"""
+import threading
+from ctypes import c_void_p, cast
+
+from CameraParams_header import MV_FRAME_OUT, MV_GrabStrategy_OneByOne, MV_GrabStrategy_LatestImages
+from MvErrorDefine_const import MV_OK, MV_E_NODATA, MV_E_GC_TIMEOUT
+from frame_pool import FramePool
+
+GRAB_MODE_CALLBACK = "callback"
+GRAB_MODE_PULL = "pull"
+GRAB_MODES = (GRAB_MODE_CALLBACK, GRAB_MODE_PULL)
+
+
+class GrabThread:
+    def __init__(self, cam, on_frame, cam_idx=0, pool=None, timeout_ms=1000, node_num=16,
+                 strategy=MV_GrabStrategy_OneByOne, output_queue_size=None):
+        """
+        :param cam:                已打开的相机实例
+        :param on_frame:           on_frame(slot, frame_info)，在取流线程中调用；slot 中为原始数据，
+                                   返回后取流线程释放自己的引用，下游需要保留时自行 retain
+        :param pool:               存放原始数据的缓存池，None 时按 PayloadSize 创建
+        :param timeout_ms:         单次 GetImageBuffer 的超时
+        :param node_num:           SDK缓存节点数（SetImageNodeNum），None 表示不修改
+        :param strategy:           取流策略（SetGrabStrategy）
+        :param output_queue_size:  LatestImages 策略下的输出队列长度
+        """
+        self.cam = cam
+        self.on_frame = on_frame
+        self.cam_idx = cam_idx
+        self.pool = pool or FramePool.for_camera(cam, num_slots=4, cam_idx=cam_idx, channels=1)
+        self.timeout_ms = timeout_ms
+        self.node_num = node_num
+        self.strategy = strategy
+        self.output_queue_size = output_queue_size
+        self._frame = MV_FRAME_OUT()  # 只分配一次
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.frames = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.pool_exhausted = 0
+        self.handler_errors = 0
+
+    def configure(self):
+        """取流前设置缓存节点数与取流策略，需在 MV_CC_StartGrabbing 之前调用"""
+        if self.node_num is not None:
+            ret = self.cam.MV_CC_SetImageNodeNum(self.node_num)
+            if ret != MV_OK:
+                raise RuntimeError(f"Camera {self.cam_idx} 设置缓存节点数失败 ret[0x{ret:x}]")
+        ret = self.cam.MV_CC_SetGrabStrategy(self.strategy)
+        if ret != MV_OK:
+            raise RuntimeError(f"Camera {self.cam_idx} 设置取流策略失败 ret[0x{ret:x}]")
+        if self.strategy == MV_GrabStrategy_LatestImages and self.output_queue_size:
+            ret = self.cam.MV_CC_SetOutputQueueSize(self.output_queue_size)
+            if ret != MV_OK:
+                raise RuntimeError(f"Camera {self.cam_idx} 设置输出队列长度失败 ret[0x{ret:x}]")
+
+    def start(self):
+        """启动取流线程（相机需已 StartGrabbing），可在 stop 之后再次启动"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"GrabThread-{self.cam_idx}", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait=True):
+        """
+        通知线程退出；wait=True 时等待线程结束，最长一个取图超时周期
+        先 stop(wait=False) 再 MV_CC_StopGrabbing，可让阻塞中的 GetImageBuffer 立即返回
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        if wait:
+            self._thread.join(self.timeout_ms / 1000.0 + 1.0)
+            self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        cam = self.cam
+        frame = self._frame
+        info = frame.stFrameInfo
+        size_warned = False
+        while not self._stop.is_set():
+            ret = cam.MV_CC_GetImageBuffer(frame, self.timeout_ms)
+            if ret in (MV_E_NODATA, MV_E_GC_TIMEOUT):
+                self.timeouts += 1
+                continue
+            if ret != MV_OK:
+                self.errors += 1
+                self._stop.wait(0.01)  # 取流已停止等情况，避免空转
+                continue
+
+            # 拷贝到缓存池后立即归还SDK缓冲区
+            slot = self.pool.acquire()
+            oversized = slot is not None and info.nFrameLen > slot.size
+            if slot is not None and not oversized:
+                slot.copy_from(cast(frame.pBufAddr, c_void_p).value, info.nFrameLen)
+            cam.MV_CC_FreeImageBuffer(frame)
+            if slot is None:
+                self.pool_exhausted += 1
+                continue
+            if oversized:
+                # 帧比槽位大（如重连后参数文件改了分辨率、像素格式），丢弃该帧，取流线程继续运行
+                slot.release()
+                self.errors += 1
+                if not size_warned:
+                    size_warned = True
+                    print(f"Camera {self.cam_idx} 帧大小 {info.nFrameLen} 超出缓存槽位 {slot.size}，丢弃")
+                continue
+
+            slot.frame_num = info.nFrameNum
+            slot.pixel_type = info.enPixelType
+            slot.timestamp = (info.nDevTimeStampHigh << 32) | info.nDevTimeStampLow
+            self.frames += 1
+            try:
+                self.on_frame(slot, info)
+            except Exception as e:
+                self.handler_errors += 1
+                print(f"Camera {self.cam_idx} 处理帧 {info.nFrameNum} 出错: {e}")
+            finally:
+                slot.release()
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "pool_exhausted": self.pool_exhausted,
+            "handler_errors": self.handler_errors,
+        }
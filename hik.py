@@ -3,13 +3,14 @@ import sys
 import numpy as np
 from os import getcwd
 import cv2
-import msvcrt
 from ctypes import *
 import time
 import datetime
 
 sys.path.append("./MvImport")
 from MvCameraControl_class import *
+from frame_pool import FramePool
+from pixel_convert import FrameConverter, PIXEL_FORMATS, pixel_format_name
 
 
 # 枚举设备
@@ -420,22 +421,19 @@ def image_show(image, name):
 
 0
 # 需要显示的图像数据转换
+frame_converter = FrameConverter()
+display_buf = {}  # 按分辨率复用的 BGR 显示缓冲区
+
+
 def image_control(data, stFrameInfo):
-    if stFrameInfo.enPixelType == 17301505:
-        image = data.reshape((stFrameInfo.nHeight, stFrameInfo.nWidth))
-        image_show(image=image, name=stFrameInfo.nHeight)
-    elif stFrameInfo.enPixelType == 17301514:
-        data = data.reshape(stFrameInfo.nHeight, stFrameInfo.nWidth, -1)
-        image = cv2.cvtColor(data, cv2.COLOR_BAYER_GB2RGB)
-        image_show(image=image, name=stFrameInfo.nHeight)
-    elif stFrameInfo.enPixelType == 35127316:
-        data = data.reshape(stFrameInfo.nHeight, stFrameInfo.nWidth, -1)
-        image = cv2.cvtColor(data, cv2.COLOR_RGB2BGR)
-        image_show(image=image, name=stFrameInfo.nHeight)
-    elif stFrameInfo.enPixelType == 34603039:
-        data = data.reshape(stFrameInfo.nHeight, stFrameInfo.nWidth, -1)
-        image = cv2.cvtColor(data, cv2.COLOR_YUV2BGR_Y422)
-        image_show(image=image, name=stFrameInfo.nHeight)
+    h, w = stFrameInfo.nHeight, stFrameInfo.nWidth
+    if (h, w) not in display_buf:
+        display_buf[(h, w)] = np.empty((h, w, 3), dtype=np.uint8)
+    image = frame_converter.convert(stFrameInfo.enPixelType, data, h, w, display_buf[(h, w)])
+    if image is None:
+        print("不支持的像素格式: %s" % pixel_format_name(stFrameInfo.enPixelType))
+        return
+    image_show(image=image, name=stFrameInfo.nHeight)
 
 
 # 主动图像采集
@@ -448,50 +446,24 @@ def access_get_image(cam, active_way="getImagebuffer"):
     if active_way == "getImagebuffer":
         stOutFrame = MV_FRAME_OUT()
         memset(byref(stOutFrame), 0, sizeof(stOutFrame))
+        # 预分配帧缓存池，取到的帧拷贝一次进槽位后立即归还SDK缓存
+        frame_pool = FramePool.for_camera(cam, num_slots=2)
         while True:
             ret = cam.MV_CC_GetImageBuffer(stOutFrame, 1000)
-            if None != stOutFrame.pBufAddr and 0 == ret and stOutFrame.stFrameInfo.enPixelType == 17301505:
+            if None != stOutFrame.pBufAddr and 0 == ret and stOutFrame.stFrameInfo.enPixelType in PIXEL_FORMATS:
                 print("get one frame: Width[%d], Height[%d], nFrameNum[%d]" % (
                 stOutFrame.stFrameInfo.nWidth, stOutFrame.stFrameInfo.nHeight, stOutFrame.stFrameInfo.nFrameNum))
-                pData = (c_ubyte * stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight)()
-                cdll.msvcrt.memcpy(byref(pData), stOutFrame.pBufAddr,
-                                   stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight)
-                data = np.frombuffer(pData, count=int(stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight),
-                                     dtype=np.uint8)
+                nbytes = stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight * \
+                    PIXEL_FORMATS[stOutFrame.stFrameInfo.enPixelType].src_channels
+                slot = frame_pool.acquire()
+                data = slot.copy_from(stOutFrame.pBufAddr, nbytes)
+                nRet = cam.MV_CC_FreeImageBuffer(stOutFrame)
                 #import pdb; pdb.set_trace()
                 image_control(data=data, stFrameInfo=stOutFrame.stFrameInfo)
-            elif None != stOutFrame.pBufAddr and 0 == ret and stOutFrame.stFrameInfo.enPixelType == 17301514:
-                print("get one frame: Width[%d], Height[%d], nFrameNum[%d]" % (
-                stOutFrame.stFrameInfo.nWidth, stOutFrame.stFrameInfo.nHeight, stOutFrame.stFrameInfo.nFrameNum))
-                pData = (c_ubyte * stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight)()
-                cdll.msvcrt.memcpy(byref(pData), stOutFrame.pBufAddr,
-                                   stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight)
-                data = np.frombuffer(pData, count=int(stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight),
-                                     dtype=np.uint8)
-                image_control(data=data, stFrameInfo=stOutFrame.stFrameInfo)
-            elif None != stOutFrame.pBufAddr and 0 == ret and stOutFrame.stFrameInfo.enPixelType == 35127316:
-                print("get one frame: Width[%d], Height[%d], nFrameNum[%d]" % (
-                stOutFrame.stFrameInfo.nWidth, stOutFrame.stFrameInfo.nHeight, stOutFrame.stFrameInfo.nFrameNum))
-                pData = (c_ubyte * stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight * 3)()
-                cdll.msvcrt.memcpy(byref(pData), stOutFrame.pBufAddr,
-                                   stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight * 3)
-                data = np.frombuffer(pData,
-                                     count=int(stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight * 3),
-                                     dtype=np.uint8)
-                image_control(data=data, stFrameInfo=stOutFrame.stFrameInfo)
-            elif None != stOutFrame.pBufAddr and 0 == ret and stOutFrame.stFrameInfo.enPixelType == 34603039:
-                print("get one frame: Width[%d], Height[%d], nFrameNum[%d]" % (
-                stOutFrame.stFrameInfo.nWidth, stOutFrame.stFrameInfo.nHeight, stOutFrame.stFrameInfo.nFrameNum))
-                pData = (c_ubyte * stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight * 2)()
-                cdll.msvcrt.memcpy(byref(pData), stOutFrame.pBufAddr,
-                                   stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight * 2)
-                data = np.frombuffer(pData,
-                                     count=int(stOutFrame.stFrameInfo.nWidth * stOutFrame.stFrameInfo.nHeight * 2),
-                                     dtype=np.uint8)
-                image_control(data=data, stFrameInfo=stOutFrame.stFrameInfo)
+                slot.release()
             else:
                 print("no data[0x%x]" % ret)
-            nRet = cam.MV_CC_FreeImageBuffer(stOutFrame)
+                nRet = cam.MV_CC_FreeImageBuffer(stOutFrame)
 
     elif active_way == "getoneframetimeout":
         stParam = MVCC_INTVALUE_EX()
@@ -516,43 +488,23 @@ def access_get_image(cam, active_way="getImagebuffer"):
 
 
 # 回调取图采集
-winfun_ctype = WINFUNCTYPE
+winfun_ctype = MV_CALLBACK_FUNCTYPE  # Windows 为 WINFUNCTYPE，Linux 为 CFUNCTYPE
 stFrameInfo = POINTER(MV_FRAME_OUT_INFO_EX)
 pData = POINTER(c_ubyte)
 FrameInfoCallBack = winfun_ctype(None, pData, stFrameInfo, c_void_p)
 
 
 def image_callback(pData, pFrameInfo, pUser):
-    global img_buff
-    img_buff = None
     stFrameInfo = cast(pFrameInfo, POINTER(MV_FRAME_OUT_INFO_EX)).contents
     if stFrameInfo:
         print("get one frame: Width[%d], Height[%d], nFrameNum[%d]" % (
         stFrameInfo.nWidth, stFrameInfo.nHeight, stFrameInfo.nFrameNum))
-    if img_buff is None and stFrameInfo.enPixelType == 17301505:
-        img_buff = (c_ubyte * stFrameInfo.nWidth * stFrameInfo.nHeight)()
-        cdll.msvcrt.memcpy(byref(img_buff), pData, stFrameInfo.nWidth * stFrameInfo.nHeight)
-        data = np.frombuffer(img_buff, count=int(stFrameInfo.nWidth * stFrameInfo.nHeight), dtype=np.uint8)
-        image_control(data=data, stFrameInfo=stFrameInfo)
-        del img_buff
-    elif img_buff is None and stFrameInfo.enPixelType == 17301514:
-        img_buff = (c_ubyte * stFrameInfo.nWidth * stFrameInfo.nHeight)()
-        cdll.msvcrt.memcpy(byref(img_buff), pData, stFrameInfo.nWidth * stFrameInfo.nHeight)
-        data = np.frombuffer(img_buff, count=int(stFrameInfo.nWidth * stFrameInfo.nHeight), dtype=np.uint8)
-        image_control(data=data, stFrameInfo=stFrameInfo)
-        del img_buff
-    elif img_buff is None and stFrameInfo.enPixelType == 35127316:
-        img_buff = (c_ubyte * stFrameInfo.nWidth * stFrameInfo.nHeight * 3)()
-        cdll.msvcrt.memcpy(byref(img_buff), pData, stFrameInfo.nWidth * stFrameInfo.nHeight * 3)
-        data = np.frombuffer(img_buff, count=int(stFrameInfo.nWidth * stFrameInfo.nHeight * 3), dtype=np.uint8)
-        image_control(data=data, stFrameInfo=stFrameInfo)
-        del img_buff
-    elif img_buff is None and stFrameInfo.enPixelType == 34603039:
-        img_buff = (c_ubyte * stFrameInfo.nWidth * stFrameInfo.nHeight * 2)()
-        cdll.msvcrt.memcpy(byref(img_buff), pData, stFrameInfo.nWidth * stFrameInfo.nHeight * 2)
-        data = np.frombuffer(img_buff, count=int(stFrameInfo.nWidth * stFrameInfo.nHeight * 2), dtype=np.uint8)
-        image_control(data=data, stFrameInfo=stFrameInfo)
-        del img_buff
+    fmt = PIXEL_FORMATS.get(stFrameInfo.enPixelType)
+    if fmt is None:
+        return
+    # 转换时直接从SDK缓冲区读取并写入显示缓冲区，无需先拷贝一份
+    data = np.ctypeslib.as_array(pData, shape=(stFrameInfo.nWidth * stFrameInfo.nHeight * fmt.src_channels,))
+    image_control(data=data, stFrameInfo=stFrameInfo)
 
 
 CALL_BACK_FUN = FrameInfoCallBack(image_callback)
@@ -642,8 +594,7 @@ def main():
     # 开启设备取流
     start_grab_and_get_data_size(cam)
     # 当使用 回调取流时，需要在此处添加
-    print("press a key to stop grabbing.")
-    msvcrt.getch()
+    input("press Enter to stop grabbing.")
     # 关闭设备与销毁句柄
     close_and_destroy_device(cam)
 
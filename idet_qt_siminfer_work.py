@@ -2,13 +2,24 @@ import sys
 import json
 import random
 import os
+import threading
 import cv2
 import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QLabel, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QScrollArea
 )
 from PyQt5.QtGui import QImage, QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
+from infer_service import InferenceService, SimDetector, boxes_to_shapes, DEFAULT_DETECTOR
+from session_reader import SessionReader, CONTAINER_EXTENSION, read_image
+
+# 推理服务配置：检测器在独立进程中运行，图像经共享内存传递
+INFER_DETECTOR = DEFAULT_DETECTOR  # "模块:类名"，默认模拟检测器
+INFER_WORKERS = 2
+INFER_QUEUE_DEPTH = 4
+INFER_LATENCY_MS = 0  # 模拟检测器的单张耗时
+SESSION_PREFETCH = 8  # 检测整个会话时预读的帧数
+SUBMIT_TIMEOUT = 1.0  # 界面线程等待推理服务空闲槽位的最长时间（秒）
 
 
 # 定义数字与中文说明的映射字典
@@ -53,25 +64,9 @@ LABEL_DICT = {
 }
 
 
-# 模拟推理函数
+# 模拟推理函数（同步调用，与推理服务的默认检测器一致）
 def generate_cv_boxes(cv_image):
-    # 获取图像尺寸 (OpenCV的height在前)
-    height, width = cv_image.shape[:2]
-    num_boxes = 3
-    boxes = []
-    for _ in range(num_boxes):
-        # 生成随机坐标（保持浮点精度）
-        x1 = round(random.uniform(0, width - 1), 5)  # 防止溢出右边界
-        y1 = round(random.uniform(0, height - 1), 5)  # 防止溢出下边界
-        x2 = round(random.uniform(x1, width), 5)
-        y2 = round(random.uniform(y1, height), 5)
-
-        boxes.append({
-            "label": str(random.randint(1, 37)),
-            "points": [[x1, y1], [x2, y2]]
-        })
-
-    return boxes
+    return boxes_to_shapes(SimDetector().predict([cv_image])[0])
 
 def simdefect_json(output_path="box.json"):
     # 生成有效边界框坐标‌:ml-citation{ref="1,2" data="citationList"}
@@ -129,15 +124,30 @@ def resize_image(image, width, height):
     return cv2.resize(image, (width, height))
 
 
+def to_bgr(image):
+    """灰度或带 alpha 的图像转为 BGR 三通道（绘制标注和显示都按 BGR 处理）"""
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+    if image.shape[2] == 4:
+        return cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+    return image
+
+
 class ImageViewer(QWidget):
     """
     PyQt5 图像查看器
     """
+    result_ready = pyqtSignal(object, object, object)  # shapes, 原图缩略图, 标注图缩略图
 
     def __init__(self):
         super().__init__()
         self.image_path = None
         self.json_path = None
+        self.session_thread = None
+        self.session_stop = threading.Event()
+        self.service = InferenceService(num_workers=INFER_WORKERS, queue_depth=INFER_QUEUE_DEPTH,
+                                        detector=INFER_DETECTOR, detector_kwargs={"latency_ms": INFER_LATENCY_MS})
+        self.result_ready.connect(self.show_result)
         self.init_ui()
 
     def init_ui(self):
@@ -164,10 +174,18 @@ class ImageViewer(QWidget):
         self.load_button = QPushButton("开始检测")
         self.load_button.setStyleSheet("background-color: #4A4A4A; color: white; padding: 10px; font-size: 16px;")
         self.load_button.clicked.connect(self.load_bmp)
+        self.session_button = QPushButton("检测会话")
+        self.session_button.setStyleSheet("background-color: #4A4A4A; color: white; padding: 10px; font-size: 16px;")
+        self.session_button.clicked.connect(self.load_session)
+        self.container_button = QPushButton("检测容器")
+        self.container_button.setStyleSheet("background-color: #4A4A4A; color: white; padding: 10px; font-size: 16px;")
+        self.container_button.clicked.connect(self.load_container)
         self.close_button = QPushButton("停止")
         self.close_button.setStyleSheet("background-color: #4A4A4A; color: white; padding: 10px; font-size: 16px;")
         self.close_button.clicked.connect(self.close)
         button_layout.addWidget(self.load_button)
+        button_layout.addWidget(self.session_button)
+        button_layout.addWidget(self.container_button)
         button_layout.addWidget(self.close_button)
         left_layout.addLayout(button_layout)
 
@@ -244,26 +262,82 @@ class ImageViewer(QWidget):
         # with open(json_path, "r", encoding="utf-8") as f:
         #     data = json.load(f)
 
-        image = cv2.imread(self.image_path)
+        image = read_image(self.image_path)  # BMP 直接映射文件，不经 cv2 解码拷贝
+        if image is None:
+            print(f"Failed to load image: {self.image_path}")
+            return
+        image = to_bgr(image)
 
-        ########### 调用分类推理函数 #############
-        data = generate_cv_boxes(image)
+        ########### 提交推理服务，结果在后台线程中绘制后回到主线程显示 #############
+        try:
+            future = self.service.submit(image, timeout=SUBMIT_TIMEOUT)  # 不在界面线程中无限等待
+        except (TimeoutError, RuntimeError) as e:
+            print(f"提交推理失败: {e}")
+            return
+        future.add_done_callback(lambda f: self.on_inferred(f, image))
 
-        # 显示所有 label 的值
-        shapes = data
-        for shape in shapes:
-            label = shape.get("label", "")
-            if label:
-                # 获取中文说明
-                chinese_desc = LABEL_DICT.get(label, "未知")
-                label_widget = QLabel(f" {label}: {chinese_desc}")
-                label_widget.setStyleSheet("color: white; font-size: 14px;")  # 设置文字颜色和大小
-                self.label_layout.addWidget(label_widget)
+    def load_session(self):
+        """
+        选择图像目录，后台线程预读并逐帧提交推理，结果依次显示
+        """
+        if self.session_thread is not None and self.session_thread.is_alive():
+            print("会话正在检测中")
+            return
+        directory = QFileDialog.getExistingDirectory(self, "选择会话目录")
+        if not directory:
+            return
+        self.start_session(directory)
 
-        # 读取图像
-        # image = cv2.imread(self.image_path)
-        if image is None:
-            print(f"Failed to load image: {self.image_path}")
+    def load_container(self):
+        """
+        选择会话容器文件（.idfc），检测方式同 load_session
+        """
+        if self.session_thread is not None and self.session_thread.is_alive():
+            print("会话正在检测中")
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "选择会话容器", "", f"会话容器 (*{CONTAINER_EXTENSION})")
+        if not path:
+            return
+        self.start_session(path)
+
+    def start_session(self, source):
+        self.session_stop.clear()
+        self.session_thread = threading.Thread(target=self.run_session, args=(source,), daemon=True)
+        self.session_thread.start()
+
+    def run_session(self, source):
+        """
+        会话检测线程：推理服务的槽位用完时 submit 阻塞，读取速度自动跟随推理速度
+        :param source: 图像目录或会话容器文件
+        """
+        with SessionReader(source, prefetch=SESSION_PREFETCH) as reader:
+            print(f"开始检测会话: {source}, 共 {len(reader)} 帧")
+            for i, name, image in reader.prefetch():
+                if self.session_stop.is_set():
+                    break
+                if image is None:
+                    print(f"Failed to load image: {name}")
+                    continue
+                image = to_bgr(image)
+                try:
+                    future = self.service.submit(image)
+                except RuntimeError as e:  # 推理进程已退出
+                    print(f"会话检测中止: {e}")
+                    break
+                future.add_done_callback(lambda f, image=image: self.on_inferred(f, image))
+
+    def on_inferred(self, future, image):
+        """
+        推理完成回调（推理服务的结果线程中调用），在此完成绘制与缩放，不占用界面线程
+        :param future: 推理任务
+        :param image: 原始图像
+        """
+        if future.cancelled():
+            return
+        try:
+            shapes = boxes_to_shapes(future.result())
+        except Exception as e:
+            print(f"推理失败: {e}")
             return
 
         # 绘制标注
@@ -272,6 +346,23 @@ class ImageViewer(QWidget):
         # 调整图像大小
         resized_image = resize_image(image, 640, 480)
         resized_annotated_image = resize_image(annotated_image, 640, 480)
+        self.result_ready.emit(shapes, resized_image, resized_annotated_image)
+
+    def show_result(self, shapes, resized_image, resized_annotated_image):
+        """
+        显示推理结果
+        """
+        # 清空上一帧的 label，显示本帧所有 label 的值
+        for i in reversed(range(self.label_layout.count())):
+            self.label_layout.itemAt(i).widget().setParent(None)
+        for shape in shapes:
+            label = shape.get("label", "")
+            if label:
+                # 获取中文说明
+                chinese_desc = LABEL_DICT.get(label, "未知")
+                label_widget = QLabel(f" {label}: {chinese_desc}")
+                label_widget.setStyleSheet("color: white; font-size: 14px;")  # 设置文字颜色和大小
+                self.label_layout.addWidget(label_widget)
 
         # 将 OpenCV 图像转换为 QImage
         qimage_original = QImage(resized_image.data, resized_image.shape[1], resized_image.shape[0],
@@ -291,6 +382,13 @@ class ImageViewer(QWidget):
             self.status_label.setText("NG")
             self.status_label.setStyleSheet("font-size: 36px; font-weight: bold; color: red;")
 
+    def closeEvent(self, event):
+        self.session_stop.set()
+        if self.session_thread is not None:
+            self.session_thread.join()
+        self.service.close()
+        event.accept()
+
 
 if __name__ == "__main__":
     # 启动 PyQt5 应用
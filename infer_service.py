@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+多进程推理服务
+
+图像放入 multiprocessing.shared_memory 环形槽位，任务队列里只传槽位号与形状，不再序列化整幅图像；
+工作进程直接在共享内存上调用检测器，结果以紧凑的框数组返回：
+    float32 数组，形状 (N, 6)，每行 [x1, y1, x2, y2, score, label]
+
+检测器在每个工作进程中按 "模块:类名" 创建，需提供 predict(images) -> [框数组, ...]；
+默认使用 SimDetector（随机框，可设置单张耗时），便于无模型时联调和测试。
+
+    service = InferenceService(num_workers=2, queue_depth=8)
+    future = service.submit(image)      # concurrent.futures.Future
+    boxes = future.result()
+    service.close()
+"""
+import itertools
+import multiprocessing as mp
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+
+import numpy as np
+
+DEFAULT_DETECTOR = "infer_service:SimDetector"
+BOX_COLUMNS = ("x1", "y1", "x2", "y2", "score", "label")
+EMPTY_BOXES = np.zeros((0, len(BOX_COLUMNS)), dtype=np.float32)
+WORKER_CHECK_INTERVAL = 0.5  # 结果线程空闲时检查工作进程是否存活的间隔（秒）
+
+
+class SimDetector:
+    """
+    模拟检测器：每张图随机生成 num_boxes 个框
+    耗时 = call_overhead_ms + latency_ms x 张数，模拟真实模型按批推理时固定开销被摊薄
+    """
+
+    def __init__(self, num_boxes=3, num_labels=37, latency_ms=0.0, call_overhead_ms=0.0, seed=None):
+        self.num_boxes = num_boxes
+        self.num_labels = num_labels
+        self.latency = latency_ms / 1000.0
+        self.call_overhead = call_overhead_ms / 1000.0
+        self.rng = np.random.default_rng(seed)
+
+    def predict(self, images):
+        results = []
+        for image in images:
+            height, width = image.shape[:2]
+            n = self.num_boxes
+            x1 = self.rng.uniform(0, width - 1, n)
+            y1 = self.rng.uniform(0, height - 1, n)
+            x2 = self.rng.uniform(x1, width)
+            y2 = self.rng.uniform(y1, height)
+            score = self.rng.uniform(0.5, 1.0, n)
+            label = self.rng.integers(1, self.num_labels + 1, n)
+            results.append(np.stack([x1, y1, x2, y2, score, label], axis=1).astype(np.float32))
+        delay = self.call_overhead + self.latency * len(images)
+        if delay:
+            time.sleep(delay)
+        return results
+
+
+def load_detector(spec, kwargs=None):
+    """按 "模块:类名" 创建检测器实例"""
+    import importlib
+    module_name, _, class_name = spec.partition(":")
+    cls = getattr(importlib.import_module(module_name), class_name)
+    return cls(**(kwargs or {}))
+
+
+def boxes_to_shapes(boxes):
+    """框数组转换为 labelme 的 shapes 列表（label 为字符串，points 为左上/右下两点）"""
+    return [{"label": str(int(b[5])), "points": [[float(b[0]), float(b[1])], [float(b[2]), float(b[3])]]}
+            for b in boxes]
+
+
+def _worker_main(detector_spec, detector_kwargs, shm_names, tasks, results):
+    """工作进程：挂载全部共享内存槽位后循环处理任务；检测器创建失败时上报原因后退出"""
+    try:
+        detector = load_detector(detector_spec, detector_kwargs)
+    except Exception as e:
+        results.put((None, [], None, 0.0, f"创建检测器 {detector_spec} 失败: {e!r}"))
+        return
+    slots = [shared_memory.SharedMemory(name=name) for name in shm_names]
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            job_id, items = task  # items: [(槽位号, 形状, dtype), ...]，一个任务即一批
+            slot_ids = [item[0] for item in items]
+            t0 = time.perf_counter()
+            try:
+                images = [np.ndarray(shape, dtype=dtype, buffer=slots[i].buf) for i, shape, dtype in items]
+                boxes = [np.asarray(b, dtype=np.float32).reshape(-1, len(BOX_COLUMNS))
+                         for b in detector.predict(images)]
+                del images  # 关闭共享内存前不能再持有视图
+                results.put((job_id, slot_ids, boxes, time.perf_counter() - t0, None))
+            except Exception as e:
+                results.put((job_id, slot_ids, None, time.perf_counter() - t0, repr(e)))
+    finally:
+        for shm in slots:
+            shm.close()
+
+
+class InferenceService:
+    def __init__(self, num_workers=2, queue_depth=8, slot_bytes=1920 * 1200 * 3,
+                 detector=DEFAULT_DETECTOR, detector_kwargs=None, latency_window=200):
+        """
+        :param num_workers:      推理进程数
+        :param queue_depth:      共享内存槽位数，即同时在途的最大图像数，槽位用完时 submit 阻塞
+        :param slot_bytes:       每个槽位的字节数，需不小于最大图像
+        :param detector:         检测器 "模块:类名"
+        :param detector_kwargs:  检测器构造参数，如 SimDetector 的 latency_ms
+        :param latency_window:   统计延迟的最近样本数
+        """
+        self.slot_bytes = slot_bytes
+        self._shms = [shared_memory.SharedMemory(create=True, size=slot_bytes) for _ in range(queue_depth)]
+        self._free = deque(range(queue_depth))
+        self._free_cond = threading.Condition()
+        self._pending = {}  # job_id -> (Future, 提交时间, 槽位号列表)
+        self._ids = itertools.count()
+        self._error = None  # 工作进程异常退出的原因，之后的提交直接失败
+
+        ctx = mp.get_context("spawn")  # 避免 fork 出带 Qt/SDK 状态的子进程
+        self._tasks = ctx.Queue()
+        self._results = ctx.Queue()
+        names = [shm.name for shm in self._shms]
+        self._workers = [ctx.Process(target=_worker_main, name=f"InferWorker-{i}", daemon=True,
+                                     args=(detector, detector_kwargs, names, self._tasks, self._results))
+                         for i in range(num_workers)]
+        for p in self._workers:
+            p.start()
+        self._collector = threading.Thread(target=self._collect, name="InferResults", daemon=True)
+        self._collector.start()
+        self._closed = False
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self._latency = deque(maxlen=latency_window)  # (端到端秒, 模型秒)
+
+    def submit(self, image, timeout=None):
+        """
+        把图像拷贝进空闲槽位并排队推理
+        :return:  Future，结果为框数组；timeout 内没有空闲槽位时抛出 TimeoutError
+        """
+        future = Future()
+        batch = self.submit_batch([image], timeout)
+        batch.add_done_callback(lambda f: _chain_first(f, future))
+        return future
+
+    def submit_batch(self, images, timeout=None):
+        """
+        一批图像作为一个任务交给同一个工作进程，检测器一次 predict 处理整批
+        :return:  Future，结果为与 images 对应的框数组列表
+        """
+        if self._closed:
+            raise RuntimeError("推理服务已关闭")
+        if len(images) > len(self._shms):
+            raise ValueError(f"批大小 {len(images)} 超出共享内存槽位数 {len(self._shms)}")
+        images = [np.asarray(image) for image in images]  # 非连续视图（如 mmap 的 BMP）在拷贝进槽位时一并整理
+        for image in images:
+            if image.nbytes > self.slot_bytes:
+                raise ValueError(f"图像大小 {image.nbytes} 超出共享内存槽位 {self.slot_bytes}")
+        with self._free_cond:
+            if not self._free_cond.wait_for(lambda: len(self._free) >= len(images) or self._error is not None,
+                                            timeout=timeout):
+                raise TimeoutError("推理队列已满")
+            if self._error is not None:
+                raise RuntimeError(f"推理服务不可用: {self._error}")
+            slot_ids = [self._free.popleft() for _ in images]
+        items = []
+        for slot_idx, image in zip(slot_ids, images):
+            np.ndarray(image.shape, dtype=image.dtype, buffer=self._shms[slot_idx].buf)[...] = image
+            items.append((slot_idx, image.shape, image.dtype.str))
+
+        future = Future()
+        job_id = next(self._ids)
+        with self._free_cond:
+            if self._error is not None:  # 拷贝期间工作进程退出
+                self._free.extend(slot_ids)
+                self._free_cond.notify_all()
+                raise RuntimeError(f"推理服务不可用: {self._error}")
+            self._pending[job_id] = (future, time.perf_counter(), slot_ids)
+            self.submitted += len(images)
+        self._tasks.put((job_id, items))
+        return future
+
+    def predict(self, images):
+        """检测器接口：同步推理一批图像，可直接作为 BatchScheduler 的 predict"""
+        return self.submit_batch(images).result()
+
+    def infer(self, image, timeout=None):
+        """同步推理一张图像"""
+        return self.submit(image).result(timeout)
+
+    def _collect(self):
+        while True:
+            try:
+                item = self._results.get(timeout=WORKER_CHECK_INTERVAL)
+            except queue.Empty:
+                self._check_workers()
+                continue
+            if item is None:
+                return
+            job_id, slot_ids, boxes, model_time, error = item
+            if job_id is None:  # 工作进程启动失败
+                self._fail_all(error)
+                continue
+            with self._free_cond:
+                entry = self._pending.pop(job_id, None)
+                if entry is not None:  # 否则已随工作进程退出按失败处理，槽位也已归还
+                    self._free.extend(slot_ids)
+                    self._free_cond.notify_all()
+            if entry is None:
+                continue
+            future, t0, _ = entry
+            if error is None:
+                self.completed += len(slot_ids)
+                self._latency.append((time.perf_counter() - t0, model_time))
+                future.set_result(boxes)
+            else:
+                self.failed += len(slot_ids)
+                future.set_exception(RuntimeError(f"推理失败: {error}"))
+
+    def _check_workers(self):
+        """
+        工作进程异常退出时，它手里的任务无从得知，所有未完成的任务按失败处理并归还槽位，
+        之后的提交直接抛出 RuntimeError，避免调用方永远等待结果或空闲槽位
+        """
+        if self._closed or self._error is not None:
+            return
+        dead = [p for p in self._workers if not p.is_alive()]
+        if dead:
+            self._fail_all(", ".join(f"{p.name} 已退出 (exitcode {p.exitcode})" for p in dead))
+
+    def _fail_all(self, reason):
+        with self._free_cond:
+            if self._error is None:
+                self._error = reason
+                print(f"推理服务不可用: {reason}")
+            pending = list(self._pending.values())
+            self._pending.clear()
+            for _, _, slot_ids in pending:
+                self._free.extend(slot_ids)
+            self._free_cond.notify_all()
+        for future, _, slot_ids in pending:
+            self.failed += len(slot_ids)
+            future.set_exception(RuntimeError(f"推理服务不可用: {reason}"))
+
+    def stats(self):
+        lat = np.array(self._latency) * 1000 if self._latency else np.zeros((1, 2))
+        with self._free_cond:
+            free = len(self._free)
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "in_flight": len(self._shms) - free,
+            "latency_ms_p50": float(np.percentile(lat[:, 0], 50)),
+            "latency_ms_p99": float(np.percentile(lat[:, 0], 99)),
+            "model_ms_mean": float(lat[:, 1].mean()),
+        }
+
+    def close(self):
+        """停止工作进程并释放共享内存，未完成的任务会被取消"""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._workers:
+            self._tasks.put(None)
+        for p in self._workers:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+        self._results.put(None)
+        self._collector.join()
+        for future, _, _ in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _chain_first(batch_future, future):
+    """单张提交：取批结果中的第一项"""
+    if batch_future.cancelled():
+        future.cancel()
+    elif batch_future.exception() is not None:
+        future.set_exception(batch_future.exception())
+    else:
+        future.set_result(batch_future.result()[0])
+
+
+if __name__ == "__main__":
+    # 简单压测：模拟检测器单张 20ms，比较不同进程数下的吞吐
+    frame = np.random.randint(0, 256, (1024, 1280, 3), dtype=np.uint8)
+    for workers in (1, 2, 4):
+        with InferenceService(num_workers=workers, queue_depth=8, detector_kwargs={"latency_ms": 20}) as service:
+            service.infer(frame)  # 预热
+            start = time.perf_counter()
+            futures = [service.submit(frame) for _ in range(100)]
+            for f in futures:
+                f.result()
+            elapsed = time.perf_counter() - start
+            s = service.stats()
+            print(f"{workers} 进程: {100 / elapsed:.1f} 张/秒, 延迟 p50 {s['latency_ms_p50']:.1f} ms"
+                  f" / p99 {s['latency_ms_p99']:.1f} ms")
@@ -1,8 +1,9 @@
 import os
-import json
 import sys
 from collections import defaultdict
 
+from labelme_reader import read_labelme
+
 # 参考表：label编号与中文说明的映射
 LABEL_DESCRIPTION = {
     "1": "色差",
@@ -47,8 +48,7 @@ LABEL_DESCRIPTION = {
 
 def get_labels_in_json(file_path):
     """获取单个JSON文件中的所有label"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = read_labelme(file_path)  # 跳过 imageData
 
     # 使用集合去重，确保每个label在单个文件中只统计一次
     labels = set()
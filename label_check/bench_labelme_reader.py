@@ -0,0 +1,76 @@
+"""
+labelme JSON 读取对比：json.load 与 read_labelme（跳过 imageData）
+
+对目录下所有 JSON 分别用两种方式读取，比较总耗时与峰值内存（tracemalloc），并核对两者除 imageData 外结果一致。
+imageData 为空的文件两者差别不大，内嵌图像的文件差别明显。
+
+用法：
+    python bench_labelme_reader.py <目录> [重复次数]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from labelme_reader import read_labelme
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def collect_json(directory):
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith('.json'))
+    return sorted(paths)
+
+
+def measure(reader, paths, repeat):
+    """返回 (每个文件平均毫秒, 单个文件读取时的最大峰值内存MB)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            reader(path)
+    elapsed = time.perf_counter() - start
+
+    peak = 0
+    for path in paths:
+        tracemalloc.start()
+        reader(path)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return elapsed * 1000 / (repeat * len(paths)), peak / 1024 / 1024
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("用法: python bench_labelme_reader.py <目录> [重复次数]")
+        return
+    directory = sys.argv[1]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    paths = collect_json(directory)
+    if not paths:
+        print("目录下没有JSON文件")
+        return
+
+    mismatched = 0
+    for path in paths:
+        expected = load_json(path)
+        if 'imageData' in expected:
+            expected['imageData'] = None
+        if read_labelme(path) != expected:
+            mismatched += 1
+            print(f"结果不一致: {path}")
+
+    total_mb = sum(os.path.getsize(path) for path in paths) / 1024 / 1024
+    print(f"{len(paths)} 个JSON文件, 共 {total_mb:.1f} MB, 重复 {repeat} 次, 不一致 {mismatched} 个")
+    for name, reader in (("json.load", load_json), ("read_labelme", read_labelme)):
+        ms, peak_mb = measure(reader, paths, repeat)
+        print(f"{name:>12}: {ms:8.2f} ms/文件, 峰值内存 {peak_mb:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+标注框列式表
+
+把数据集中所有 shape 展开成按列存放的 NumPy 数组（每个框一行）：
+    file_id, label, num_points, x1, y1, x2, y2（外接框）, width, height, area
+文件级数组 paths、image_width、image_height 以 file_id 为下标。
+表可以保存为 .npz，之后的统计（各 label 尺寸分布、小框、越界框）都是对整列的一次向量化运算，
+不再逐个 shape 解析坐标字符串。
+
+用法：
+    python box_table.py <目录或.npz> [保存的.npz]
+"""
+import sys
+import time
+
+import numpy as np
+
+from label_scanner import Check, scan, parse_label
+
+INVALID_LABEL = -1  # label 缺失或不是整数
+BOX_COLUMNS = ("file_id", "label", "num_points", "x1", "y1", "x2", "y2")
+COLUMN_DTYPES = {"file_id": np.int32, "label": np.int32, "num_points": np.int16}
+
+
+class _BoxCollector(Check):
+    """扫描时把每个文件的 shapes 追加到列表，结束后再转为数组"""
+    name = "框表"
+
+    def __init__(self):
+        self.paths = []
+        self.sizes = []
+        self.rows = []
+
+    def visit(self, record):
+        file_id = len(self.paths)
+        self.paths.append(record.path)
+        self.sizes.append((record.image_width or 0, record.image_height or 0))
+        for shape in record.shapes:
+            label = parse_label(shape.get('label'))
+            points = shape.get('points') or []
+            try:
+                xs = [float(point[0]) for point in points]
+                ys = [float(point[1]) for point in points]
+            except (ValueError, TypeError, IndexError):
+                xs = ys = []
+            if xs:
+                bounds = (min(xs), min(ys), max(xs), max(ys))
+            else:
+                bounds = (np.nan, np.nan, np.nan, np.nan)
+            self.rows.append((file_id, INVALID_LABEL if label is None else label, len(points), *bounds))
+
+
+class BoxTable:
+    def __init__(self, paths, image_width, image_height, columns):
+        """
+        :param paths:         文件路径数组，下标为 file_id
+        :param image_width:   每个文件的 imageWidth（未知为0）
+        :param image_height:  每个文件的 imageHeight（未知为0）
+        :param columns:       {列名: 数组}，列名见 BOX_COLUMNS
+        """
+        self.paths = np.asarray(paths, dtype=str)
+        self.image_width = np.asarray(image_width, dtype=np.int32)
+        self.image_height = np.asarray(image_height, dtype=np.int32)
+        for name in BOX_COLUMNS:
+            setattr(self, name, np.asarray(columns[name], dtype=COLUMN_DTYPES.get(name, np.float32)))
+        self.width = self.x2 - self.x1
+        self.height = self.y2 - self.y1
+        self.area = self.width * self.height
+        self.max_side = np.maximum(self.width, self.height)
+
+    def __len__(self):
+        return len(self.file_id)
+
+    @classmethod
+    def from_directory(cls, directory, workers=8):
+        """扫描目录并解析所有 JSON"""
+        collector = _BoxCollector()
+        scan(directory, [collector], workers=workers)
+        rows = np.array(collector.rows, dtype=np.float64).reshape(-1, len(BOX_COLUMNS))
+        sizes = np.array(collector.sizes, dtype=np.int32).reshape(-1, 2)
+        return cls(collector.paths, sizes[:, 0], sizes[:, 1],
+                   {name: rows[:, i] for i, name in enumerate(BOX_COLUMNS)})
+
+    @classmethod
+    def from_index(cls, index):
+        """从 label_index.LabelIndex 读取，不再解析 JSON"""
+        files = index.conn.execute(
+            "SELECT id, path, COALESCE(image_width, 0), COALESCE(image_height, 0) FROM files ORDER BY id").fetchall()
+        ids = np.array([row[0] for row in files], dtype=np.int64)
+        rows = np.array(index.conn.execute(
+            "SELECT file_id, COALESCE(label_int, ?), num_points, x1, y1, x2, y2 FROM shapes ORDER BY file_id, idx",
+            (INVALID_LABEL,)).fetchall(), dtype=np.float64).reshape(-1, len(BOX_COLUMNS))
+        rows[:, 0] = np.searchsorted(ids, rows[:, 0])  # 数据库 id 映射为连续下标
+        return cls([row[1] for row in files], [row[2] for row in files], [row[3] for row in files],
+                   {name: rows[:, i] for i, name in enumerate(BOX_COLUMNS)})
+
+    def save(self, path):
+        np.savez_compressed(path, paths=self.paths, image_width=self.image_width, image_height=self.image_height,
+                            **{name: getattr(self, name) for name in BOX_COLUMNS})
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["paths"], data["image_width"], data["image_height"],
+                       {name: data[name] for name in BOX_COLUMNS})
+
+    def small_boxes(self, min_side=16):
+        """
+        需要删除的框（del_json_under16-pixles 的口径）：不是两点矩形、坐标无效或最大边长不超过 min_side
+        :return:  布尔掩码
+        """
+        return (self.num_points != 2) | ~(self.max_side > min_side)
+
+    def out_of_bounds(self, tolerance=0.0):
+        """超出图像范围的框（imageWidth/imageHeight 未知的文件不参与判断），返回布尔掩码"""
+        width = self.image_width[self.file_id]
+        height = self.image_height[self.file_id]
+        known = (width > 0) & (height > 0)
+        outside = ((self.x1 < -tolerance) | (self.y1 < -tolerance) |
+                   (self.x2 > width + tolerance) | (self.y2 > height + tolerance))
+        return known & outside
+
+    def files_where(self, mask):
+        """掩码为真的框所在的文件路径"""
+        return self.paths[np.unique(self.file_id[mask])]
+
+    def label_size_stats(self, percentiles=(10, 50, 90)):
+        """
+        各 label 的框数与最大边长分布
+        :return:  {label: {"count", "min", "p10", "p50", "p90", "max", "mean_area"}}
+        """
+        valid = ~np.isnan(self.max_side)
+        labels, sides, areas = self.label[valid], self.max_side[valid], self.area[valid]
+        order = np.lexsort((sides, labels))  # 先按 label 再按边长排序，各 label 连续且有序
+        labels, sides, areas = labels[order], sides[order], areas[order]
+        unique, starts, counts = np.unique(labels, return_index=True, return_counts=True)
+        area_sums = np.add.reduceat(areas, starts) if len(starts) else areas[:0]
+        stats = {}
+        for i, label in enumerate(unique):
+            segment = sides[starts[i]:starts[i] + counts[i]]
+            item = {"count": int(counts[i]), "min": float(segment[0]), "max": float(segment[-1]),
+                    "mean_area": float(area_sums[i] / counts[i])}
+            for p, value in zip(percentiles, np.percentile(segment, percentiles)):
+                item[f"p{p}"] = float(value)
+            stats[int(label)] = item
+        return stats
+
+    def label_size_histogram(self, bins=(0, 8, 16, 32, 64, 128, 256, 512, np.inf)):
+        """
+        各 label 按最大边长分箱的框数
+        :return:  (label 数组, 计数矩阵 [label数, 箱数])
+        """
+        bins = np.asarray(bins, dtype=np.float64)
+        valid = ~np.isnan(self.max_side)
+        unique, label_idx = np.unique(self.label[valid], return_inverse=True)
+        bin_idx = np.clip(np.searchsorted(bins, self.max_side[valid], side="right") - 1, 0, len(bins) - 2)
+        counts = np.bincount(label_idx * (len(bins) - 1) + bin_idx, minlength=len(unique) * (len(bins) - 1))
+        return unique, counts.reshape(len(unique), len(bins) - 1)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("用法: python box_table.py <目录或.npz> [保存的.npz]")
+        return
+    source = sys.argv[1]
+    start = time.perf_counter()
+    table = BoxTable.load(source) if source.endswith(".npz") else BoxTable.from_directory(source)
+    print(f"载入 {len(table.paths)} 个文件 {len(table)} 个框, 耗时 {time.perf_counter() - start:.2f} 秒")
+    if len(sys.argv) > 2:
+        table.save(sys.argv[2])
+        print(f"已保存到 {sys.argv[2]}")
+
+    start = time.perf_counter()
+    small = table.small_boxes()
+    outside = table.out_of_bounds()
+    stats = table.label_size_stats()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"小框(<=16px) {int(small.sum())} 个, 涉及 {len(table.files_where(small))} 个文件; "
+          f"越界框 {int(outside.sum())} 个; 查询耗时 {elapsed:.1f} ms")
+    for label, item in stats.items():
+        print(f"Label {label:>3}: {item['count']:6d} 个, 最大边长 min {item['min']:.0f} / p50 {item['p50']:.0f} / "
+              f"p90 {item['p90']:.0f} / max {item['max']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
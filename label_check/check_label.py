@@ -1,5 +1,7 @@
 import os
-import json
+
+from labelme_reader import read_labelme
+from label_scanner import LabelValidityCheck, scan
 
 # 合法的label范围
 VALID_LABELS = set(range(1, 38))  # 1到37的整数
@@ -7,8 +9,7 @@ VALID_LABELS = set(range(1, 38))  # 1到37的整数
 
 def check_labels_in_json(file_path):
     """检查单个JSON文件中的label是否合法"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = read_labelme(file_path)  # 跳过 imageData
 
     invalid_labels = set()
     for shape in data.get('shapes', []):
@@ -26,21 +27,10 @@ def check_labels_in_json(file_path):
 
 
 def check_labels_in_directory(directory):
-    """检查指定目录下所有JSON文件中的label是否合法"""
-    invalid_files = {}  # 存储非法label的文件及其对应的非法label
-
-    # 遍历目录下的所有文件
-    for root, _, files in os.walk(directory):
-        for file_name in files:
-            if file_name.endswith('.json'):
-                file_path = os.path.join(root, file_name)
-                invalid_labels = check_labels_in_json(file_path)
-
-                # 如果文件中有非法label，记录下来
-                if invalid_labels:
-                    invalid_files[file_name] = invalid_labels
-
-    return invalid_files
+    """检查指定目录下所有JSON文件中的label是否合法，返回 {文件名: 非法label集合}"""
+    check = LabelValidityCheck()
+    scan(directory, [check])
+    return check.invalid_files
 
 
 def save_results_to_txt(invalid_files, output_file):
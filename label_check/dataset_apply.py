@@ -0,0 +1,267 @@
+"""
+数据集清理的计划/执行引擎
+
+清理脚本不再边遍历边删除/改写，而是分两步：
+    1. 计划：并行检查所有文件，得到完整的变更集合（Plan），可先 dry-run 查看
+    2. 执行：改写的内容先并行写入临时文件，再逐个用 os.replace 原子替换；删除的文件整体移入日志目录作为备份。
+       每个变更执行前先写入日志（manifest.jsonl），中断后可用 rollback 恢复到执行前的状态
+
+日志目录默认在数据集目录旁：<目录>.journal/<时间>/，确认无误后可用 purge 删除备份。
+
+用法：
+    python dataset_apply.py rollback <日志目录>
+    python dataset_apply.py purge <日志目录>
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from label_scanner import scan_tree
+from labelme_reader import load_labelme
+
+ACTION_DELETE = "delete"
+ACTION_REWRITE = "rewrite"
+MANIFEST_NAME = "manifest.jsonl"
+TMP_SUFFIX = ".apply.tmp"
+
+
+class Change:
+    """一个文件的变更：删除，或只保留 keep 中序号的 shapes 后改写"""
+    __slots__ = ("action", "path", "reason", "keep", "ensure_ascii", "mtime_ns")
+
+    def __init__(self, action, path, reason="", keep=None, ensure_ascii=True):
+        self.action = action
+        self.path = path
+        self.reason = reason
+        self.keep = keep
+        self.ensure_ascii = ensure_ascii
+        try:
+            self.mtime_ns = os.stat(path).st_mtime_ns  # 执行时文件已被修改则跳过
+        except OSError:
+            self.mtime_ns = None
+
+    @classmethod
+    def delete(cls, path, reason=""):
+        return cls(ACTION_DELETE, path, reason)
+
+    @classmethod
+    def rewrite(cls, path, keep, reason="", ensure_ascii=True):
+        return cls(ACTION_REWRITE, path, reason, list(keep), ensure_ascii)
+
+
+class Plan:
+    def __init__(self, directory, changes=None):
+        self.directory = os.path.abspath(directory)
+        self.changes = list(changes or [])
+
+    def __len__(self):
+        return len(self.changes)
+
+    def extend(self, changes):
+        self.changes.extend(change for change in changes if change is not None)
+
+    def summary(self):
+        """{(动作, 原因): 文件数}"""
+        return Counter((change.action, change.reason) for change in self.changes)
+
+    def print_plan(self, verbose=False):
+        if verbose:
+            for change in self.changes:
+                print(f"[{change.action}] {change.path} ({change.reason})")
+        print(f"共 {len(self.changes)} 个文件需要变更：")
+        for (action, reason), count in sorted(self.summary().items()):
+            print(f"  {action:8s} {reason}: {count} 个")
+
+
+def plan_json(directory, planner, workers=8):
+    """
+    并行对目录下每个 JSON 调用 planner(json_path, has_image) -> Change 或 None
+    has_image 表示同目录下是否有同名 BMP
+    """
+    json_paths, images = scan_tree(directory)
+    has_image = [os.path.splitext(os.path.basename(path))[0].lower() in images.get(os.path.dirname(path), ())
+                 for path in json_paths]
+    plan = Plan(directory)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        plan.extend(executor.map(planner, json_paths, has_image))
+    return plan
+
+
+def _prepare_rewrite(change):
+    """把改写后的内容写入同目录临时文件，返回临时文件路径"""
+    data = load_labelme(change.path)
+    data['shapes'] = [data['shapes'][i] for i in change.keep]
+    tmp_path = change.path + TMP_SUFFIX
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=change.ensure_ascii)
+    return tmp_path
+
+
+def _backup_path(journal_dir, directory, path):
+    rel = os.path.relpath(path, directory)
+    if rel.startswith(os.pardir):
+        rel = os.path.abspath(path).lstrip(os.sep).replace(":", "")
+    return os.path.join(journal_dir, "files", rel)
+
+
+def _move(src, dst):
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    try:
+        os.replace(src, dst)
+    except OSError:  # 跨文件系统
+        shutil.move(src, dst)
+
+
+def _is_stale(change):
+    try:
+        return os.stat(change.path).st_mtime_ns != change.mtime_ns
+    except OSError:
+        return True
+
+
+def default_journal_dir(directory):
+    """新建本次执行的日志目录（同一秒内多次执行也不会重名）"""
+    root = os.path.abspath(directory) + ".journal"
+    os.makedirs(root, exist_ok=True)
+    return tempfile.mkdtemp(prefix=time.strftime("%Y%m%d_%H%M%S_"), dir=root)
+
+
+def apply(plan, journal_dir=None, dry_run=False, workers=8):
+    """
+    执行计划
+    :param journal_dir:  日志与备份目录，默认 <目录>.journal/<时间>
+    :param dry_run:      只打印计划，不修改任何文件
+    :return:             {"applied", "stale", "failed", "seconds", "journal"}
+    """
+    start = time.perf_counter()
+    if dry_run:
+        plan.print_plan(verbose=True)
+        return {"applied": 0, "stale": 0, "failed": 0, "seconds": time.perf_counter() - start, "journal": None}
+
+    journal_dir = journal_dir or default_journal_dir(plan.directory)
+    os.makedirs(journal_dir, exist_ok=True)
+    counts = Counter()
+
+    # 改写内容并行写入临时文件
+    rewrites = [change for change in plan.changes if change.action == ACTION_REWRITE]
+    tmp_paths = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {change.path: executor.submit(_prepare_rewrite, change) for change in rewrites}
+        for path, future in futures.items():
+            try:
+                tmp_paths[path] = future.result()
+            except Exception as e:
+                print(f"❌ 生成改写内容失败 | {path} | 错误: {e}")
+
+    pending = set(tmp_paths.values())
+    try:
+        with open(os.path.join(journal_dir, MANIFEST_NAME), 'a', encoding='utf-8') as manifest:
+            manifest.write(json.dumps({"directory": plan.directory, "created": time.time()}) + "\n")
+            for seq, change in enumerate(plan.changes):
+                if change.action == ACTION_REWRITE and change.path not in tmp_paths:
+                    counts["failed"] += 1
+                    continue
+                if _is_stale(change):
+                    counts["stale"] += 1
+                    continue
+                backup = _backup_path(journal_dir, plan.directory, change.path)
+                if os.path.exists(backup):  # 同一日志中不能覆盖已有备份
+                    counts["failed"] += 1
+                    print(f"❌ 备份已存在 | {backup}")
+                    continue
+                # 先写日志再操作，回滚时按日志恢复
+                manifest.write(json.dumps({"seq": seq, "action": change.action, "path": change.path,
+                                           "backup": backup, "reason": change.reason}, ensure_ascii=False) + "\n")
+                manifest.flush()
+                try:
+                    if change.action == ACTION_DELETE:
+                        _move(change.path, backup)
+                    else:
+                        os.makedirs(os.path.dirname(backup), exist_ok=True)
+                        try:
+                            os.link(change.path, backup)
+                        except OSError:
+                            shutil.copy2(change.path, backup)
+                        tmp_path = tmp_paths[change.path]
+                        os.replace(tmp_path, change.path)
+                        pending.discard(tmp_path)
+                    counts["applied"] += 1
+                except OSError as e:
+                    counts["failed"] += 1
+                    print(f"❌ 执行失败 | {change.path} | 错误: {e}")
+            os.fsync(manifest.fileno())
+    except KeyboardInterrupt:
+        print(f"执行被中断，可用 python dataset_apply.py rollback {journal_dir} 恢复")
+        raise
+    finally:
+        for tmp_path in pending:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return {"applied": counts["applied"], "stale": counts["stale"], "failed": counts["failed"],
+            "seconds": time.perf_counter() - start, "journal": journal_dir}
+
+
+def read_manifest(journal_dir):
+    """日志中的变更记录（不含表头）"""
+    with open(os.path.join(journal_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+        return [entry for entry in map(json.loads, f) if "seq" in entry]
+
+
+def rollback(journal_dir):
+    """按日志逆序恢复备份，可重复执行"""
+    restored = 0
+    for entry in reversed(read_manifest(journal_dir)):
+        tmp_path = entry["path"] + TMP_SUFFIX
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        if os.path.exists(entry["backup"]):
+            _move(entry["backup"], entry["path"])
+            restored += 1
+    return restored
+
+
+def purge(journal_dir):
+    """确认清理结果后删除备份与日志"""
+    shutil.rmtree(journal_dir)
+
+
+def run(plan, dry_run=False, confirm=False):
+    """清理脚本的通用执行流程：打印计划、确认、执行并输出报告"""
+    plan.print_plan()
+    if not plan.changes or dry_run:
+        if dry_run:
+            apply(plan, dry_run=True)
+        return None
+    if confirm and input("确认执行？(y/N) ").strip().lower() != 'y':
+        print("🚫 操作已取消")
+        return None
+    result = apply(plan)
+    print(f"执行完成: 成功 {result['applied']} 个, 已变化跳过 {result['stale']} 个, 失败 {result['failed']} 个, "
+          f"耗时 {result['seconds']:.2f} 秒")
+    print(f"备份与日志: {result['journal']}（回滚: python dataset_apply.py rollback <日志目录>）")
+    return result
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in ("rollback", "purge"):
+        print("用法: python dataset_apply.py rollback|purge <日志目录>")
+        return
+    command, journal_dir = sys.argv[1], sys.argv[2]
+    if not os.path.isfile(os.path.join(journal_dir, MANIFEST_NAME)):
+        print(f"错误: 不是日志目录 - {journal_dir}")
+        return
+    if command == "rollback":
+        print(f"已恢复 {rollback(journal_dir)} 个文件")
+    else:
+        purge(journal_dir)
+        print(f"已删除 {journal_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,61 +1,55 @@
-import os
-import json
+from dataset_apply import Change, plan_json, run
+from labelme_reader import read_labelme
 
-def process_json_file(json_path):
+
+def plan_json_file(json_path, has_image):
+    """检查单个 JSON 文件，返回需要的变更（Change）或 None"""
     # 检查是否存在同名 BMP 文件（提前终止条件）
-    bmp_path = os.path.splitext(json_path)[0] + ".bmp"
-    if not os.path.exists(bmp_path):
-        print(f"Deleting {json_path} (no corresponding BMP)")
-        os.remove(json_path)
-        return
+    if not has_image:
+        return Change.delete(json_path, "no corresponding BMP")
 
-    # 读取 JSON 文件
+    # 读取 JSON 文件（跳过 imageData，改写时再完整读取）
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_labelme(json_path)
     except Exception as e:
         print(f"Skipping {json_path} (invalid JSON: {e})")
-        return
+        return None
 
     # 检查是否包含必要结构
     if "shapes" not in data:
-        print(f"Deleting {json_path} (missing 'shapes' key)")
-        os.remove(json_path)
-        return
+        return Change.delete(json_path, "missing 'shapes' key")
 
     # 删除 label=33 的条目，并检查 label 键完整性
-    valid_shapes = []
+    valid_indexes = []
     has_invalid_shape = False
 
-    for shape in data["shapes"]:
+    for index, shape in enumerate(data["shapes"]):
         if "label" not in shape:
             has_invalid_shape = True  # 标记存在无 label 的条目
         elif shape["label"] == "33":
             continue  # 跳过 label=33 的条目
         else:
-            valid_shapes.append(shape)
+            valid_indexes.append(index)
 
     # 如果存在无效条目或处理后无有效条目，则删除文件
-    if has_invalid_shape or len(valid_shapes) == 0:
-        print(f"Deleting {json_path} (invalid/empty shapes)")
-        os.remove(json_path)
-        return
-
-    # 保存修改后的内容
-    data["shapes"] = valid_shapes
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    print(f"Updated {json_path}")
-
-def process_directory(directory):
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.lower().endswith(".json"):
-                json_path = os.path.join(root, file)
-                process_json_file(json_path)
+    if has_invalid_shape or len(valid_indexes) == 0:
+        return Change.delete(json_path, "invalid/empty shapes")
+
+    if len(valid_indexes) == len(data["shapes"]):
+        return None
+
+    return Change.rewrite(json_path, valid_indexes, "remove label 33")
+
+
+def process_directory(directory, dry_run=False):
+    """先并行生成完整计划，再统一执行（可回滚）"""
+    plan = plan_json(directory, plan_json_file)
+    return run(plan, dry_run=dry_run)
+
 
 # 使用示例
 if __name__ == "__main__":
     target_dir = "e:/idet_v2_part1_1500"
-    process_directory(target_dir)
-    print("Processing completed!")
\ No newline at end of file
+    DRY_RUN = False  # True 时只打印计划
+    process_directory(target_dir, dry_run=DRY_RUN)
+    print("Processing completed!")
@@ -1,25 +1,23 @@
-import os
-import json
+from dataset_apply import Change, plan_json, run
+from labelme_reader import read_labelme
 
-def process_json_file(json_path):
-    """处理单个 JSON 文件"""
+
+def plan_json_file(json_path, has_image=True):
+    """检查单个 JSON 文件，返回需要的变更（Change）或 None"""
     try:
-        # 读取 JSON 文件内容
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # 读取 JSON 文件内容（跳过 imageData，改写时再完整读取）
+        data = read_labelme(json_path)
     except Exception as e:
         print(f"❌ 文件读取失败 | {json_path} | 错误: {str(e)}")
-        return
+        return None
 
     # 检查关键数据结构是否存在
     if 'shapes' not in data:
-        print(f"🗑️ 删除文件（缺少shapes键）| {json_path}")
-        os.remove(json_path)
-        return
+        return Change.delete(json_path, "缺少shapes键")
 
-    # 过滤符合条件的标注
-    valid_shapes = []
-    for shape in data['shapes']:
+    # 过滤符合条件的标注（记录保留的序号）
+    valid_indexes = []
+    for index, shape in enumerate(data['shapes']):
         # 检查标注是否包含坐标点
         if 'points' not in shape or len(shape['points']) != 2:
             continue  # 跳过无效标注
@@ -40,30 +38,26 @@ def process_json_file(json_path):
 
         # 保留边长 > 16 的标注
         if max_side > 16:
-            valid_shapes.append(shape)
-
-    # 更新标注数据
-    data['shapes'] = valid_shapes
+            valid_indexes.append(index)
 
     # 根据标注是否为空决定操作
-    if not valid_shapes:
-        print(f"🗑️ 删除文件（无有效标注）| {json_path}")
-        os.remove(json_path)
-    else:
-        # 保存修改后的文件（保留原始缩进格式）
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"✅ 文件更新完成 | {json_path}")
+    if not valid_indexes:
+        return Change.delete(json_path, "无有效标注")
+    if len(valid_indexes) == len(data['shapes']):
+        return None
+    # 保存时保留原始缩进格式
+    return Change.rewrite(json_path, valid_indexes, "删除边长<=16的标注", ensure_ascii=False)
+
+
+def batch_process(directory, dry_run=False):
+    """批量处理目录：先并行生成完整计划，再统一执行（可回滚）"""
+    plan = plan_json(directory, plan_json_file)
+    return run(plan, dry_run=dry_run)
 
-def batch_process(directory):
-    """批量处理目录"""
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            if filename.lower().endswith('.json'):
-                process_json_file(os.path.join(root, filename))
 
 if __name__ == '__main__':
-    # 使用方法：修改为你的目录路径
+    # 使用方法：修改为你的目录路径；DRY_RUN 为 True 时只打印计划
     target_dir = "E:\idet_v2_part1_1500"
-    batch_process(target_dir)
-    print("处理完成！")
\ No newline at end of file
+    DRY_RUN = False
+    batch_process(target_dir, dry_run=DRY_RUN)
+    print("处理完成！")
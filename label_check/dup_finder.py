@@ -0,0 +1,355 @@
+"""
+跨数据集重复图像查找
+
+多相机连拍会在各个 idet_v2_part1_* 目录中留下大量完全相同或几乎相同的 BMP。查找分三级，越往后越贵、候选越少：
+    1. 按文件大小分组，大小唯一的文件直接排除
+    2. 对同大小的文件先哈希开头一块，再对仍然相同的文件分块计算完整 blake2b
+    3. 可选：感知哈希（dHash，64位），汉明距离不超过阈值的视为近似重复
+
+哈希结果按 (路径, mtime, 大小) 缓存在 SQLite 中，再次运行只计算有变化的文件。
+结果生成 dataset_apply 的 Plan：每组保留一张（优先保留有标注 JSON 的），其余图像连同其 JSON 一起删除，
+执行后可以回滚。
+
+用法：
+    python dup_finder.py <目录> [目录 ...]
+"""
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from dataset_apply import Change, Plan, run
+from label_scanner import IMAGE_EXTENSIONS
+
+CACHE_FILE = "dup_hash_cache.sqlite"
+HEAD_BYTES = 64 * 1024  # 第一级只哈希开头的字节数
+CHUNK_BYTES = 1024 * 1024
+PHASH_DISTANCE = 4  # 近似重复的最大汉明距离
+
+# 运行参数
+USE_PHASH = False  # 是否查找近似重复（需要解码图像，较慢）
+INCLUDE_NEAR_IN_PLAN = False  # 近似重复是否也加入删除计划
+DRY_RUN = True  # True 时只打印计划
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    head     TEXT,
+    full     TEXT,
+    phash    TEXT
+);
+"""
+
+
+class ImageFile:
+    __slots__ = ("path", "size", "mtime_ns", "json_path", "head", "full", "phash")
+
+    def __init__(self, path, size, mtime_ns, json_path=None):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.json_path = json_path  # 同目录同名的标注文件
+        self.head = None
+        self.full = None
+        self.phash = None
+
+
+def collect_images(directories):
+    """
+    遍历目录，返回全部图像文件（含配对的 JSON 路径）
+    目录与文件按 os.path.realpath 去重：重复传入同一目录、同时传入目录与其子目录、符号链接指向同一文件时，
+    每个文件只收集一次，不会与自身被判为重复
+    """
+    files = []
+    seen_dirs = set()
+    seen_files = set()
+    stack = list(reversed(directories))
+    while stack:
+        root = stack.pop()
+        real_root = os.path.realpath(root)
+        if real_root in seen_dirs:
+            continue
+        seen_dirs.add(real_root)
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"无法读取目录: {root} 错误: {e}")
+            continue
+        jsons = {}
+        images = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+                continue
+            base, ext = os.path.splitext(entry.name.lower())
+            if ext == '.json':
+                jsons[base] = entry.path
+            elif ext in IMAGE_EXTENSIONS:
+                images.append((base, entry))
+        for base, entry in images:
+            real_path = os.path.realpath(entry.path)
+            if real_path in seen_files:
+                continue
+            seen_files.add(real_path)
+            st = entry.stat()
+            files.append(ImageFile(entry.path, st.st_size, st.st_mtime_ns, jsons.get(base)))
+    return files
+
+
+def hash_file(path, limit=None):
+    """分块计算 blake2b，limit 不为 None 时只哈希开头 limit 字节"""
+    h = hashlib.blake2b(digest_size=20)
+    remaining = limit
+    with open(path, 'rb') as f:
+        while remaining is None or remaining > 0:
+            chunk = f.read(CHUNK_BYTES if remaining is None else min(CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            h.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return h.hexdigest()
+
+
+def dhash(path):
+    """差值感知哈希：缩放到 9x8 灰度，比较相邻像素，得到 64 位整数；无法解码时返回 None"""
+    import cv2
+
+    image = cv2.imread(path, cv2.IMREAD_REDUCED_GRAYSCALE_4)
+    if image is None:
+        return None
+    small = cv2.resize(image, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return value
+
+
+class HashCache:
+    """(路径, mtime, 大小) -> 哈希 的持久缓存"""
+
+    def __init__(self, db_path=CACHE_FILE):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(CACHE_SCHEMA)
+
+    def load(self, files):
+        """把缓存中仍然有效的哈希填入 files"""
+        by_path = {f.path: f for f in files}
+        paths = list(by_path)
+        for i in range(0, len(paths), 500):
+            batch = paths[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT path, mtime_ns, size, head, full, phash FROM hashes WHERE path IN ({','.join('?' * len(batch))})",
+                batch)
+            for path, mtime_ns, size, head, full, phash in rows:
+                f = by_path[path]
+                if f.mtime_ns == mtime_ns and f.size == size:
+                    f.head, f.full = head, full
+                    f.phash = int(phash, 16) if phash else None
+
+    def save(self, files):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)",
+                [(f.path, f.mtime_ns, f.size, f.head, f.full, None if f.phash is None else f"{f.phash:016x}")
+                 for f in files
+                 if f.head or f.full or f.phash is not None])
+
+    def close(self):
+        self.conn.close()
+
+
+def _fill(files, attr, func, workers):
+    """并行计算缺失的哈希，返回实际计算的文件数"""
+    todo = [f for f in files if getattr(f, attr) is None]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for f, value in zip(todo, executor.map(func, [f.path for f in todo])):
+            setattr(f, attr, value)
+    return len(todo)
+
+
+def _regroup(groups, key):
+    result = []
+    for group in groups:
+        sub = defaultdict(list)
+        for f in group:
+            sub[key(f)].append(f)
+        result.extend(g for g in sub.values() if len(g) > 1)
+    return result
+
+
+def find_exact_duplicates(files, workers=8):
+    """
+    大小 -> 开头哈希 -> 完整哈希 逐级分组
+    :return:  (重复组列表, {"head": 计算的开头哈希数, "full": 计算的完整哈希数})
+    """
+    by_size = defaultdict(list)
+    for f in files:
+        by_size[f.size].append(f)
+    groups = [g for g in by_size.values() if len(g) > 1]
+
+    candidates = [f for g in groups for f in g]
+    computed = {"head": _fill(candidates, "head", lambda path: hash_file(path, HEAD_BYTES), workers)}
+    groups = _regroup(groups, lambda f: f.head)
+
+    candidates = [f for g in groups for f in g if f.size > HEAD_BYTES]
+    computed["full"] = _fill(candidates, "full", hash_file, workers)
+    groups = _regroup(groups, lambda f: f.full if f.size > HEAD_BYTES else f.head)
+    return groups, computed
+
+
+def find_near_duplicates(files, max_distance=PHASH_DISTANCE, workers=8):
+    """
+    感知哈希汉明距离不超过 max_distance 的图像分组（并查集）
+    64 位分成 max_distance+1 段，距离不超过阈值的两个哈希至少有一段完全相同，只在同段的候选之间比较
+    """
+    computed = _fill(files, "phash", dhash, workers)
+    hashed = [f for f in files if f.phash is not None]
+    parent = list(range(len(hashed)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    bands = max_distance + 1
+    width = 64 // bands
+    for band in range(bands):
+        shift = band * width
+        mask = (1 << (width if band < bands - 1 else 64 - shift)) - 1
+        buckets = defaultdict(list)
+        for i, f in enumerate(hashed):
+            buckets[(f.phash >> shift) & mask].append(i)
+        for members in buckets.values():
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    i, j = members[a], members[b]
+                    if bin(hashed[i].phash ^ hashed[j].phash).count("1") <= max_distance:
+                        parent[find(i)] = find(j)
+
+    groups = defaultdict(list)
+    for i, f in enumerate(hashed):
+        groups[find(i)].append(f)
+    return [g for g in groups.values() if len(g) > 1], computed
+
+
+def choose_keeper(group):
+    """每组保留一张：优先有标注 JSON 的，其次路径排序最前的"""
+    return min(group, key=lambda f: (f.json_path is None, f.path))
+
+
+def build_plan(directories, groups, reason="完全重复"):
+    """每组除保留的一张外，删除图像及其 JSON"""
+    return plan_groups(directories, [(groups, reason)])
+
+
+def plan_groups(directories, group_sets):
+    """
+    按 [(组列表, 原因), ...] 依次生成删除计划，图像与 JSON 都只删除一次
+    JSON 按基础名与图像配对，foo.bmp 与 foo.png 共用 foo.json：同目录下还有同名图像保留时不删除该 JSON，
+    否则保留的那张会丢失标注
+    """
+    plan = Plan(os.path.commonpath([os.path.abspath(d) for d in directories]))
+    deleted = set()
+    json_reasons = {}
+    for groups, reason in group_sets:
+        for group in groups:
+            members = [f for f in group if f.path not in deleted]
+            if len(members) < 2:
+                continue
+            keeper = choose_keeper(members)
+            for f in members:
+                if f is keeper:
+                    continue
+                deleted.add(f.path)
+                plan.extend([Change.delete(f.path, reason)])
+                if f.json_path:
+                    json_reasons.setdefault(f.json_path, reason + "的标注")
+
+    listings = {}
+    for json_path, reason in json_reasons.items():
+        if not _json_still_used(json_path, deleted, listings):
+            plan.extend([Change.delete(json_path, reason)])
+    return plan
+
+
+def _json_still_used(json_path, deleted, listings):
+    """同目录下是否还有不在删除之列、与 JSON 同名的图像"""
+    root = os.path.dirname(json_path)
+    if root not in listings:
+        try:
+            listings[root] = os.listdir(root or ".")
+        except OSError:
+            listings[root] = []
+    base = os.path.splitext(os.path.basename(json_path))[0].lower()
+    for name in listings[root]:
+        stem, ext = os.path.splitext(name.lower())
+        if stem == base and ext in IMAGE_EXTENSIONS and os.path.join(root, name) not in deleted:
+            return True
+    return False
+
+
+def find_duplicates(directories, use_phash=USE_PHASH, cache_path=CACHE_FILE, workers=8):
+    """
+    :return:  (完全重复组, 近似重复组, 统计)
+    """
+    start = time.perf_counter()
+    files = collect_images(directories)
+    cache = HashCache(cache_path)
+    try:
+        cache.load(files)
+        exact, computed = find_exact_duplicates(files, workers)
+        near = []
+        if use_phash:
+            exact_dups = {f.path for g in exact for f in g if f is not choose_keeper(g)}
+            near, computed["phash"] = find_near_duplicates([f for f in files if f.path not in exact_dups],
+                                                          workers=workers)
+        cache.save(files)
+    finally:
+        cache.close()
+    stats = {
+        "files": len(files),
+        "exact_groups": len(exact),
+        "exact_redundant": sum(len(g) - 1 for g in exact),
+        "exact_wasted_mb": sum(g[0].size * (len(g) - 1) for g in exact) / 1024 / 1024,
+        "near_groups": len(near),
+        "computed": computed,
+        "seconds": time.perf_counter() - start,
+    }
+    return exact, near, stats
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("用法: python dup_finder.py <目录> [目录 ...]")
+        return
+    directories = sys.argv[1:]
+    for directory in directories:
+        if not os.path.isdir(directory):
+            print(f"错误: 目录不存在 - {directory}")
+            return
+
+    exact, near, stats = find_duplicates(directories)
+    print(f"扫描 {stats['files']} 张图像, 耗时 {stats['seconds']:.2f} 秒, 本次计算的哈希: {stats['computed']}")
+    print(f"完全重复 {stats['exact_groups']} 组, 多余 {stats['exact_redundant']} 张, "
+          f"占用 {stats['exact_wasted_mb']:.1f} MB; 近似重复 {stats['near_groups']} 组")
+    for group in near:
+        print("近似重复: " + ", ".join(f.path for f in group))
+
+    group_sets = [(exact, "完全重复")]
+    if INCLUDE_NEAR_IN_PLAN:
+        group_sets.append((near, "近似重复"))
+    plan = plan_groups(directories, group_sets)
+    run(plan, dry_run=DRY_RUN, confirm=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+标注数据集持久化索引（SQLite）
+
+每个 JSON 文件记录路径、mtime、大小、是否有配对图像，以及每个 shape 的 label 与外接框；
+再次更新时只重新解析 mtime 或大小变化的文件，删除的文件同步移除。
+label_summary.txt、label_details.csv、invalid_label_files.txt 直接由 SQL 查询生成，无需重新扫描数据集。
+
+用法：
+    python label_index.py <目录> [索引文件]
+"""
+import os
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from label_scanner import VALID_LABELS, scan_tree, parse_labelme, parse_label
+
+INDEX_FILE_NAME = ".label_index.sqlite"
+LABEL_MIN, LABEL_MAX = min(VALID_LABELS), max(VALID_LABELS)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id           INTEGER PRIMARY KEY,
+    path         TEXT UNIQUE NOT NULL,
+    mtime_ns     INTEGER NOT NULL,
+    size         INTEGER NOT NULL,
+    has_image    INTEGER NOT NULL DEFAULT 0,
+    has_shapes   INTEGER NOT NULL DEFAULT 0,
+    image_width  INTEGER,
+    image_height INTEGER,
+    error        TEXT
+);
+CREATE TABLE IF NOT EXISTS shapes (
+    file_id      INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    idx          INTEGER NOT NULL,
+    label        TEXT,
+    label_int    INTEGER,
+    shape_type   TEXT,
+    num_points   INTEGER NOT NULL,
+    x1 REAL, y1 REAL, x2 REAL, y2 REAL,
+    PRIMARY KEY (file_id, idx)
+);
+CREATE INDEX IF NOT EXISTS shapes_label ON shapes(label_int, file_id);
+"""
+
+
+def shape_bounds(shape):
+    """shape 所有点的外接框 (x1, y1, x2, y2)，坐标无效时返回 None"""
+    try:
+        xs, ys = zip(*[(float(point[0]), float(point[1])) for point in shape.get('points') or []])
+    except (ValueError, TypeError, IndexError):
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def shape_rows(file_id, shapes):
+    """把一个文件的 shapes 转为 shapes 表的行"""
+    rows = []
+    for idx, shape in enumerate(shapes):
+        label = shape.get('label')
+        bounds = shape_bounds(shape) or (None, None, None, None)
+        rows.append((file_id, idx, None if label is None else str(label), parse_label(label),
+                     shape.get('shape_type'), len(shape.get('points') or []), *bounds))
+    return rows
+
+
+class LabelIndex:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def update(self, directory, workers=8):
+        """
+        按 mtime/大小增量更新索引
+        :return:  {"scanned", "parsed", "removed", "seconds"}
+        """
+        start = time.perf_counter()
+        directory = os.path.abspath(directory)
+        json_paths, images = scan_tree(directory)
+        known = {path: (file_id, mtime_ns, size) for file_id, path, mtime_ns, size in
+                 self.conn.execute("SELECT id, path, mtime_ns, size FROM files WHERE path >= ? AND path < ?",
+                                   (directory + os.sep, directory + chr(ord(os.sep) + 1)))}
+
+        changed = []
+        pairs = []
+        for path in json_paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            root = os.path.dirname(path)
+            base = os.path.splitext(os.path.basename(path))[0].lower()
+            has_image = int(base in images.get(root, ()))
+            old = known.pop(path, None)
+            if old is None or old[1] != st.st_mtime_ns or old[2] != st.st_size:
+                changed.append((path, st, has_image))
+            else:
+                pairs.append((has_image, old[0]))
+
+        with self.conn:
+            # 剩下的是已删除的文件
+            self.conn.executemany("DELETE FROM files WHERE id = ?", [(v[0],) for v in known.values()])
+            # 图像可能单独增删，配对状态每次都刷新
+            self.conn.executemany("UPDATE files SET has_image = ? WHERE id = ? AND has_image != ?",
+                                  [(has_image, file_id, has_image) for has_image, file_id in pairs])
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                records = executor.map(parse_labelme, [item[0] for item in changed])
+                for (path, st, has_image), record in zip(changed, records):
+                    self._store(path, st, has_image, record)
+
+        return {"scanned": len(json_paths), "parsed": len(changed), "removed": len(known),
+                "seconds": time.perf_counter() - start}
+
+    def _store(self, path, st, has_image, record):
+        self.conn.execute(
+            "INSERT INTO files (path, mtime_ns, size, has_image, has_shapes, image_width, image_height, error) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size, "
+            "has_image = excluded.has_image, has_shapes = excluded.has_shapes, "
+            "image_width = excluded.image_width, image_height = excluded.image_height, error = excluded.error",
+            (path, st.st_mtime_ns, st.st_size, has_image, int(record.has_shapes),
+             record.image_width, record.image_height, record.error))
+        file_id = self.conn.execute("SELECT id FROM files WHERE path = ?", (path,)).fetchone()[0]
+        self.conn.execute("DELETE FROM shapes WHERE file_id = ?", (file_id,))
+        self.conn.executemany("INSERT INTO shapes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                              shape_rows(file_id, record.shapes))
+
+    def label_file_count(self):
+        """每个合法 label 出现的文件数"""
+        return dict(self.conn.execute(
+            "SELECT label_int, COUNT(DISTINCT file_id) FROM shapes WHERE label_int BETWEEN ? AND ? "
+            "GROUP BY label_int", (LABEL_MIN, LABEL_MAX)))
+
+    def label_file_names(self, name_func=None):
+        """每个合法 label 出现的文件名（按路径排序）"""
+        name_func = name_func or (lambda file_name: file_name)
+        names = defaultdict(list)
+        for label, path in self.conn.execute(
+                "SELECT DISTINCT s.label_int, f.path FROM shapes s JOIN files f ON f.id = s.file_id "
+                "WHERE s.label_int BETWEEN ? AND ? ORDER BY f.path", (LABEL_MIN, LABEL_MAX)):
+            names[label].append(name_func(os.path.basename(path)))
+        return names
+
+    def invalid_files(self):
+        """label 不是 1~37 整数的文件：{文件名: 非法label集合}，与 check_label 的口径相同"""
+        invalid = defaultdict(set)
+        for path, label, label_int in self.conn.execute(
+                "SELECT f.path, s.label, s.label_int FROM shapes s JOIN files f ON f.id = s.file_id "
+                "WHERE s.label IS NOT NULL AND (s.label_int IS NULL OR s.label_int NOT BETWEEN ? AND ?) "
+                "ORDER BY f.path", (LABEL_MIN, LABEL_MAX)):
+            invalid[os.path.basename(path)].add(label if label_int is None else label_int)
+        return dict(invalid)
+
+    def counts(self):
+        """文件数、框数、无配对图像与无法解析的文件数"""
+        files, orphans, errors = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(has_image = 0), 0), COUNT(error) FROM files").fetchone()
+        shapes = self.conn.execute("SELECT COUNT(*) FROM shapes").fetchone()[0]
+        return {"files": files, "shapes": shapes, "orphan_json": orphans, "unreadable": errors}
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("用法: python label_index.py <目录> [索引文件]")
+        return
+    directory = sys.argv[1]
+    if not os.path.isdir(directory):
+        print("指定的路径不是目录！")
+        return
+    db_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(directory, INDEX_FILE_NAME)
+
+    from check_label import save_results_to_txt
+    from statisttics_label_v2 import extract_filename, save_summary_to_txt, save_details_to_csv
+
+    with LabelIndex(db_path) as index:
+        result = index.update(directory)
+        print(f"扫描 {result['scanned']} 个JSON, 重新解析 {result['parsed']} 个, 移除 {result['removed']} 个, "
+              f"耗时 {result['seconds']:.2f} 秒")
+
+        start = time.perf_counter()
+        label_file_count = index.label_file_count()
+        save_results_to_txt(index.invalid_files(), "invalid_label_files.txt")
+        save_summary_to_txt(label_file_count, "label_summary.txt")
+        save_details_to_csv(label_file_count, index.label_file_names(extract_filename), "label_details.csv")
+        print(f"报表生成耗时 {(time.perf_counter() - start) * 1000:.1f} ms, 索引概况: {index.counts()}")
+    print("结果已保存到 invalid_label_files.txt, label_summary.txt, label_details.csv")
+
+
+if __name__ == "__main__":
+    main()
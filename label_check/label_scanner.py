@@ -0,0 +1,325 @@
+"""
+标注数据集单次扫描
+
+用 os.scandir 遍历一次目录，JSON 在线程池/进程池中并行解析，每个文件只读一次，
+解析结果依次交给各项检查与统计（Check），一次扫描得到全部质检结果：
+    LabelValidityCheck   label 是否为 1~37 的整数
+    LabelStatistics      每个 label 出现的文件数与文件名
+    SmallBoxCheck        最大边长不超过阈值的小框
+    LabelRemovalCheck    含指定 label（默认 33）或缺少 label 键的文件
+    OrphanCheck          没有配对 BMP 的 JSON、没有配对 JSON 的 BMP
+
+用法：
+    python label_scanner.py <目录> [线程数]
+"""
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from labelme_reader import read_labelme
+
+# 合法的label范围
+VALID_LABELS = set(range(1, 38))  # 1到37的整数
+IMAGE_EXTENSIONS = ('.bmp', '.dib')
+
+
+class LabelRecord:
+    """一个 JSON 文件的解析结果（不含 imageData）"""
+    __slots__ = ("path", "shapes", "has_shapes", "image_path", "image_width", "image_height", "has_image", "error")
+
+    def __init__(self, path, shapes=None, has_shapes=False, image_path=None, image_width=None, image_height=None,
+                 error=None):
+        self.path = path
+        self.shapes = shapes or []
+        self.has_shapes = has_shapes
+        self.image_path = image_path
+        self.image_width = image_width
+        self.image_height = image_height
+        self.has_image = False
+        self.error = error
+
+    @property
+    def file_name(self):
+        return os.path.basename(self.path)
+
+    def __getstate__(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
+
+def parse_labelme(path):
+    """解析一个 labelme JSON，跳过 imageData，只保留需要的字段（进程池中调用时需为模块级函数）"""
+    try:
+        data = read_labelme(path)
+    except Exception as e:
+        return LabelRecord(path, error=str(e))
+    return LabelRecord(path, shapes=data.get('shapes', []), has_shapes='shapes' in data,
+                       image_path=data.get('imagePath'), image_width=data.get('imageWidth'),
+                       image_height=data.get('imageHeight'))
+
+
+def scan_tree(directory):
+    """
+    用 os.scandir 递归遍历目录，一次得到全部 JSON 路径与图像文件
+    :return: (json 路径列表, {目录: {小写的图像基础名: [路径, ...]}})，同名不同扩展名（foo.bmp、foo.dib、
+             foo.BMP）的图像都保留；目录取 os.path.dirname(路径)，
+             与 JSON 路径的 dirname 一致（传入的目录带不带结尾的 / 都能配对）
+    """
+    json_paths = []
+    images = defaultdict(dict)
+    stack = [directory]
+    while stack:
+        root = stack.pop()
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    lower = entry.name.lower()
+                    if lower.endswith('.json'):
+                        json_paths.append(entry.path)
+                    elif lower.endswith(IMAGE_EXTENSIONS):
+                        images[os.path.dirname(entry.path)].setdefault(os.path.splitext(lower)[0], []).append(
+                            entry.path)
+        except OSError as e:
+            print(f"无法读取目录: {root} 错误: {e}")
+    json_paths.sort()
+    return json_paths, images
+
+
+def parse_label(label):
+    """label 转为整数，非整数返回 None"""
+    try:
+        return int(label)
+    except (ValueError, TypeError):
+        return None
+
+
+def box_max_side(shape):
+    """两点矩形的最大边长，坐标无效时返回 None"""
+    points = shape.get('points')
+    if not points or len(points) != 2:
+        return None
+    try:
+        [[x1, y1], [x2, y2]] = [[float(coord) for coord in point] for point in points]
+    except (ValueError, TypeError):
+        return None
+    return max(abs(x2 - x1), abs(y2 - y1))
+
+
+class Check:
+    """检查项基类：visit 依次接收每个文件的解析结果（主线程中调用），finish 在扫描结束后调用"""
+    name = "check"
+
+    def visit(self, record):
+        raise NotImplementedError
+
+    def visit_image(self, path):
+        """没有配对 JSON 的图像文件"""
+
+    def finish(self):
+        pass
+
+    def summary(self):
+        """一行文字概要"""
+        return self.name
+
+
+class LabelValidityCheck(Check):
+    """label 不是 1~37 整数的文件"""
+    name = "非法label"
+
+    def __init__(self):
+        self.invalid_files = {}  # 文件名 -> 非法label集合
+
+    def visit(self, record):
+        invalid = set()
+        for shape in record.shapes:
+            label = shape.get('label')
+            if label is not None:
+                value = parse_label(label)
+                if value is None:
+                    invalid.add(label)
+                elif value not in VALID_LABELS:
+                    invalid.add(value)
+        if invalid:
+            self.invalid_files[record.file_name] = invalid
+
+    def summary(self):
+        return f"{self.name}: {len(self.invalid_files)} 个文件"
+
+
+class LabelStatistics(Check):
+    """每个合法 label 出现的文件数，以及出现的文件名（statisttics_label_v2 的统计口径）"""
+    name = "label统计"
+
+    def __init__(self, name_func=None):
+        """
+        :param name_func:  文件名 -> 记录用的名称，默认原文件名
+        """
+        self.name_func = name_func or (lambda file_name: file_name)
+        self.label_file_count = defaultdict(int)
+        self.label_file_names = defaultdict(list)
+
+    def visit(self, record):
+        labels = set()
+        for shape in record.shapes:
+            value = parse_label(shape.get('label'))
+            if value in VALID_LABELS:
+                labels.add(value)
+        name = self.name_func(record.file_name)
+        for label in labels:
+            self.label_file_count[label] += 1
+            self.label_file_names[label].append(name)
+
+    def summary(self):
+        return f"{self.name}: {len(self.label_file_count)} 种label, {sum(self.label_file_count.values())} 个文件次"
+
+
+class SmallBoxCheck(Check):
+    """最大边长不超过 min_side 的框（del_json_under16-pixles 的删除口径）"""
+    name = "小框"
+
+    def __init__(self, min_side=16):
+        self.min_side = min_side
+        self.files = {}  # 路径 -> (保留框数, 需删除框数)
+        self.empty_files = []  # 删除小框后没有标注的文件
+
+    def visit(self, record):
+        if not record.has_shapes:
+            return
+        kept = removed = 0
+        for shape in record.shapes:
+            side = box_max_side(shape)
+            if side is not None and side > self.min_side:
+                kept += 1
+            else:
+                removed += 1
+        if removed:
+            self.files[record.path] = (kept, removed)
+        if not kept:
+            self.empty_files.append(record.path)
+
+    def summary(self):
+        boxes = sum(r for _, r in self.files.values())
+        return f"{self.name}(<= {self.min_side}px): {boxes} 个框, {len(self.files)} 个文件, 删后为空 {len(self.empty_files)}"
+
+
+class LabelRemovalCheck(Check):
+    """含指定 label 或缺少 label 键的文件（del-label_check-null 的删除口径）"""
+    name = "待删除label"
+
+    def __init__(self, label="33"):
+        self.label = label
+        self.files = {}  # 路径 -> 该label的框数
+        self.missing_label_files = []
+
+    def visit(self, record):
+        if any('label' not in shape for shape in record.shapes):
+            self.missing_label_files.append(record.path)
+        count = sum(1 for shape in record.shapes if shape.get('label') == self.label)
+        if count:
+            self.files[record.path] = count
+
+    def summary(self):
+        return (f"{self.name} '{self.label}': {len(self.files)} 个文件, "
+                f"缺少label键 {len(self.missing_label_files)} 个文件")
+
+
+class OrphanCheck(Check):
+    """没有配对图像的 JSON 与没有配对 JSON 的图像"""
+    name = "未配对文件"
+
+    def __init__(self):
+        self.orphan_json = []
+        self.orphan_images = []
+        self.unreadable = []  # JSON 解析失败
+
+    def visit(self, record):
+        if record.error:
+            self.unreadable.append((record.path, record.error))
+        if not record.has_image:
+            self.orphan_json.append(record.path)
+
+    def visit_image(self, path):
+        self.orphan_images.append(path)
+
+    def summary(self):
+        return (f"{self.name}: 无BMP的JSON {len(self.orphan_json)} 个, 无JSON的BMP {len(self.orphan_images)} 个, "
+                f"无法解析 {len(self.unreadable)} 个")
+
+
+def scan(directory, checks, workers=8, use_processes=False, parser=parse_labelme, chunksize=64):
+    """
+    扫描目录并把每个 JSON 的解析结果交给所有检查项
+    :param checks:         Check 实例列表
+    :param workers:        并行解析的线程/进程数
+    :param use_processes:  True 使用进程池（大数据集解析为CPU瓶颈时）
+    :param parser:         单文件解析函数 path -> LabelRecord
+    :return:               扫描的 JSON 文件数
+    """
+    json_paths, images = scan_tree(directory)
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    paired = defaultdict(set)
+    count = 0
+    with executor_cls(max_workers=workers) as executor:
+        kwargs = {"chunksize": chunksize} if use_processes else {}
+        for record in executor.map(parser, json_paths, **kwargs):
+            root = os.path.dirname(record.path)
+            base = os.path.splitext(os.path.basename(record.path))[0].lower()
+            record.has_image = base in images.get(root, ())
+            if record.has_image:
+                paired[root].add(base)
+            for check in checks:
+                check.visit(record)
+            count += 1
+    for root, names in images.items():
+        for base, paths in names.items():
+            if base not in paired[root]:
+                for path in paths:
+                    for check in checks:
+                        check.visit_image(path)
+    for check in checks:
+        check.finish()
+    return count
+
+
+def default_checks(min_side=16, removal_label="33", name_func=None):
+    """常用的全部检查项"""
+    return [LabelValidityCheck(), LabelStatistics(name_func), SmallBoxCheck(min_side),
+            LabelRemovalCheck(removal_label), OrphanCheck()]
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("用法: python label_scanner.py <目录> [线程数]")
+        return
+    directory = sys.argv[1]
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    if not os.path.isdir(directory):
+        print("指定的路径不是目录！")
+        return
+
+    from check_label import save_results_to_txt
+    from statisttics_label_v2 import extract_filename, save_summary_to_txt, save_details_to_csv
+
+    checks = default_checks(name_func=extract_filename)
+    validity, statistics = checks[0], checks[1]
+    count = scan(directory, checks, workers=workers)
+    print(f"共扫描 {count} 个JSON文件")
+    for check in checks:
+        print(check.summary())
+
+    save_results_to_txt(validity.invalid_files, "invalid_label_files.txt")
+    save_summary_to_txt(statistics.label_file_count, "label_summary.txt")
+    save_details_to_csv(statistics.label_file_count, statistics.label_file_names, "label_details.csv")
+    print("结果已保存到 invalid_label_files.txt, label_summary.txt, label_details.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+labelme JSON 快速读取
+
+labelme 文件中的 imageData 是整幅图像的 base64 字符串（常有数MB），而质检脚本只需要 shapes 等少量字段。
+read_labelme 用 mmap 在原始字节中定位 imageData 的字符串值并整体跳过，只把其余部分交给 json 解析，
+不会在内存中生成 imageData 字符串；需要改写文件时再用 load_labelme 完整读取。
+"""
+import json
+import mmap
+
+IMAGE_DATA_KEY = b'"imageData"'
+_WHITESPACE = b' \t\r\n'
+
+
+def _skip_whitespace(buf, pos):
+    while pos < len(buf) and buf[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _string_end(buf, start):
+    """start 为字符串起始引号的位置，返回结束引号之后的位置（处理转义引号）"""
+    pos = start + 1
+    while True:
+        pos = buf.find(b'"', pos)
+        if pos < 0:
+            raise ValueError("字符串未结束")
+        backslashes = 0
+        while buf[pos - 1 - backslashes] == 0x5C:  # '\\'
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return pos + 1
+        pos += 1
+
+
+def _image_data_span(buf):
+    """返回 imageData 字符串值在 buf 中的 [start, end) 区间，不存在或不是字符串时返回 None"""
+    key = buf.find(IMAGE_DATA_KEY)
+    while key > 0 and buf[key - 1] == 0x5C:  # 出现在其他字符串内部（被转义），继续查找
+        key = buf.find(IMAGE_DATA_KEY, key + 1)
+    if key < 0:
+        return None
+    pos = _skip_whitespace(buf, key + len(IMAGE_DATA_KEY))
+    if pos >= len(buf) or buf[pos] != 0x3A:  # ':'
+        return None
+    pos = _skip_whitespace(buf, pos + 1)
+    if pos >= len(buf) or buf[pos] != 0x22:  # '"'
+        return None
+    return pos, _string_end(buf, pos)
+
+
+def read_labelme(path):
+    """
+    读取 labelme JSON，跳过 imageData（结果中 imageData 为 None）
+    :return: 与 json.load 相同结构的字典
+    """
+    with open(path, 'rb') as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 空文件无法 mmap
+            return json.loads(f.read().decode('utf-8'))
+    with buf:
+        span = _image_data_span(buf)
+        if span is None:
+            return json.loads(buf[:].decode('utf-8'))
+        start, end = span
+        text = buf[:start] + b'null' + buf[end:]
+    return json.loads(text.decode('utf-8'))
+
+
+def load_labelme(path):
+    """完整读取（含 imageData），用于需要改写并保存的场景"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
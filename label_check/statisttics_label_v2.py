@@ -1,7 +1,8 @@
 import os
-import json
 import csv
-from collections import defaultdict
+
+from labelme_reader import read_labelme
+from label_scanner import LabelStatistics, scan
 
 # 合法的label范围
 VALID_LABELS = set(range(1, 38))  # 1到37的整数
@@ -62,8 +63,7 @@ def extract_filename(file_name):
 
 def count_labels_in_json(file_path):
     """统计单个JSON文件中的label数量"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = read_labelme(file_path)  # 跳过 imageData
 
     labels = set()
     for shape in data.get('shapes', []):
@@ -81,25 +81,10 @@ def count_labels_in_json(file_path):
 
 def count_labels_in_directory(directory):
     """统计指定目录下所有JSON文件中的label数量，并记录文件名"""
-    label_file_count = defaultdict(int)  # 统计每个label的数量
-    label_file_names = defaultdict(list)  # 记录每个label出现的文件名
-
-    # 遍历目录下的所有文件
-    for root, _, files in os.walk(directory):
-        for file_name in files:
-            if file_name.endswith('.json'):
-                file_path = os.path.join(root, file_name)
-                labels = count_labels_in_json(file_path)
-
-                # 提取文件名中第3个'_'之后、第1个'.'之前的部分
-                extracted_name = extract_filename(file_name)
-
-                # 更新统计结果
-                for label in labels:
-                    label_file_count[label] += 1
-                    label_file_names[label].append(extracted_name)
-
-    return label_file_count, label_file_names
+    # 单次并行扫描，文件名记录第3个'_'之后、第1个'.'之前的部分
+    statistics = LabelStatistics(name_func=extract_filename)
+    scan(directory, [statistics])
+    return statistics.label_file_count, statistics.label_file_names
 
 
 def save_summary_to_txt(label_file_count, output_file):
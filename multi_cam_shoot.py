@@ -9,75 +9,130 @@ from ctypes import *
 from threading import Lock
 sys.path.append("./MvImport")
 from MvImport.MvCameraControl_class import *
+from frame_pool import FramePool
+from frame_writer import FrameWriter, codec_filename
+from pixel_convert import FrameConverter, pixel_format_name
+from grab_thread import GrabThread, GRAB_MODES, GRAB_MODE_CALLBACK, GRAB_MODE_PULL
+from camera_profile import profile_for, apply_profile
+from device_manager import DeviceManager, device_serial, format_stats
 
 # 全局配置
 SAVE_PATH = "./multi_cam_photos/"
 os.makedirs(SAVE_PATH, exist_ok=True)
 TRIGGER_SOURCE = 0x0001  # 假设所有相机使用Line0作为触发源
-FrameInfoCallBack = CFUNCTYPE(None, POINTER(c_ubyte), POINTER(MV_FRAME_OUT_INFO_EX), c_void_p)
+GRAB_MODE = GRAB_MODE_CALLBACK  # callback: SDK回调取图；pull: 专用线程 GetImageBuffer 主动取图
+# 编码与写盘在写盘线程中完成，存储编码（无损）：bmp / png / webp / tiff_lzw / tiff_deflate / tiff_zstd
+SAVE_CODEC = "bmp"
+SAVE_CODEC_LEVEL = None
+WRITER_QUEUE_SIZE = 32
+WRITER_WORKERS = 2
+POOL_SLOTS = WRITER_QUEUE_SIZE // 2 + 2  # 每个相机的帧缓存槽位数
+# 相机参数配置（格式同 camera_profiles.json），打开与掉线重连后都按它配置：硬件触发
+PROFILES = {
+    "default": {
+        "TriggerMode": MV_TRIGGER_MODE_ON,
+        # "TriggerSource": TRIGGER_SOURCE,
+        # "TriggerActivation": MV_TRIGGER_ACTIVATION_RISINGEDGE,
+    },
+}
+STATS_INTERVAL = 10  # 打印相机连接统计的间隔（秒）
+FrameInfoCallBack = MV_CALLBACK_FUNCTYPE(None, POINTER(c_ubyte), POINTER(MV_FRAME_OUT_INFO_EX), c_void_p)
 
 class CameraController:
-    def __init__(self, cam_idx, dev_info):
+    def __init__(self, cam_idx, dev_info, writer, grab_mode=GRAB_MODE):
+        if grab_mode not in GRAB_MODES:
+            raise ValueError(f"不支持的取流方式: {grab_mode}")
         self.cam_idx = cam_idx
+        self.grab_mode = grab_mode
         self.dev_info = dev_info
+        self.serial = device_serial(dev_info)
         self.cam = MvCamera()
+        self.writer = writer
         self.frame_counter = 1
         self.lock = Lock()
+        self.is_opened = False
         self.is_grabbing = False
-
-        # 初始化相机实例
-        if self.cam.MV_CC_CreateHandle(dev_info) != 0:
-            raise RuntimeError(f"Camera {cam_idx} 创建句柄失败")
+        self.pool = None
+        self.converter = None
+        self.grab_thread = None
+        self.callback = None
+        self.first_frame_at = None  # 本次开始采集后第一帧的 time.monotonic()
+
+    def open(self):
+        """创建句柄并打开相机，掉线重连时再次调用"""
+        if self.cam.MV_CC_CreateHandle(self.dev_info) != 0:
+            raise RuntimeError(f"Camera {self.cam_idx} 创建句柄失败")
         if self.cam.MV_CC_OpenDevice(MV_ACCESS_Exclusive, 0) != 0:
-            raise RuntimeError(f"Camera {cam_idx} 连接失败")
-
-        # 配置硬件触发
-        self._setup_hardware_trigger()
-
-        # 注册回调
-        self.callback = FrameInfoCallBack(self.image_callback)
-        if self.cam.MV_CC_RegisterImageCallBackEx(self.callback, None) != 0:
-            raise RuntimeError(f"Camera {cam_idx} 注册回调失败")
-
-    def _setup_hardware_trigger(self):
-        """配置硬件触发参数"""
-        params = [
-            ("TriggerMode", MV_TRIGGER_MODE_ON)
-            # ("TriggerSource", TRIGGER_SOURCE)
-            # ("TriggerActivation", MV_TRIGGER_ACTIVATION_RISINGEDGE)
-        ]
-        for param, value in params:
-            if self.cam.MV_CC_SetEnumValue(param, value) != 0:
-                raise RuntimeError(f"Camera {self.cam_idx} 设置{param}失败")
+            self.cam.MV_CC_DestroyHandle()
+            raise RuntimeError(f"Camera {self.cam_idx} 连接失败")
+        self.is_opened = True
+
+    def setup(self, profiles):
+        """按 profiles 配置相机（硬件触发），准备缓存池与取流；重连后再次调用即恢复配置"""
+        result = apply_profile(self.cam, profile_for(profiles, self.serial), cam_idx=self.cam_idx, serial=self.serial)
+        if result.failed:
+            raise RuntimeError(result.summary())
+
+        # 按 PayloadSize 预分配帧缓存池，写盘完成后归还槽位
+        if self.pool is None:
+            self.pool = FramePool.for_camera(self.cam, num_slots=POOL_SLOTS, cam_idx=self.cam_idx)
+            self.converter = FrameConverter()
+
+        if self.grab_mode == GRAB_MODE_PULL:
+            if self.grab_thread is None:
+                self.grab_thread = GrabThread(self.cam, self._on_grabbed, cam_idx=self.cam_idx)
+            self.grab_thread.configure()
+        else:
+            # 注册回调
+            if self.callback is None:
+                self.callback = FrameInfoCallBack(self.image_callback)
+            if self.cam.MV_CC_RegisterImageCallBackEx(self.callback, None) != 0:
+                raise RuntimeError(f"Camera {self.cam_idx} 注册回调失败")
+        return result
 
     def start_grabbing(self):
+        self.first_frame_at = None
         if self.cam.MV_CC_StartGrabbing() == 0:
             self.is_grabbing = True
+            if self.grab_thread is not None:
+                self.grab_thread.start()
             print(f"Camera {self.cam_idx} 开始采集")
         else:
             raise RuntimeError(f"Camera {self.cam_idx} 启动采集失败")
 
     def stop_grabbing(self):
+        if self.grab_thread is not None:
+            self.grab_thread.stop(wait=False)
         self.cam.MV_CC_StopGrabbing()
+        if self.grab_thread is not None:
+            self.grab_thread.stop()
         self.is_grabbing = False
 
     def image_callback(self, pData, pFrameInfo, pUser):
         frame_info = pFrameInfo.contents
+        data_ptr = cast(pData, POINTER(c_ubyte * frame_info.nFrameLen))
+        self.process_frame(frame_info, np.frombuffer(data_ptr.contents, dtype=np.uint8))
+
+    def _on_grabbed(self, raw_slot, frame_info):
+        """取流线程交来的帧（SDK缓冲区已归还）"""
+        self.process_frame(frame_info, raw_slot.buffer[:frame_info.nFrameLen])
+
+    def process_frame(self, frame_info, image_data):
+        if self.first_frame_at is None:
+            self.first_frame_at = time.monotonic()
         print(f"Camera {self.cam_idx} 捕获帧: {frame_info.nFrameNum}")
+        h, w = frame_info.nHeight, frame_info.nWidth
 
-        # 图像数据转换（根据实际格式调整）
-        data_ptr = cast(pData, POINTER(c_ubyte * frame_info.nFrameLen))
-        image_data = np.frombuffer(data_ptr.contents, dtype=np.uint8)
-        if frame_info.enPixelType == 34603039:  # YUV422
-            img = image_data.reshape((frame_info.nHeight, frame_info.nWidth, -1))
-            img = cv2.cvtColor(img, cv2.COLOR_YUV2BGR_Y422)
-        elif frame_info.enPixelType == 35127316:  # Mono8
-            img = image_data.reshape((frame_info.nHeight, frame_info.nWidth))
-            img = cv2.cvtColor(img, cv2.COLOR_BAYER_RG2RGB)
-        elif frame_info.enPixelType == 17301505:  # RGB8
-            img = image_data.reshape((frame_info.nHeight, frame_info.nWidth, 3))
-        else:
-            print(f"不支持的像素格式: 0x{frame_info.enPixelType:x}")
+        slot = self.pool.acquire()
+        if slot is None:
+            print(f"Camera {self.cam_idx} 帧缓存池已满，丢弃该帧")
+            return
+
+        # 转换结果直接写入缓存槽位
+        img = self.converter.convert(frame_info.enPixelType, image_data, h, w, slot.view((h, w, 3)))
+        if img is None:
+            slot.release()
+            print(f"不支持的像素格式: {pixel_format_name(frame_info.enPixelType)}")
             return
 
         # 生成唯一文件名
@@ -89,45 +144,54 @@ class CameraController:
             )
             self.frame_counter += 1
 
-        cv2.imwrite(filename, img)
-        print(f"Camera {self.cam_idx} 保存: {filename}")
+        self.writer.submit(filename, img, on_done=slot.release)  # 交给写盘线程编码
+        print(f"Camera {self.cam_idx} 保存: {codec_filename(filename, SAVE_CODEC)}")
 
-    def release(self):
+    def close(self):
+        """停止采集并关闭相机（掉线后的句柄同样需要关闭、销毁）"""
+        if not self.is_opened:
+            return
         if self.is_grabbing:
             self.stop_grabbing()
         self.cam.MV_CC_CloseDevice()
         self.cam.MV_CC_DestroyHandle()
+        self.is_opened = False
+
+    def release(self):
+        self.close()
 
 def main():
     # 初始化SDK
     MvCamera.MV_CC_Initialize()
 
     # 枚举所有设备
-    device_list = MV_CC_DEVICE_INFO_LIST()
-    ret = MvCamera.MV_CC_EnumDevices(MV_GIGE_DEVICE | MV_USB_DEVICE, device_list)
-    if ret != 0 or device_list.nDeviceNum == 0:
+    manager = DeviceManager(PROFILES)
+    dev_infos = manager.enumerate()
+    if not dev_infos:
         MvCamera.MV_CC_Finalize()
         raise RuntimeError("未找到可用设备")
 
-    # 创建并初始化所有相机控制器
-    controllers = []
+    # 并发打开、配置所有相机，没打开或掉线的相机由设备管理自动重连，不影响其他相机
+    writer = FrameWriter(max_queue=WRITER_QUEUE_SIZE, num_workers=WRITER_WORKERS,
+                         codec=SAVE_CODEC, codec_level=SAVE_CODEC_LEVEL)
     try:
-        for i in range(device_list.nDeviceNum):
-            dev_info = cast(device_list.pDeviceInfo[i], POINTER(MV_CC_DEVICE_INFO)).contents
-            controller = CameraController(cam_idx=i, dev_info=dev_info)
-            controller.start_grabbing()
-            controllers.append(controller)
-            print(f"已连接相机 {i}: {dev_info.SpecialInfo.stGigEInfo.chSerialNumber}")
+        manager.grabbing = True  # 打开后立即开始采集
+        controllers = manager.open_all(
+            lambda i, dev_info: CameraController(cam_idx=i, dev_info=dev_info, writer=writer), dev_infos)
+        for controller in controllers:
+            print(f"相机 {controller.cam_idx}: {controller.serial}")
 
         print("\n所有相机已就绪，等待硬件触发信号...")
         while True:
-            time.sleep(1)  # 主线程保持运行
+            time.sleep(STATS_INTERVAL)  # 主线程保持运行
+            print(format_stats(manager.stats()))
 
     except KeyboardInterrupt:
         print("\n用户终止采集")
     finally:
-        for controller in controllers:
-            controller.release()
+        manager.close()
+        print(format_stats(manager.stats()))
+        writer.close()
         MvCamera.MV_CC_Finalize()
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+像素格式转换注册表
+
+以 PixelType_header 中的像素格式常量为键，统一把相机原始数据转换成 BGR8，
+结果通过 cvtColor 的 dst= 直接写入调用方提供的缓冲区（例如缓存池槽位）。
+可选走SDK的 MV_CC_ConvertPixelTypeEx，启动时用微基准为每种格式挑选更快的实现。
+"""
+import os
+import sys
+import time
+from ctypes import POINTER, c_ubyte, cast, memset, byref, sizeof
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "MvImport"))
+from PixelType_header import (PixelType_Gvsp_Mono8, PixelType_Gvsp_BayerRG8, PixelType_Gvsp_BayerGB8,
+                              PixelType_Gvsp_BayerGR8, PixelType_Gvsp_BayerBG8, PixelType_Gvsp_RGB8_Packed,
+                              PixelType_Gvsp_BGR8_Packed, PixelType_Gvsp_YUV422_Packed,
+                              PixelType_Gvsp_YUV422_YUYV_Packed)
+
+BACKEND_OPENCV = "opencv"
+BACKEND_SDK = "sdk"
+
+
+class PixelFormat:
+    """一种像素格式的转换描述：源数据每像素字节数 + OpenCV 转换码（None 表示原样拷贝）"""
+    __slots__ = ("pixel_type", "name", "src_channels", "cv_code")
+
+    def __init__(self, pixel_type, name, src_channels, cv_code):
+        self.pixel_type = pixel_type
+        self.name = name
+        self.src_channels = src_channels
+        self.cv_code = cv_code
+
+    def src_shape(self, height, width):
+        if self.src_channels == 1:
+            return (height, width)
+        return (height, width, self.src_channels)
+
+    def convert(self, src, height, width, dst):
+        """把一维原始数据 src 转换为 BGR 写入 dst (height, width, 3)"""
+        src = src[:height * width * self.src_channels].reshape(self.src_shape(height, width))
+        if self.cv_code is None:
+            np.copyto(dst, src)
+            return dst
+        return cv2.cvtColor(src, self.cv_code, dst=dst)
+
+
+# 注意 OpenCV 的 Bayer 命名取的是第二行第二、三个像素，
+# 相机的 BayerRG(RGGB) 对应 OpenCV 的 BayerBG，其余依此类推
+PIXEL_FORMATS = {f.pixel_type: f for f in (
+    PixelFormat(PixelType_Gvsp_Mono8, "Mono8", 1, cv2.COLOR_GRAY2BGR),
+    PixelFormat(PixelType_Gvsp_BayerRG8, "BayerRG8", 1, cv2.COLOR_BayerBG2BGR),
+    PixelFormat(PixelType_Gvsp_BayerGB8, "BayerGB8", 1, cv2.COLOR_BayerGR2BGR),
+    PixelFormat(PixelType_Gvsp_BayerGR8, "BayerGR8", 1, cv2.COLOR_BayerGB2BGR),
+    PixelFormat(PixelType_Gvsp_BayerBG8, "BayerBG8", 1, cv2.COLOR_BayerRG2BGR),
+    PixelFormat(PixelType_Gvsp_RGB8_Packed, "RGB8", 3, cv2.COLOR_RGB2BGR),
+    PixelFormat(PixelType_Gvsp_BGR8_Packed, "BGR8", 3, None),
+    PixelFormat(PixelType_Gvsp_YUV422_Packed, "YUV422(UYVY)", 2, cv2.COLOR_YUV2BGR_Y422),
+    PixelFormat(PixelType_Gvsp_YUV422_YUYV_Packed, "YUV422(YUYV)", 2, cv2.COLOR_YUV2BGR_YUYV),
+)}
+
+
+def pixel_format_name(pixel_type):
+    fmt = PIXEL_FORMATS.get(pixel_type)
+    return fmt.name if fmt else f"0x{pixel_type:x}"
+
+
+class SdkPixelConverter:
+    """通过 MV_CC_ConvertPixelTypeEx 转换为 BGR8，参数结构体只分配一次"""
+
+    def __init__(self, cam):
+        from CameraParams_header import MV_CC_PIXEL_CONVERT_PARAM_EX
+        self.cam = cam
+        self.param = MV_CC_PIXEL_CONVERT_PARAM_EX()
+        memset(byref(self.param), 0, sizeof(self.param))
+        self.param.enDstPixelType = PixelType_Gvsp_BGR8_Packed
+
+    def convert(self, pixel_type, src, height, width, dst):
+        p = self.param
+        p.nWidth = width
+        p.nHeight = height
+        p.enSrcPixelType = pixel_type
+        p.pSrcData = cast(src.ctypes.data, POINTER(c_ubyte))
+        p.nSrcDataLen = src.nbytes
+        p.pDstBuffer = cast(dst.ctypes.data, POINTER(c_ubyte))
+        p.nDstBufferSize = dst.nbytes
+        ret = self.cam.MV_CC_ConvertPixelTypeEx(p)
+        if ret != 0:
+            raise RuntimeError(f"SDK像素格式转换失败 {pixel_format_name(pixel_type)} ret[0x{ret:x}]")
+        return dst
+
+
+class FrameConverter:
+    def __init__(self, cam=None):
+        """
+        :param cam:  已打开的相机实例；提供时可使用SDK转换后端，否则只用 OpenCV
+        """
+        self.sdk = SdkPixelConverter(cam) if cam is not None else None
+        self.backends = {t: BACKEND_OPENCV for t in PIXEL_FORMATS}
+
+    def supports(self, pixel_type):
+        return pixel_type in PIXEL_FORMATS
+
+    def convert(self, pixel_type, src, height, width, dst):
+        """
+        把一帧原始数据转换为 BGR8 写入 dst
+        :param src:  一维 uint8 原始数据（可以是SDK缓冲区的视图）
+        :param dst:  形状为 (height, width, 3) 的 uint8 目标缓冲区
+        :return:     dst；不支持的像素格式返回 None
+        """
+        fmt = PIXEL_FORMATS.get(pixel_type)
+        if fmt is None:
+            return None
+        if self.backends[pixel_type] == BACKEND_SDK:
+            return self.sdk.convert(pixel_type, src, height, width, dst)
+        return fmt.convert(src, height, width, dst)
+
+    def calibrate(self, width, height, repeat=10):
+        """
+        微基准：对每种格式分别测 OpenCV 与SDK后端的单帧耗时，选用较快者
+        :return:  {格式名: {后端: 单帧毫秒}}
+        """
+        results = {}
+        dst = np.empty((height, width, 3), dtype=np.uint8)
+        for pixel_type, fmt in PIXEL_FORMATS.items():
+            src = np.random.randint(0, 256, height * width * fmt.src_channels, dtype=np.uint8)
+            timings = {BACKEND_OPENCV: _time_per_call(lambda: fmt.convert(src, height, width, dst), repeat)}
+            if self.sdk is not None:
+                try:
+                    timings[BACKEND_SDK] = _time_per_call(
+                        lambda: self.sdk.convert(pixel_type, src, height, width, dst), repeat)
+                except RuntimeError as e:
+                    print(f"SDK后端不支持 {fmt.name}: {e}")
+            self.backends[pixel_type] = min(timings, key=timings.get)
+            results[fmt.name] = {k: v * 1000 for k, v in timings.items()}
+        return results
+
+
+def _time_per_call(fn, repeat):
+    fn()  # 预热
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == "__main__":
+    # 无相机时只测 OpenCV 后端
+    converter = FrameConverter()
+    for name, timing in converter.calibrate(1280, 1024).items():
+        print(f"{name:14s} " + "  ".join(f"{k}: {v:.2f} ms" for k, v in timing.items()))
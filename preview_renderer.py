@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+预览缩略图渲染
+
+采集界面每个格子只有 360x240，原来每帧都把整幅图像交给界面线程转换、交换通道、缩放，
+界面线程的开销随传感器分辨率增长。这里改为：
+    - 相机线程只把帧槽位放进按 (相机, 位置) 划分的信箱，信箱中尚未渲染的旧帧直接丢弃（归还槽位）
+    - 后台线程按每个格子的帧率上限取出最新帧，缩放到格子大小并生成 QImage
+    - 界面线程只收到小图，设置 QPixmap 即可
+"""
+import threading
+import time
+
+import cv2
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QImage
+
+PREVIEW_SIZE = (360, 240)
+PREVIEW_FPS = 5.0  # 每个格子的最高刷新率，0 表示不限
+
+
+def fit_size(width, height, box):
+    """保持比例缩放到 box 以内的尺寸"""
+    scale = min(box[0] / width, box[1] / height)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def render_preview(img, size=PREVIEW_SIZE):
+    """把 BGR 图像缩放到 size 以内并生成 QImage（自有内存，可跨线程传递）"""
+    h, w = img.shape[:2]
+    target = fit_size(w, h, size)
+    step = max(1, w // target[0] // 2)  # 缩小倍数较大时先隔点抽取，再做区域插值
+    small = cv2.resize(img[::step, ::step], target, interpolation=cv2.INTER_AREA)
+    if small.ndim == 2:
+        small = cv2.cvtColor(small, cv2.COLOR_GRAY2BGR)
+    sh, sw = small.shape[:2]
+    return QImage(small.data, sw, sh, small.strides[0], QImage.Format_BGR888).copy()
+
+
+class PreviewRenderer(QObject):
+    preview_ready = pyqtSignal(int, int, object)  # cam_idx, pos_idx, QImage
+
+    def __init__(self, size=PREVIEW_SIZE, fps=PREVIEW_FPS):
+        """
+        :param size:  缩略图最大尺寸 (宽, 高)
+        :param fps:   每个格子的最高刷新率，0 表示不限
+        """
+        super().__init__()
+        self.size = size
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self._pending = {}  # (cam_idx, pos_idx) -> 最新的槽位
+        self._last = {}  # (cam_idx, pos_idx) -> 上次渲染时间
+        self._cond = threading.Condition()
+        self._closed = False
+        self.rendered = 0
+        self.dropped = 0
+        self.render_time = 0.0
+        self._thread = threading.Thread(target=self._run, daemon=True, name="PreviewRenderer")
+        self._thread.start()
+
+    def submit(self, cam_idx, pos_idx, slot):
+        """提交一帧预览（任意线程），接管 slot 的一个引用；同一格子尚未渲染的旧帧被丢弃"""
+        with self._cond:
+            if self._closed:
+                slot.release()
+                return
+            old = self._pending.get((cam_idx, pos_idx))
+            self._pending[(cam_idx, pos_idx)] = slot
+            if old is not None:
+                self.dropped += 1
+            self._cond.notify()
+        if old is not None:
+            old.release()
+
+    def _next(self):
+        """取出一个已到刷新时间的格子，没有时等待"""
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                now = time.monotonic()
+                due = None
+                for key in self._pending:
+                    ready_at = self._last.get(key, 0.0) + self.interval
+                    if ready_at <= now:
+                        self._last[key] = now
+                        return key, self._pending.pop(key)
+                    due = ready_at if due is None else min(due, ready_at)
+                self._cond.wait(None if due is None else due - now)
+
+    def _run(self):
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            (cam_idx, pos_idx), slot = item
+            start = time.perf_counter()
+            try:
+                qimage = render_preview(slot.image, self.size)
+            except Exception as e:
+                print(f"预览渲染失败: {e}")
+                continue
+            finally:
+                slot.release()
+            self.render_time += time.perf_counter() - start
+            self.rendered += 1
+            self.preview_ready.emit(cam_idx, pos_idx, qimage)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "rendered": self.rendered,
+                "dropped": self.dropped,
+                "pending": len(self._pending),
+                "render_ms_mean": self.render_time * 1000 / self.rendered if self.rendered else 0.0,
+            }
+
+    def close(self):
+        """停止渲染线程并归还未渲染的槽位"""
+        with self._cond:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._cond.notify_all()
+        self._thread.join()
+        for slot in pending:
+            slot.release()
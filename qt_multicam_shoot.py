@@ -4,143 +4,189 @@ import os
 import cv2
 import numpy as np
 import datetime
+import time
 from ctypes import *
 from threading import Lock
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit
-from PyQt5.QtGui import QImage, QPixmap, QFont, QColor
-from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from PyQt5.QtGui import QPixmap, QFont, QColor
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QTimer
 
 sys.path.append("./MvImport")
 from MvImport.MvCameraControl_class import *
+from frame_writer import FrameWriter, codec_filename, format_stats
+from frame_container import FrameContainerWriter
+from frame_pool import FramePool
+from pixel_convert import FrameConverter, pixel_format_name
+from grab_thread import GrabThread, GRAB_MODES, GRAB_MODE_CALLBACK, GRAB_MODE_PULL
+from frame_aggregator import FrameAggregator, format_stats as format_group_stats
+from preview_renderer import PreviewRenderer, PREVIEW_SIZE, PREVIEW_FPS  # 格子大小与刷新率上限，与采集服务共用
+from camera_profile import PROFILE_FILE, DEFAULT_PROFILES, load_profiles, profile_for, apply_profile
+from device_manager import DeviceManager, format_stats as format_device_stats
 
 SAVE_PATH = "./multi_cam_photos/"
 TRIGGER_SOURCE = 0x0001
+# 写盘队列配置：3相机 x 4帧连拍，默认可缓存4次触发
+WRITER_QUEUE_SIZE = 48
+WRITER_WORKERS = 2
+WRITER_POLICY = "block"  # block / drop_oldest / drop_newest
+WRITER_BLOCK_TIMEOUT = 0.5
+# 存储编码（无损）：bmp / png / webp / tiff_lzw / tiff_deflate / tiff_zstd，选择方法见 bench_codecs.py
+SAVE_CODEC = "bmp"
+SAVE_CODEC_LEVEL = None  # png 压缩级别 0~9，None 使用默认值
+# 保存方式：files 每帧一个文件；container 每次运行（一个班次）追加到一个会话容器，用 frame_container.py export 导出
+SAVE_MODE = "files"
+# 每个相机的帧缓存槽位数：显示占用4个 + 写盘队列中的帧
+POOL_SLOTS = 24
+# 取流方式：callback 在SDK回调线程中处理；pull 由专用线程 GetImageBuffer 主动取流
+GRAB_MODE = GRAB_MODE_CALLBACK
+GRAB_NODE_NUM = 16  # pull 模式下的SDK缓存节点数
+# 多相机同步分组：按设备时间戳把同一次曝光的帧归为一组（相机需开启PTP时钟同步，否则改用 host）
+BURST_FRAMES = 4  # 与 AcquisitionBurstFrameCount 一致
+GROUP_TIME_SOURCE = "device"
+GROUP_SKEW_MS = 5
+GROUP_TIMEOUT_MS = 500
+GROUP_FRAME_INTERVAL_MS = 200  # 连拍帧间隔，1000 / AcquisitionFrameRate
+GROUP_TRIGGER_GAP_MS = 300
 os.makedirs(SAVE_PATH, exist_ok=True)
-FrameInfoCallBack = CFUNCTYPE(None, POINTER(c_ubyte), POINTER(MV_FRAME_OUT_INFO_EX), c_void_p)
+FrameInfoCallBack = MV_CALLBACK_FUNCTYPE(None, POINTER(c_ubyte), POINTER(MV_FRAME_OUT_INFO_EX), c_void_p)
 
 
 class CameraSignals(QObject):
-    update_image = pyqtSignal(int, int, np.ndarray)  # cam_idx, pos_idx, image
+    update_image = pyqtSignal(int, int, object)  # cam_idx, pos_idx, FrameSlot（槽函数用完后需 release）
     update_filename = pyqtSignal(str)
-    update_trigger_no = pyqtSignal(int)
     update_system_info = pyqtSignal(str)
 
 
 class CameraController(QObject):
-    def __init__(self, cam_idx, dev_info):
+    def __init__(self, cam_idx, dev_info, writer, aggregator, grab_mode=GRAB_MODE):
         super().__init__()
+        if grab_mode not in GRAB_MODES:
+            raise ValueError(f"不支持的取流方式: {grab_mode}")
         self.cam_idx = cam_idx
+        self.grab_mode = grab_mode
         self.dev_info = dev_info
+        self.writer = writer  # 异步写盘，回调中只入队
+        self.aggregator = aggregator  # 多相机同步分组，集齐后经 deliver 交回各相机
         self.cam = MvCamera()
-        self.frame_counter = 1
         self.lock = Lock()
+        self.is_opened = False
         self.is_grabbing = False
         self.signals = CameraSignals()
-        self.recent_images = [None] * 4  # 固定4个位置存储图像
-        self.current_pos = 0  # 当前写入位置
-
-        # 初始化相机
-        if self.cam.MV_CC_CreateHandle(dev_info) != 0:
-            raise RuntimeError(f"Camera {cam_idx} 创建相机句柄失败")
+        self.recent_images = [None] * BURST_FRAMES  # 按连拍序号存储图像（持有缓存池槽位的引用）
+        self.serial = device_name(dev_info)[1]
+        self.profile_result = None
+        self.pool = None
+        self.converter = None
+        self.grab_thread = None
+        self.callback = None
+        self.first_frame_at = None  # 本次开始采集后第一帧的 time.monotonic()
+
+    def open(self):
+        """创建句柄并打开相机（可能较慢，由 DeviceManager 在线程池中调用），掉线重连时再次调用"""
+        if self.cam.MV_CC_CreateHandle(self.dev_info) != 0:
+            raise RuntimeError(f"Camera {self.cam_idx} 创建相机句柄失败")
         if self.cam.MV_CC_OpenDevice(MV_ACCESS_Exclusive, 0) != 0:
-            raise RuntimeError(f"Camera {cam_idx} 连接失败")
-
-        # 配置相机参数
-        self._setup_camera_params()
-        self._setup_hardware_trigger()
-        self._setup_camera_params_int()
-        self._setup_camera_params_bool()
-
-        # 注册回调
-        self.callback = FrameInfoCallBack(self.image_callback)
-        if self.cam.MV_CC_RegisterImageCallBackEx(self.callback, None) != 0:
-            raise RuntimeError(f"Camera {cam_idx} 注册回调失败")
-
-    def _setup_camera_params(self):
-        """配置曝光和增益"""
-        params = [
-            ("ExposureTime", 20000),
-            ("Gain", 5),
-            ("AcquisitionFrameRate", 5)
-            # ("AcquisitionLineRateEnable", True)
-        ]
-        for param, value in params:
-            if self.cam.MV_CC_SetFloatValue(param, value) != 0:
-                raise RuntimeError(f"Camera {self.cam_idx} 设置{param}失败")
-
-    def _setup_camera_params_int(self):
-        params = [
-            ("AcquisitionBurstFrameCount", 4)
-        ]
-        for param, value in params:
-            if self.cam.MV_CC_SetIntValue(param, value) != 0:
-                raise RuntimeError(f"Camera {self.cam_idx} 设置{param}失败")
-
-    def _setup_camera_params_bool(self):
-        params = [
-            ("AcquisitionFrameRateEnable", True)
-        ]
-        for param, value in params:
-            if self.cam.MV_CC_SetBoolValue(param, value) != 0:
-                raise RuntimeError(f"Camera {self.cam_idx} 设置{param}失败")
-
-    def _setup_hardware_trigger(self):
-        """硬件触发配置"""
-        params = [
-            ("TriggerMode", MV_TRIGGER_MODE_ON),
-            ("TriggerSource", 0),
-            ("TriggerActivation", 0),
-            ("AcquisitionMode", 2)  # 0: SingleFrame 1: MultiFrame 2: Continuous
-        ]
-        for param, value in params:
-            if self.cam.MV_CC_SetEnumValue(param, value) != 0:
-                raise RuntimeError(f"Camera {self.cam_idx} 设置{param}失败")
+            self.cam.MV_CC_DestroyHandle()
+            raise RuntimeError(f"Camera {self.cam_idx} 连接失败")
+        self.is_opened = True
+
+    def setup(self, profiles):
+        """
+        按序列号配置相机参数（见 camera_profile.py），再准备缓存池与取流；多台相机可在线程池中并发调用，
+        重连后再次调用即恢复配置，缓存池与转换器沿用第一次创建的
+        :param profiles:  load_profiles 的结果
+        :return:          ProfileResult，写入失败或读回不一致的参数在其中列出，不中止启动
+        """
+        self.profile_result = apply_profile(self.cam, profile_for(profiles, self.serial),
+                                            cam_idx=self.cam_idx, serial=self.serial)
+
+        # 按 PayloadSize 预分配帧缓存池
+        if self.pool is None:
+            self.pool = FramePool.for_camera(self.cam, num_slots=POOL_SLOTS, cam_idx=self.cam_idx)
+        if self.converter is None:
+            self.converter = FrameConverter(self.cam)
+
+        if self.grab_mode == GRAB_MODE_PULL:
+            # 主动取流：不注册回调，由取流线程拷贝原始数据后调用 process_frame
+            if self.grab_thread is None:
+                self.grab_thread = GrabThread(self.cam, self._on_grabbed, cam_idx=self.cam_idx,
+                                              node_num=GRAB_NODE_NUM)
+            self.grab_thread.configure()
+        else:
+            # 注册回调
+            if self.callback is None:
+                self.callback = FrameInfoCallBack(self.image_callback)
+            if self.cam.MV_CC_RegisterImageCallBackEx(self.callback, None) != 0:
+                raise RuntimeError(f"Camera {self.cam_idx} 注册回调失败")
+        return self.profile_result
 
     def image_callback(self, pData, pFrameInfo, pUser):
-        """图像回调函数（线程安全）"""
+        """图像回调函数（SDK线程中调用）"""
         frame_info = pFrameInfo.contents
         data_ptr = cast(pData, POINTER(c_ubyte * frame_info.nFrameLen))
-        image_data = np.frombuffer(data_ptr.contents, dtype=np.uint8)
-
-        # 图像格式转换
-        if frame_info.enPixelType == 34603039:  # YUV422
-            img = image_data.reshape((frame_info.nHeight, frame_info.nWidth, -1))
-            img = cv2.cvtColor(img, cv2.COLOR_YUV2BGR_Y422)
-        elif frame_info.enPixelType == 17301505:  # RGB maybe
-            img = image_data.reshape((frame_info.nHeight, frame_info.nWidth))
-        elif frame_info.enPixelType == 17301514:  # BAYER maybe
-            img = image_data.reshape(frame_info.nHeight, frame_info.nWidth, -1)
-            img = cv2.cvtColor(img, cv2.COLOR_BAYER_GB2RGB)
-        elif frame_info.enPixelType == 35127316:  # Mono8
-            img = image_data.reshape((frame_info.nHeight, frame_info.nWidth))
-            img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
-        else:
-            print(f"不支持的像素格式: 0x{frame_info.enPixelType:x}")
+        self.process_frame(frame_info, np.frombuffer(data_ptr.contents, dtype=np.uint8))
+
+    def _on_grabbed(self, raw_slot, frame_info):
+        """取流线程交来的帧，原始数据已拷贝到 raw_slot，SDK缓冲区已归还"""
+        self.process_frame(frame_info, raw_slot.buffer[:frame_info.nFrameLen])
+
+    def process_frame(self, frame_info, image_data):
+        """转换、显示与写盘（线程安全）"""
+        if self.first_frame_at is None:
+            self.first_frame_at = time.monotonic()
+        h, w = frame_info.nHeight, frame_info.nWidth
+
+        # 从缓存池取槽位，池耗尽说明下游处理不过来，直接丢弃该帧
+        slot = self.pool.acquire()
+        if slot is None:
+            return
+
+        # 图像格式转换：结果直接写入槽位，SDK数据只拷贝这一次
+        img = self.converter.convert(frame_info.enPixelType, image_data, h, w, slot.view((h, w, 3)))
+        if img is None:
+            slot.release()
+            print(f"不支持的像素格式: {pixel_format_name(frame_info.enPixelType)}")
             return
+        slot.frame_num = frame_info.nFrameNum
+        slot.pixel_type = frame_info.enPixelType
+        slot.timestamp = self.aggregator.frame_timestamp(frame_info)
+
+        # 回调自身的引用交给聚合器，按触发分组后再显示与写盘
+        self.aggregator.add(self.cam_idx, slot, frame_info)
 
-        # 存储到固定位置并更新UI
+    def deliver(self, slot, trigger_no, frame_no):
+        """显示并保存同步分组后的一帧，接管 slot 的一个引用"""
+        # 按连拍序号存储到固定位置并更新UI（槽位按引用传递，各下游用完后释放）
+        pos = (frame_no - 1) % BURST_FRAMES
         with self.lock:
-            pos = self.current_pos
-            self.recent_images[pos] = img.copy()
-            self.current_pos = (pos + 1) % 4
+            old = self.recent_images[pos]
+            self.recent_images[pos] = slot.retain()
+            if old is not None:
+                old.release()
 
             # 发射信号更新UI（主线程安全）
-            self.signals.update_image.emit(self.cam_idx, pos, img.copy())
+            self.signals.update_image.emit(self.cam_idx, pos, slot.retain())
 
         # 保存文件
         now = datetime.datetime.now()
         timestamp = now.strftime("%m%d_%H%M%S_") + f"{now.microsecond:06d}"[:2]
-        trigger_no = (self.frame_counter - 1) // 4
-        frame_no = (self.frame_counter + 1) % 4 + 1
         filename = os.path.join(SAVE_PATH, f"type_cam{self.cam_idx}_{timestamp}_fn{frame_no}_tn{trigger_no}.bmp")
-        cv2.imwrite(filename, img)
-        self.frame_counter += 1
-        self.signals.update_filename.emit(os.path.basename(filename))
-        self.signals.update_trigger_no.emit(trigger_no)  # 发射更新trigger_no的信号
+        meta = {"cam_idx": self.cam_idx, "trigger_no": trigger_no, "frame_no": frame_no,
+                "frame_num": slot.frame_num, "device_ts": slot.timestamp, "pixel_type": slot.pixel_type}
+        self.writer.submit(filename, slot.image, on_done=slot.release, meta=meta)  # 交给写盘线程
+        container = self.writer.container
+        if container is not None:  # 容器模式不建逐帧文件，显示容器内的帧名
+            name = f"{os.path.basename(container.path)}:{os.path.splitext(os.path.basename(filename))[0]}"
+        else:
+            name = os.path.basename(codec_filename(filename, SAVE_CODEC))
+        self.signals.update_filename.emit(name)
 
     def start_grabbing(self):
+        self.first_frame_at = None
         if self.cam.MV_CC_StartGrabbing() == 0:
             self.is_grabbing = True
+            if self.grab_thread is not None:
+                self.grab_thread.start()
             info = f"相机 {self.cam_idx} 开始采集"
             print(info)
             self.signals.update_system_info.emit(info)  # 发射更新系统信息的信号
@@ -150,25 +196,90 @@ class CameraController(QObject):
             self.signals.update_system_info.emit(error_info)  # 发射更新系统信息的信号
 
     def stop_grabbing(self):
+        if self.grab_thread is not None:
+            self.grab_thread.stop(wait=False)
         self.cam.MV_CC_StopGrabbing()
+        if self.grab_thread is not None:
+            self.grab_thread.stop()
         self.is_grabbing = False
         info = f"相机 {self.cam_idx} 停止采集"
         print(info)
         self.signals.update_system_info.emit(info)  # 发射更新系统信息的信号
 
-    def release(self):
+    def close(self):
+        """停止采集并关闭相机，忽略错误（掉线后的句柄同样需要关闭、销毁）"""
+        if not self.is_opened:
+            return
         if self.is_grabbing:
             self.stop_grabbing()
         self.cam.MV_CC_CloseDevice()
         self.cam.MV_CC_DestroyHandle()
+        self.is_opened = False
+
+    def release(self):
+        self.close()
+        with self.lock:
+            for i, slot in enumerate(self.recent_images):
+                if slot is not None:
+                    slot.release()
+                    self.recent_images[i] = None
+
+
+def device_name(dev_info):
+    """返回设备的 (型号, 序列号)"""
+    if dev_info.nTLayerType == MV_GIGE_DEVICE:
+        model_name = bytes(dev_info.SpecialInfo.stGigEInfo.chModelName).decode('utf-8').rstrip('\x00')
+        serial_number = bytes(dev_info.SpecialInfo.stGigEInfo.chSerialNumber).decode('utf-8').rstrip('\x00')
+    elif dev_info.nTLayerType == MV_USB_DEVICE:
+        model_name = bytes(dev_info.SpecialInfo.stUsb3VInfo.chModelName).decode('utf-8').rstrip('\x00')
+        serial_number = bytes(dev_info.SpecialInfo.stUsb3VInfo.chSerialNumber).decode('utf-8').rstrip('\x00')
+    else:
+        model_name = "未知型号"
+        serial_number = "未知序列号"
+    return model_name, serial_number
+
+
+def load_camera_profiles(path=PROFILE_FILE):
+    """读取相机参数配置文件，文件不存在时使用 camera_profile.DEFAULT_PROFILES"""
+    return load_profiles(path) if os.path.exists(path) else DEFAULT_PROFILES
+
+
+def deliver_group(controllers, group):
+    """把一个同步组的各相机帧交回对应的相机控制器显示、保存，组内引用随之转移"""
+    for cam_idx, slot in group.frames.items():
+        controllers[cam_idx].deliver(slot, group.trigger_no, group.frame_no)
+    group.frames = {}
 
 
 class MainWindow(QWidget):
+    trigger_no_changed = pyqtSignal(int)  # 分组回调在相机线程中发出，排队到主线程更新
+    device_event = pyqtSignal(str)  # 设备管理的打开、掉线、重连事件，排队到主线程显示
+
     def __init__(self):
         super().__init__()
+        self.container = None
+        if SAVE_MODE == "container":
+            session = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            codec = None if SAVE_CODEC == "bmp" else SAVE_CODEC  # bmp 即原始像素
+            self.container = FrameContainerWriter(os.path.join(SAVE_PATH, f"session_{session}.idfc"),
+                                                  codec=codec, codec_level=SAVE_CODEC_LEVEL)
+        self.writer = FrameWriter(max_queue=WRITER_QUEUE_SIZE, num_workers=WRITER_WORKERS,
+                                  policy=WRITER_POLICY, block_timeout=WRITER_BLOCK_TIMEOUT,
+                                  codec=SAVE_CODEC, codec_level=SAVE_CODEC_LEVEL, container=self.container)
+        self.preview = PreviewRenderer(size=PREVIEW_SIZE, fps=PREVIEW_FPS)
+        self.preview.preview_ready.connect(self.updateImage)
         self.initUI()
         self.initCameras()
 
+        # 定时刷新写盘队列状态
+        self.writer_timer = QTimer(self)
+        self.writer_timer.timeout.connect(self.updateWriterStatus)
+        self.writer_timer.start(1000)
+        # 定时处理超时未集齐的同步组
+        self.group_timer = QTimer(self)
+        self.group_timer.timeout.connect(self.aggregator.poll)
+        self.group_timer.start(100)
+
     def initUI(self):
         self.setWindowTitle('明琪多相机触发采集')
         self.setGeometry(50, 50, 1800, 800)
@@ -187,7 +298,7 @@ class MainWindow(QWidget):
             labels = []
             for pos in range(4):
                 label = QLabel()
-                label.setFixedSize(360, 240)
+                label.setFixedSize(*PREVIEW_SIZE)
                 label.setAlignment(Qt.AlignCenter)
                 row.addWidget(label)
                 labels.append(label)
@@ -205,6 +316,8 @@ class MainWindow(QWidget):
         self.trigger_no_label.setStyleSheet("color: white;")
         # 设置触发序号标签水平居中
         self.trigger_no_label.setAlignment(Qt.AlignCenter)
+        self.writer_status_label = QLabel()  # 写盘队列深度、速率、丢帧
+        self.writer_status_label.setStyleSheet("color: white;")
         self.start_btn = QPushButton('开始采集')
         self.stop_btn = QPushButton('停止采集')
 
@@ -243,6 +356,7 @@ class MainWindow(QWidget):
         right_layout.addWidget(self.system_info)
         right_layout.addWidget(self.filenames)
         right_layout.addWidget(self.trigger_no_label)  # 添加到布局中
+        right_layout.addWidget(self.writer_status_label)
         right_layout.addWidget(self.start_btn)
         right_layout.addWidget(self.stop_btn)
 
@@ -264,44 +378,59 @@ class MainWindow(QWidget):
 
     def initCameras(self):
         MvCamera.MV_CC_Initialize()
-        device_list = MV_CC_DEVICE_INFO_LIST()
-        if MvCamera.MV_CC_EnumDevices(MV_GIGE_DEVICE | MV_USB_DEVICE, device_list) != 0:
+        self.device_event.connect(self.updateSystemInfo)
+        # 并发打开、按序列号配置各相机，掉线后自动重连并恢复配置（见 device_manager.py）
+        self.device_manager = DeviceManager(load_camera_profiles(), on_event=self.onDeviceEvent)
+        dev_infos = self.device_manager.enumerate()
+        if not dev_infos:
             print("未找到相机设备")
             raise RuntimeError("未找到相机设备")
 
-        self.controllers = []
-        for i in range(device_list.nDeviceNum):
-            dev_info = cast(device_list.pDeviceInfo[i], POINTER(MV_CC_DEVICE_INFO)).contents
-            controller = CameraController(i, dev_info)
-            # 连接信号到UI更新
-            controller.signals.update_image.connect(self.updateImage)
-            controller.signals.update_filename.connect(lambda name: self.filenames.append(name))
-            controller.signals.update_trigger_no.connect(self.updateTriggerNo)  # 连接更新trigger_no的信号
-            controller.signals.update_system_info.connect(self.updateSystemInfo)  # 连接更新系统信息的信号
-            self.controllers.append(controller)
-            # 显示相机信息
-            if dev_info.nTLayerType == MV_GIGE_DEVICE:
-                model_name = bytes(dev_info.SpecialInfo.stGigEInfo.chModelName).decode('utf-8').rstrip('\x00')
-                serial_number = bytes(dev_info.SpecialInfo.stGigEInfo.chSerialNumber).decode('utf-8').rstrip('\x00')
-            elif dev_info.nTLayerType == MV_USB_DEVICE:
-                model_name = bytes(dev_info.SpecialInfo.stUsb3VInfo.chModelName).decode('utf-8').rstrip('\x00')
-                serial_number = bytes(dev_info.SpecialInfo.stUsb3VInfo.chSerialNumber).decode('utf-8').rstrip('\x00')
-            else:
-                model_name = "未知型号"
-                serial_number = "未知序列号"
-            info_str = f"相机{i}: 型号 - {model_name}, 序列号 - {serial_number}"
-            self.camera_info.append(info_str)
-
-    def updateImage(self, cam_idx, pos_idx, img):
-        """更新指定相机的指定位置显示"""
+        self.aggregator = FrameAggregator(len(dev_infos), self.dispatchGroup, skew_ms=GROUP_SKEW_MS,
+                                          timeout_ms=GROUP_TIMEOUT_MS, trigger_gap_ms=GROUP_TRIGGER_GAP_MS,
+                                          frame_interval_ms=GROUP_FRAME_INTERVAL_MS, burst_size=BURST_FRAMES,
+                                          time_source=GROUP_TIME_SOURCE)
+        self.trigger_no_changed.connect(self.updateTriggerNo)
+        self.controllers = self.device_manager.open_all(self.createController, dev_infos)
+
+        # 启动时测一次各像素格式的转换耗时，为所有相机选用较快的后端
+        online = [c for c in self.controllers if c.converter is not None]
+        if online:
+            first = online[0]
+            timings = first.converter.calibrate(first.pool.width, first.pool.height)
+            for c in online[1:]:
+                c.converter.backends = dict(first.converter.backends)
+            for name, timing in timings.items():
+                print(f"{name}: " + ", ".join(f"{k} {v:.2f}ms" for k, v in timing.items()))
+
+    def createController(self, cam_idx, dev_info):
+        """创建相机控制器并连接信号（界面线程中调用，打开与配置由 DeviceManager 并发进行）"""
+        controller = CameraController(cam_idx, dev_info, self.writer, self.aggregator)
+        # 帧交给预览线程缩放（在相机线程中直接入队），缩略图再回到界面线程显示
+        controller.signals.update_image.connect(self.preview.submit, Qt.DirectConnection)
+        controller.signals.update_filename.connect(lambda name: self.filenames.append(name))
+        controller.signals.update_system_info.connect(self.updateSystemInfo)  # 连接更新系统信息的信号
+        # 显示相机信息
+        model_name, serial_number = device_name(dev_info)
+        info_str = f"相机{cam_idx}: 型号 - {model_name}, 序列号 - {serial_number}"
+        self.camera_info.append(info_str)
+        return controller
+
+    def onDeviceEvent(self, info):
+        """设备事件（可能在工作线程中调用）"""
+        print(info)
+        self.device_event.emit(info)
+
+    def updateImage(self, cam_idx, pos_idx, q_img):
+        """更新指定相机的指定位置显示（缩略图已在预览线程中缩放好）"""
         if cam_idx >= len(self.image_grid) or pos_idx >= 4:
             return
-        label = self.image_grid[cam_idx][pos_idx]
-        h, w, _ = img.shape
-        bytes_per_line = 3 * w
-        q_img = QImage(img.data, w, h, bytes_per_line, QImage.Format_RGB888).rgbSwapped()
-        pixmap = QPixmap.fromImage(q_img).scaled(label.width(), label.height(), Qt.KeepAspectRatio)
-        label.setPixmap(pixmap)
+        self.image_grid[cam_idx][pos_idx].setPixmap(QPixmap.fromImage(q_img))
+
+    def dispatchGroup(self, group):
+        """同步组回调（相机线程或分组定时器中调用）"""
+        deliver_group(self.controllers, group)
+        self.trigger_no_changed.emit(group.trigger_no)
 
     def updateTriggerNo(self, trigger_no):
         """更新trigger_no的显示"""
@@ -311,28 +440,40 @@ class MainWindow(QWidget):
         """更新系统信息框的内容"""
         self.system_info.append(info)
 
+    def updateWriterStatus(self):
+        """更新写盘队列状态"""
+        self.writer_status_label.setText(format_stats(self.writer.stats()) + "\n" +
+                                         format_group_stats(self.aggregator.stats()) + "\n" +
+                                         format_device_stats(self.device_manager.stats()))
+
     def startGrabbing(self):
-        for c in self.controllers:
-            try:
-                c.start_grabbing()
-            except Exception as e:
-                print(f"启动失败: {e}")
+        try:
+            self.device_manager.start_all()  # 离线的相机重连后自动开始采集
+        except Exception as e:
+            print(f"启动失败: {e}")
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.start_btn.setStyleSheet("background-color: green; color: white;")
 
     def stopGrabbing(self):
-        for c in self.controllers:
-            c.stop_grabbing()
+        self.device_manager.stop_all()
+        self.aggregator.flush()
+        self.updateSystemInfo(format_stats(self.writer.stats()))
+        self.updateSystemInfo(format_group_stats(self.aggregator.stats()))
+        self.updateSystemInfo(format_device_stats(self.device_manager.stats()))
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         # 恢复开始采集按钮的背景颜色为白色
         self.start_btn.setStyleSheet("background-color: white; color: black;")
 
     def closeEvent(self, event):
-        for c in self.controllers:
-            c.release()
+        self.device_manager.close()
         MvCamera.MV_CC_Finalize()
+        self.aggregator.flush()
+        self.preview.close()
+        self.writer.close()
+        if self.container is not None:
+            self.container.close()
         event.accept()
 
 
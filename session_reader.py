@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+采集会话读取
+
+BMP 的像素本来就是未压缩的，cv2.imread 仍然要整幅拷贝一次。这里直接 mmap BMP 文件，
+解析文件头后在映射上构造 NumPy 视图（自底向上存储的 BMP 用负步长视图翻转），不解码、不拷贝；
+其他格式（PNG 等）和会话容器（.idfc，见 frame_container）同样通过 SessionReader 按序号随机访问。
+
+    reader = SessionReader("./multi_cam_photos")     # 目录、容器文件或路径列表
+    img = reader[0]                                    # 只读视图，需要修改时请 copy
+    for i, name, img in reader.prefetch():             # 后台预读后续帧，按磁盘速度顺序读取整个会话
+        ...
+
+最近访问的帧保存在 LRU 缓存中；mmap 视图本身很便宜，缓存主要省去 PNG 等格式的重复解码。
+"""
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+IMAGE_EXTENSIONS = (".bmp", ".dib", ".png", ".tif", ".tiff", ".webp", ".jpg", ".jpeg")
+CONTAINER_EXTENSION = ".idfc"
+
+BMP_FILE_HEADER = struct.Struct("<2sIHHI")  # 'BM', 文件大小, 保留, 保留, 像素数据偏移
+BMP_INFO_HEADER = struct.Struct("<IiiHHI")  # 头大小, 宽, 高, 平面数, 位深, 压缩方式
+BI_RGB = 0
+BI_BITFIELDS = 3
+
+
+def _map_file(path):
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_bmp(path):
+    """
+    以 mmap 视图读取未压缩的 8/24/32 位 BMP，返回 (h, w) 或 (h, w, c) 的只读数组；
+    其他 BMP（压缩、带彩色调色板的 8 位、低位深）返回 None，由调用方退回 cv2 解码
+    """
+    try:
+        buf = _map_file(path)
+    except (ValueError, OSError):  # 空文件无法 mmap，交给 cv2 报告
+        return None
+    if len(buf) < BMP_FILE_HEADER.size + BMP_INFO_HEADER.size:
+        return None
+    magic, _, _, _, data_offset = BMP_FILE_HEADER.unpack_from(buf, 0)
+    header_size, width, height, _, bpp, compression = BMP_INFO_HEADER.unpack_from(buf, BMP_FILE_HEADER.size)
+    if magic != b"BM" or header_size < 40 or bpp not in (8, 24, 32):
+        return None
+    if compression != BI_RGB and not (compression == BI_BITFIELDS and bpp == 32):
+        return None
+    if bpp == 8 and not _is_gray_palette(buf, BMP_FILE_HEADER.size + header_size):
+        return None
+
+    channels = bpp // 8
+    rows = abs(height)
+    row_stride = (width * channels + 3) & ~3  # 每行按4字节对齐
+    if data_offset + row_stride * rows > len(buf):
+        return None
+    shape = (rows, width) if channels == 1 else (rows, width, channels)
+    strides = (row_stride, 1) if channels == 1 else (row_stride, channels, 1)
+    image = np.ndarray(shape, dtype=np.uint8, buffer=buf, offset=data_offset, strides=strides)
+    image.flags.writeable = False
+    return image[::-1] if height > 0 else image  # 高度为正表示自底向上存储
+
+
+def _is_gray_palette(buf, offset):
+    """8 位 BMP 的调色板是否为 0~255 灰度（相机保存的 Mono8 图像）"""
+    palette = np.frombuffer(buf, dtype=np.uint8, count=256 * 4, offset=offset).reshape(256, 4)
+    ramp = np.arange(256, dtype=np.uint8)
+    return bool((palette[:, 0] == ramp).all() and (palette[:, 1] == ramp).all() and (palette[:, 2] == ramp).all())
+
+
+def read_image(path):
+    """读取一幅图像：BMP 走 mmap 视图，其余格式用 cv2 解码"""
+    if path.lower().endswith((".bmp", ".dib")):
+        image = read_bmp(path)
+        if image is not None:
+            return image
+    import cv2
+    return cv2.imread(path, cv2.IMREAD_UNCHANGED)
+
+
+def _willneed(path):
+    """提示内核预读整个文件（预读线程中调用，读取时不再等待磁盘）"""
+    try:
+        with open(path, "rb") as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            else:
+                while f.read(1 << 20):
+                    pass
+    except OSError:
+        pass
+
+
+class SessionReader:
+    def __init__(self, source, cache_size=32, prefetch=8, workers=2):
+        """
+        :param source:      图像目录（按文件名排序）、会话容器 .idfc 文件，或图像路径列表
+        :param cache_size:  LRU 缓存的帧数
+        :param prefetch:    prefetch() 预读的帧数
+        :param workers:     预读线程数
+        """
+        self.container = None
+        if isinstance(source, (list, tuple)):
+            self.paths = list(source)
+        elif os.path.isdir(source):
+            with os.scandir(source) as it:
+                self.paths = sorted(entry.path for entry in it
+                                    if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS))
+        elif source.lower().endswith(CONTAINER_EXTENSION):
+            from frame_container import FrameContainer
+            self.container = FrameContainer(source)
+            self.paths = None
+        else:
+            self.paths = [source]
+        self.cache_size = cache_size
+        self.prefetch_depth = prefetch
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="SessionPrefetch")
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.container) if self.container is not None else len(self.paths)
+
+    def name(self, i):
+        """帧名（不含扩展名）"""
+        if self.container is not None:
+            return self.container.name(i)
+        return os.path.splitext(os.path.basename(self.paths[i]))[0]
+
+    def path(self, i):
+        """图像文件路径，容器中的帧返回 None"""
+        return None if self.container is not None else self.paths[i]
+
+    def meta(self, i):
+        """容器中帧的帧头信息；图像文件只有名称"""
+        if self.container is not None:
+            return self.container.meta(i)
+        return {"name": self.name(i), "path": self.paths[i]}
+
+    def _load(self, i):
+        if self.container is not None:
+            return self.container.frame(i)
+        return read_image(self.paths[i])
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        with self._lock:
+            image = self._cache.get(i)
+            if image is not None:
+                self._cache.move_to_end(i)
+                self.hits += 1
+                return image
+            self.misses += 1
+        image = self._load(i)
+        if image is not None:
+            with self._lock:
+                self._cache[i] = image
+                self._cache.move_to_end(i)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return image
+
+    def _prefetch_one(self, i):
+        if self.container is None:
+            _willneed(self.paths[i])
+        return self[i]
+
+    def prefetch(self, indices=None, depth=None):
+        """
+        按顺序遍历，后台线程提前读取后续 depth 帧
+        :return:  生成器，产生 (序号, 帧名, 图像)
+        """
+        indices = range(len(self)) if indices is None else list(indices)
+        depth = depth or self.prefetch_depth
+        pending = deque()
+        it = iter(indices)
+        for i in it:
+            pending.append((i, self._executor.submit(self._prefetch_one, i)))
+            if len(pending) >= depth:
+                break
+        while pending:
+            i, future = pending.popleft()
+            nxt = next(it, None)
+            if nxt is not None:
+                pending.append((nxt, self._executor.submit(self._prefetch_one, nxt)))
+            yield i, self.name(i), future.result()
+
+    def __iter__(self):
+        for _, _, image in self.prefetch():
+            yield image
+
+    def stats(self):
+        with self._lock:
+            return {"frames": len(self), "cached": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._cache.clear()
+        if self.container is not None:
+            self.container.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    # 对比 cv2.imread 与 mmap 读取整个会话的耗时：python session_reader.py <目录或.idfc>
+    import sys
+    import time
+
+    import cv2
+
+    if len(sys.argv) < 2:
+        print("用法: python session_reader.py <目录或.idfc>")
+        sys.exit(1)
+    with SessionReader(sys.argv[1]) as reader:
+        start = time.perf_counter()
+        checksum = 0
+        for _, _, img in reader.prefetch():
+            checksum += int(img[0, 0].sum()) if img is not None else 0
+        elapsed = time.perf_counter() - start
+        print(f"SessionReader: {len(reader)} 帧, {len(reader) / elapsed:.1f} 帧/秒")
+        if reader.paths:
+            start = time.perf_counter()
+            for path in reader.paths:
+                cv2.imread(path)
+            elapsed = time.perf_counter() - start
+            print(f"cv2.imread:    {len(reader.paths)} 帧, {len(reader.paths) / elapsed:.1f} 帧/秒")
@@ -9,19 +9,30 @@ from ctypes import *
 from threading import Lock
 sys.path.append("./MvImport")
 from MvImport.MvCameraControl_class import *
+from frame_pool import FramePool
+from frame_writer import FrameWriter, codec_filename
+from pixel_convert import FrameConverter, pixel_format_name
 
 # 图像保存路径
 SAVE_PATH = "./photo/"
 os.makedirs(SAVE_PATH, exist_ok=True)
+# 存储编码（无损）：bmp / png / webp / tiff_lzw / tiff_deflate / tiff_zstd，编码在写盘线程中完成
+SAVE_CODEC = "bmp"
+SAVE_CODEC_LEVEL = None
+WRITER_QUEUE_SIZE = 16
 
 # 全局变量线程安全控制
 icount_lock = Lock()
 icount_1 = 1
+# 帧缓存池，打开相机后按 PayloadSize 分配
+frame_pool = None
+frame_converter = FrameConverter()
+frame_writer = FrameWriter(max_queue=WRITER_QUEUE_SIZE, codec=SAVE_CODEC, codec_level=SAVE_CODEC_LEVEL)
 
 # ----------------------------------------------
 # 回调函数实现图像捕获和保存
 # ----------------------------------------------
-FrameInfoCallBack = CFUNCTYPE(None, POINTER(c_ubyte), POINTER(MV_FRAME_OUT_INFO_EX), c_void_p)
+FrameInfoCallBack = MV_CALLBACK_FUNCTYPE(None, POINTER(c_ubyte), POINTER(MV_FRAME_OUT_INFO_EX), c_void_p)
 
 
 def image_callback(pData, pFrameInfo, pUser):
@@ -31,19 +42,18 @@ def image_callback(pData, pFrameInfo, pUser):
     # 转换图像数据
     data_ptr = cast(pData, POINTER(c_ubyte * frame_info.nFrameLen))
     image_data = np.frombuffer(data_ptr.contents, dtype=np.uint8)
+    h, w = frame_info.nHeight, frame_info.nWidth
 
-    # 根据像素格式处理图像
-    # import pdb;pdb.set_trace()
-    if frame_info.enPixelType == 34603039:  # YUV422
-        img = image_data.reshape((frame_info.nHeight, frame_info.nWidth, -1))
-        img = cv2.cvtColor(img, cv2.COLOR_YUV2BGR_Y422)
-    elif frame_info.enPixelType == 0x01080001:  # Mono8
-        img = image_data.reshape((frame_info.nHeight, frame_info.nWidth))
-        img = cv2.cvtColor(img, cv2.COLOR_BAYER_RG2RGB)
-    elif frame_info.enPixelType == 0x02180014:  # RGB8
-        img = image_data.reshape((frame_info.nHeight, frame_info.nWidth, 3))
-    else:
-        print(f"不支持的像素格式: 0x{frame_info.enPixelType:x}")
+    slot = frame_pool.acquire()
+    if slot is None:
+        print("帧缓存池已满，丢弃该帧")
+        return
+
+    # 根据像素格式处理图像，结果直接写入缓存槽位
+    img = frame_converter.convert(frame_info.enPixelType, image_data, h, w, slot.view((h, w, 3)))
+    if img is None:
+        slot.release()
+        print(f"不支持的像素格式: {pixel_format_name(frame_info.enPixelType)}")
         return
 
     # 生成唯一文件名
@@ -57,8 +67,8 @@ def image_callback(pData, pFrameInfo, pUser):
         filename = os.path.join(SAVE_PATH, f"hw_trigger_{formatted_time}_{ms:04d}_{icount_1:04d}.bmp")
         icount_1 += 1
 
-    cv2.imwrite(filename, img)
-    print(f"已保存图像: {filename}")
+    frame_writer.submit(filename, img, on_done=slot.release)  # 交给写盘线程编码
+    print(f"已保存图像: {codec_filename(filename, SAVE_CODEC)}")
 
 
 # ----------------------------------------------
@@ -104,6 +114,10 @@ def main():
         cam.MV_CC_SetFloatValue("ExposureTime", float(10000))
         cam.MV_CC_SetFloatValue("Gain", float(5))
 
+        # 写盘完成后归还槽位，槽位数需覆盖写盘队列
+        global frame_pool
+        frame_pool = FramePool.for_camera(cam, num_slots=WRITER_QUEUE_SIZE + 2)
+
         # ----------------------------------------
         # 注册回调并开始采集
         # ----------------------------------------
@@ -132,6 +146,7 @@ def main():
             cam.MV_CC_StopGrabbing()
             cam.MV_CC_CloseDevice()
             cam.MV_CC_DestroyHandle()
+        frame_writer.close()
         MvCamera.MV_CC_Finalize()
 
 